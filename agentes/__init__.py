@@ -0,0 +1 @@
+# Ambiente vetorizado para treinar e avaliar pilotos automáticos
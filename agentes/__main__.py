@@ -0,0 +1,51 @@
+"""
+Mede a vazão do ambiente vetorizado com um agente de ações aleatórias
+
+Uso:
+    python -m agentes                               # 64 partidas, 1 processo
+    python -m agentes --jogos 256 --processos 4     # Partidas divididas em 4 processos
+"""
+import os
+
+# Sem janela e sem áudio (precisa vir antes de importar o pygame)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import time
+import numpy as np
+from agentes.ambiente import AmbienteVetorizado
+from utils.replay import TECLAS
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m agentes', description="Vazão do ambiente vetorizado")
+    parser.add_argument('--jogos', type=int, default=64, help="Partidas avançadas em conjunto")
+    parser.add_argument('--processos', type=int, default=1, help="Processos (1 = sem pool)")
+    parser.add_argument('--passos', type=int, default=500, help="Ações por partida")
+    parser.add_argument('--passos-por-acao', type=int, default=4, help="Ticks simulados por ação")
+    parser.add_argument('--semente', type=int, default=1)
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.semente)
+    with AmbienteVetorizado(args.jogos, args.semente, args.processos, args.passos_por_acao) as ambiente:
+        ambiente.resetar()
+        
+        inicio = time.perf_counter()
+        total_recompensa = 0.0
+        partidas = 0
+        for _ in range(args.passos):
+            acoes = rng.random((args.jogos, len(TECLAS))) < 0.5
+            _, recompensas, terminados = ambiente.passo(acoes)
+            total_recompensa += float(recompensas.sum())
+            partidas += int(terminados.sum())
+        decorrido = time.perf_counter() - inicio
+    
+    acoes_por_segundo = args.jogos * args.passos / decorrido
+    print(f"{args.jogos} partidas x {args.passos} ações em {decorrido:.2f} s com {args.processos} processo(s)")
+    print(f"{acoes_por_segundo:.0f} ações/s ({acoes_por_segundo * args.passos_por_acao:.0f} ticks/s)")
+    print(f"Pontos: {total_recompensa:.0f}, partidas encerradas: {partidas}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+"""
+Ambiente vetorizado: N partidas independentes avançadas em conjunto
+
+Cada partida é uma GameSimulation sem janela. As ações chegam como um
+array (N, 4) com as colunas na ordem de TECLAS ('esquerda', 'direita',
+'cima', 'espaco'), as mesmas teclas que controlam Ship.rotacionar,
+Ship.acelerar e Ship.shoot no jogo. Observações, recompensas e fins de
+partida voltam como arrays NumPy, com uma linha por partida.
+"""
+import multiprocessing
+import random
+import numpy as np
+from classes.game_simulation import GameSimulation, DT_FIXO
+from utils.replay import TECLAS
+
+
+NUM_VIZINHOS = 8  # Asteroides mais próximos incluídos na observação
+
+# Escalas de normalização das observações
+VEL_REFERENCIA = 400.0  # px/s
+RAIO_REFERENCIA = 50.0  # px
+
+# Observação: nave (CAMPOS_NAVE) + NUM_VIZINHOS asteroides (CAMPOS_ASTEROIDE cada)
+CAMPOS_NAVE = 9  # x, y, vel x, vel y, sen e cos do ângulo, pode atirar, viva, vidas
+CAMPOS_ASTEROIDE = 5  # dx, dy, vel x, vel y, raio (zeros quando não há asteroide)
+
+
+def tamanho_observacao(num_vizinhos=NUM_VIZINHOS):
+    """Número de valores na observação de uma partida"""
+    return CAMPOS_NAVE + CAMPOS_ASTEROIDE * num_vizinhos
+
+
+def observar(sim, saida, num_vizinhos=NUM_VIZINHOS):
+    """
+    Escreve a observação de uma partida
+    
+    Posições são divididas pela largura do campo (a mesma escala nos dois
+    eixos) e os asteroides vêm do mais próximo para o mais distante, com
+    dx, dy medidos pelo caminho mais curto (o campo dá a volta nas bordas).
+    
+    Args:
+        sim: GameSimulation
+        saida: Array de tamanho_observacao(num_vizinhos) valores (sobrescrito)
+        num_vizinhos: Número de asteroides incluídos
+    """
+    nave = sim.nave
+    escala = 1.0 / sim.largura
+    angulo = np.radians(nave.angulo)
+    
+    saida[:CAMPOS_NAVE] = (
+        nave.pos.x * escala, nave.pos.y * escala,
+        nave.vel.x / VEL_REFERENCIA, nave.vel.y / VEL_REFERENCIA,
+        np.sin(angulo), np.cos(angulo),
+        nave.pode_atirar, nave.viva, sim.vidas / 3.0
+    )
+    saida[CAMPOS_NAVE:] = 0.0
+    
+    if not sim.asteroides:
+        return
+    
+    dados = np.array([(asteroide.pos.x, asteroide.pos.y, asteroide.vel.x, asteroide.vel.y, asteroide.raio_colisao)
+                      for asteroide in sim.asteroides])
+    dados[:, 0] -= nave.pos.x
+    dados[:, 1] -= nave.pos.y
+    
+    # Imagem mínima: do outro lado da borda o asteroide pode estar mais perto
+    dados[:, 0] -= sim.largura * np.round(dados[:, 0] / sim.largura)
+    dados[:, 1] -= sim.altura * np.round(dados[:, 1] / sim.altura)
+    
+    distancias = dados[:, 0] ** 2 + dados[:, 1] ** 2
+    proximos = np.argsort(distancias, kind='stable')[:num_vizinhos]
+    dados = dados[proximos]
+    dados[:, :2] *= escala
+    dados[:, 2:4] /= VEL_REFERENCIA
+    dados[:, 4] /= RAIO_REFERENCIA
+    
+    saida[CAMPOS_NAVE:CAMPOS_NAVE + dados.size] = dados.ravel()
+
+
+def _trabalhador(conexao, num_jogos, semente, opcoes):
+    """Processo do pool: mantém um pedaço das partidas e responde aos comandos"""
+    ambiente = AmbienteVetorizado(num_jogos, semente, **opcoes)
+    try:
+        while True:
+            comando, dados = conexao.recv()
+            if comando == 'passo':
+                conexao.send(ambiente.passo(dados))
+            elif comando == 'resetar':
+                conexao.send(ambiente.resetar())
+            else:  # 'fechar'
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass  # Processo principal terminou
+    finally:
+        conexao.close()
+
+
+class AmbienteVetorizado:
+    def __init__(self, num_jogos, semente=None, processos=1, passos_por_acao=4,
+                 num_vizinhos=NUM_VIZINHOS, max_passos=None, largura=800, altura=600):
+        """
+        Cria N partidas sem janela, avançadas em conjunto
+        
+        A partida i usa a semente `semente + i`, então o resultado é o
+        mesmo com ou sem processos. Com `processos` > 1 as partidas são
+        divididas em fatias, uma por processo, e cada passo é executado
+        em paralelo.
+        
+        Args:
+            num_jogos: Número de partidas (N)
+            semente: Semente da primeira partida (None = sorteada)
+            processos: Número de processos (1 = tudo no processo atual)
+            passos_por_acao: Ticks de DT_FIXO simulados com cada ação
+            num_vizinhos: Asteroides mais próximos na observação
+            max_passos: Ações por partida antes de encerrá-la (None = sem limite)
+            largura: Largura do campo de jogo
+            altura: Altura do campo de jogo
+        """
+        if semente is None:
+            semente = random.randrange(2 ** 32)
+        
+        self.num_jogos = num_jogos
+        self.semente = semente
+        self.tamanho_observacao = tamanho_observacao(num_vizinhos)
+        
+        opcoes = {
+            'passos_por_acao': passos_por_acao,
+            'num_vizinhos': num_vizinhos,
+            'max_passos': max_passos,
+            'largura': largura,
+            'altura': altura,
+        }
+        
+        self.jogos = []
+        self.conexoes = []
+        self.processos = []
+        self.fatias = []
+        
+        if processos > 1 and num_jogos > 1:
+            self._iniciar_processos(min(processos, num_jogos), opcoes)
+            return
+        
+        self.passos_por_acao = passos_por_acao
+        self.num_vizinhos = num_vizinhos
+        self.max_passos = max_passos
+        self.passos = np.zeros(num_jogos, dtype=np.int64)  # Ações na partida atual
+        
+        for indice in range(num_jogos):
+            sim = GameSimulation(largura, altura, semente + indice)
+            sim.particulas.limite = 0  # Sem efeitos visuais: ninguém vai vê-los
+            self.jogos.append(sim)
+    
+    def _iniciar_processos(self, processos, opcoes):
+        """Divide as partidas em fatias e inicia um processo por fatia"""
+        # 'spawn': cada processo importa o jogo do zero (sem herdar estado do SDL)
+        contexto = multiprocessing.get_context('spawn')
+        limites = np.linspace(0, self.num_jogos, processos + 1).astype(int).tolist()
+        
+        for inicio, fim in zip(limites[:-1], limites[1:]):
+            local, remota = contexto.Pipe()
+            processo = contexto.Process(target=_trabalhador, args=(remota, fim - inicio, self.semente + inicio, opcoes),
+                                        daemon=True)
+            processo.start()
+            remota.close()
+            self.conexoes.append(local)
+            self.processos.append(processo)
+            self.fatias.append((inicio, fim))
+    
+    def resetar(self):
+        """
+        Reinicia todas as partidas
+        
+        Returns:
+            np.ndarray: Observações (N, tamanho_observacao), float32
+        """
+        if self.conexoes:
+            for conexao in self.conexoes:
+                conexao.send(('resetar', None))
+            return np.concatenate([conexao.recv() for conexao in self.conexoes])
+        
+        observacoes = np.zeros((self.num_jogos, self.tamanho_observacao), dtype=np.float32)
+        for indice, sim in enumerate(self.jogos):
+            sim.resetar()
+            observar(sim, observacoes[indice], self.num_vizinhos)
+        self.passos[:] = 0
+        return observacoes
+    
+    def passo(self, acoes):
+        """
+        Aplica uma ação em cada partida e avança `passos_por_acao` ticks
+        
+        Partidas que terminam (game over ou max_passos) são reiniciadas na
+        hora; a observação devolvida já é a da partida nova.
+        
+        Args:
+            acoes: Array (N, 4) de bool/0-1, colunas na ordem de TECLAS
+        
+        Returns:
+            tuple: (observacoes (N, tamanho_observacao) float32,
+                recompensas (N,) float32 - pontos ganhos no passo,
+                terminados (N,) bool)
+        """
+        acoes = np.asarray(acoes, dtype=bool)
+        if acoes.shape != (self.num_jogos, len(TECLAS)):
+            raise ValueError(f"acoes deve ter formato ({self.num_jogos}, {len(TECLAS)}), recebido {acoes.shape}")
+        
+        if self.conexoes:
+            for conexao, (inicio, fim) in zip(self.conexoes, self.fatias):
+                conexao.send(('passo', acoes[inicio:fim]))
+            resultados = [conexao.recv() for conexao in self.conexoes]
+            return tuple(np.concatenate(partes) for partes in zip(*resultados))
+        
+        observacoes = np.zeros((self.num_jogos, self.tamanho_observacao), dtype=np.float32)
+        recompensas = np.zeros(self.num_jogos, dtype=np.float32)
+        terminados = np.zeros(self.num_jogos, dtype=bool)
+        
+        for indice, (sim, acao) in enumerate(zip(self.jogos, acoes.tolist())):
+            entradas = dict(zip(TECLAS, acao))
+            pontos = sim.pontos
+            for _ in range(self.passos_por_acao):
+                sim.step(entradas, DT_FIXO)
+                if sim.estado_jogo == 'game_over':
+                    break
+            
+            # Pontos dados pelos asteroides destruídos nas colisões do passo
+            recompensas[indice] = sim.pontos - pontos
+            
+            self.passos[indice] += 1
+            if sim.estado_jogo == 'game_over' or (self.max_passos and self.passos[indice] >= self.max_passos):
+                terminados[indice] = True
+                sim.resetar()
+                self.passos[indice] = 0
+            
+            observar(sim, observacoes[indice], self.num_vizinhos)
+        
+        return observacoes, recompensas, terminados
+    
+    def fechar(self):
+        """Encerra os processos (se houver)"""
+        for conexao in self.conexoes:
+            try:
+                conexao.send(('fechar', None))
+            except (BrokenPipeError, OSError):
+                pass
+            conexao.close()
+        for processo in self.processos:
+            processo.join(timeout=5)
+        self.conexoes = []
+        self.processos = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excecao):
+        self.fechar()
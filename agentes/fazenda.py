@@ -0,0 +1,288 @@
+"""
+Fazenda de simulações: milhares de partidas com pilotos scriptados para
+avaliar a curva de dificuldade
+
+Uso:
+    python -m agentes.fazenda                                        # 1.000 partidas por piloto
+    python -m agentes.fazenda --partidas 10000 --pilotos medio
+    python -m agentes.fazenda --curva pontos_por_nivel=400,aumento_velocidade=0.2 --saida curva_b.json
+    python -m agentes.fazenda --dt 0.0333                            # Rascunho rápido (30 Hz, menos fiel)
+"""
+import os
+
+# Sem janela e sem áudio (precisa vir antes de importar o pygame)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # Um aviso por processo do pool
+
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+import time
+import numpy as np
+from classes.game_simulation import GameSimulation, CURVA_DIFICULDADE, DT_FIXO
+from agentes.pilotos import PilotoScriptado, PERFIS_PILOTO
+
+
+# O passo do jogo: a colisão da nave é discreta, então passos maiores mudam a
+# sobrevivência (--dt maior troca essa precisão por velocidade)
+DT_FAZENDA = DT_FIXO
+DURACAO_MAXIMA = 300.0  # Segundos de jogo por partida (partidas mais longas contam como sobrevivência)
+MAX_ASTEROIDES_HISTOGRAMA = 63  # Última faixa do histograma de densidade: "63 ou mais"
+PARTIDAS_POR_LOTE = 20  # Partidas enviadas de uma vez a cada processo
+
+PERCENTIS = (10, 25, 50, 75, 90)
+
+
+def jogar_partida(semente, perfil, curva, dt=DT_FAZENDA, duracao_maxima=DURACAO_MAXIMA):
+    """
+    Joga uma partida inteira com um piloto scriptado
+    
+    Args:
+        semente: Semente da partida (também usada pelo piloto)
+        perfil: Nome do perfil em PERFIS_PILOTO
+        curva: dict com valores de CURVA_DIFICULDADE a substituir
+        dt: Passo da simulação em segundos
+        duracao_maxima: Segundos de jogo antes de encerrar a partida
+    
+    Returns:
+        dict: 'sobrevivencia' (s), 'pontos', 'nivel', 'morreu', e por nível
+            (listas indexadas por nível - 1): 'tempo_nivel', 'pontos_nivel',
+            'asteroides_nivel' (soma de asteroides por tick) e
+            'ticks_nivel'; 'histograma' com os ticks por número de asteroides
+    """
+    sim = GameSimulation(800, 600, semente, curva)
+    sim.particulas.limite = 0  # Sem efeitos visuais
+    piloto = PilotoScriptado(rng=random.Random(semente), **PERFIS_PILOTO[perfil])
+    
+    tempo_nivel = []
+    pontos_nivel = []
+    asteroides_nivel = []
+    ticks_nivel = []
+    histograma = [0] * (MAX_ASTEROIDES_HISTOGRAMA + 1)
+    
+    while sim.estado_jogo == 'jogando' and sim.tempo_jogo < duracao_maxima:
+        nivel = sim.nivel
+        while len(tempo_nivel) < nivel:
+            for lista in (tempo_nivel, pontos_nivel, asteroides_nivel, ticks_nivel):
+                lista.append(0)
+        
+        pontos = sim.pontos
+        sim.step(piloto.decidir(sim, dt), dt)
+        
+        num_asteroides = len(sim.asteroides)
+        tempo_nivel[nivel - 1] += dt
+        pontos_nivel[nivel - 1] += sim.pontos - pontos
+        asteroides_nivel[nivel - 1] += num_asteroides
+        ticks_nivel[nivel - 1] += 1
+        histograma[min(num_asteroides, MAX_ASTEROIDES_HISTOGRAMA)] += 1
+    
+    return {
+        'sobrevivencia': sim.tempo_jogo,
+        'pontos': sim.pontos,
+        'nivel': sim.nivel,
+        'morreu': sim.estado_jogo == 'game_over',
+        'tempo_nivel': tempo_nivel,
+        'pontos_nivel': pontos_nivel,
+        'asteroides_nivel': asteroides_nivel,
+        'ticks_nivel': ticks_nivel,
+        'histograma': histograma,
+    }
+
+
+def _jogar_lote(lote):
+    """Executa um lote de partidas em um processo do pool"""
+    perfil, sementes, curva, dt, duracao_maxima = lote
+    return perfil, [jogar_partida(semente, perfil, curva, dt, duracao_maxima) for semente in sementes]
+
+
+def _resumir(valores):
+    """Média e percentis de uma amostra (None se vazia)"""
+    if len(valores) == 0:
+        return None
+    valores = np.asarray(valores, dtype=np.float64)
+    resumo = {'media': round(float(valores.mean()), 2)}
+    for percentil, valor in zip(PERCENTIS, np.percentile(valores, PERCENTIS).tolist()):
+        resumo[f'p{percentil}'] = round(valor, 2)
+    return resumo
+
+
+def _empilhar(partidas, chave, largura):
+    """Listas por nível de todas as partidas em uma matriz (partidas x níveis), completando com zeros"""
+    matriz = np.zeros((len(partidas), largura))
+    for linha, partida in enumerate(partidas):
+        valores = partida[chave]
+        matriz[linha, :len(valores)] = valores
+    return matriz
+
+
+def agregar(partidas):
+    """
+    Reduz as partidas de um piloto a distribuições
+    
+    Args:
+        partidas: Lista de dicts de jogar_partida
+    
+    Returns:
+        dict: Sobrevivência, pontos, nível final, estatísticas por nível e
+            histograma de densidade de asteroides (fração do tempo de jogo)
+    """
+    sobrevivencia = [partida['sobrevivencia'] for partida in partidas]
+    niveis_finais = np.array([partida['nivel'] for partida in partidas])
+    num_niveis = int(niveis_finais.max())
+    
+    tempo = _empilhar(partidas, 'tempo_nivel', num_niveis)
+    pontos = _empilhar(partidas, 'pontos_nivel', num_niveis)
+    asteroides = _empilhar(partidas, 'asteroides_nivel', num_niveis)
+    ticks = _empilhar(partidas, 'ticks_nivel', num_niveis)
+    
+    niveis = []
+    for indice in range(num_niveis):
+        nivel = indice + 1
+        alcancaram = niveis_finais >= nivel
+        completaram = niveis_finais > nivel  # Tempo no nível só conta se a partida passou dele
+        tempo_total = tempo[:, indice].sum()
+        ticks_total = ticks[:, indice].sum()
+        niveis.append({
+            'nivel': nivel,
+            'alcancaram': round(float(alcancaram.mean()), 4),
+            'tempo_s': _resumir(tempo[completaram, indice]),
+            'pontos_por_segundo': round(float(pontos[:, indice].sum() / tempo_total), 2) if tempo_total else None,
+            'asteroides_medio': round(float(asteroides[:, indice].sum() / ticks_total), 2) if ticks_total else None,
+        })
+    
+    histograma = np.sum([partida['histograma'] for partida in partidas], axis=0)
+    ultimo = int(np.flatnonzero(histograma).max()) + 1 if histograma.any() else 0
+    fracoes = (histograma[:ultimo] / histograma.sum()).round(4).tolist() if ultimo else []
+    
+    return {
+        'partidas': len(partidas),
+        'sobreviveram': round(float(np.mean([not partida['morreu'] for partida in partidas])), 4),
+        'sobrevivencia_s': _resumir(sobrevivencia),
+        'pontos': _resumir([partida['pontos'] for partida in partidas]),
+        'nivel_final': {str(nivel): round(float(np.mean(niveis_finais == nivel)), 4)
+                        for nivel in np.unique(niveis_finais).tolist()},
+        'niveis': niveis,
+        'densidade_asteroides': fracoes,
+    }
+
+
+def executar_fazenda(partidas, pilotos, curva, processos, semente=1, dt=DT_FAZENDA,
+                     duracao_maxima=DURACAO_MAXIMA):
+    """
+    Joga `partidas` partidas com cada piloto, divididas entre processos
+    
+    A partida i de todos os pilotos usa a semente `semente + i`: os pilotos
+    enfrentam as mesmas sequências de asteroides.
+    
+    Args:
+        partidas: Partidas por piloto
+        pilotos: Lista de nomes de PERFIS_PILOTO
+        curva: dict com valores de CURVA_DIFICULDADE a substituir
+        processos: Número de processos (1 = sem pool)
+        semente: Semente da primeira partida
+        dt: Passo da simulação em segundos
+        duracao_maxima: Segundos de jogo por partida
+    
+    Returns:
+        dict: Parâmetros usados e resultados agregados por piloto
+    """
+    lotes = []
+    for perfil in pilotos:
+        for inicio in range(0, partidas, PARTIDAS_POR_LOTE):
+            sementes = range(semente + inicio, semente + min(partidas, inicio + PARTIDAS_POR_LOTE))
+            lotes.append((perfil, list(sementes), curva, dt, duracao_maxima))
+    
+    resultados = {perfil: [] for perfil in pilotos}
+    inicio = time.perf_counter()
+    
+    def coletar(respostas):
+        for concluidos, (perfil, lote) in enumerate(respostas, 1):
+            resultados[perfil].extend(lote)
+            if concluidos % 10 == 0 or concluidos == len(lotes):
+                print(f"  {concluidos}/{len(lotes)} lotes ({time.perf_counter() - inicio:.0f} s)", file=sys.stderr)
+    
+    if processos > 1:
+        # 'spawn': cada processo importa o jogo do zero (sem herdar estado do SDL)
+        with multiprocessing.get_context('spawn').Pool(processos) as pool:
+            coletar(pool.imap_unordered(_jogar_lote, lotes))
+    else:
+        coletar(map(_jogar_lote, lotes))
+    
+    curva_completa = dict(CURVA_DIFICULDADE)
+    curva_completa.update(curva)
+    return {
+        'parametros': {
+            'partidas_por_piloto': partidas,
+            'semente': semente,
+            'dt': dt,
+            'duracao_maxima': duracao_maxima,
+            'curva': curva_completa,
+            'segundos': round(time.perf_counter() - inicio, 1),
+        },
+        'pilotos': {perfil: agregar(resultados[perfil]) for perfil in pilotos},
+    }
+
+
+def ler_curva(texto):
+    """
+    Converte 'chave=valor,chave=valor' em um dict de curva
+    
+    Raises:
+        argparse.ArgumentTypeError: Se a chave não existe ou o valor não é número
+    """
+    curva = {}
+    for item in filter(None, texto.split(',')):
+        chave, _, valor = item.partition('=')
+        chave = chave.strip()
+        if chave not in CURVA_DIFICULDADE:
+            raise argparse.ArgumentTypeError(
+                f"parâmetro desconhecido '{chave}' (válidos: {', '.join(CURVA_DIFICULDADE)})")
+        try:
+            curva[chave] = int(valor)
+        except ValueError:
+            try:
+                curva[chave] = float(valor)
+            except ValueError:
+                raise argparse.ArgumentTypeError(f"valor inválido para {chave}: '{valor}'")
+    return curva
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m agentes.fazenda',
+                                     description="Simula partidas com pilotos scriptados para avaliar a curva de dificuldade")
+    parser.add_argument('--partidas', type=int, default=1000, help="Partidas por piloto")
+    parser.add_argument('--pilotos', default=','.join(PERFIS_PILOTO),
+                        help=f"Perfis separados por vírgula (padrão: {','.join(PERFIS_PILOTO)})")
+    parser.add_argument('--curva', type=ler_curva, default={},
+                        help="Parâmetros da curva a substituir, ex.: pontos_por_nivel=400,intervalo_minimo=1.0")
+    parser.add_argument('--processos', type=int, default=os.cpu_count() or 1, help="Processos do pool")
+    parser.add_argument('--semente', type=int, default=1, help="Semente da primeira partida")
+    parser.add_argument('--dt', type=float, default=DT_FAZENDA,
+                        help="Passo da simulação (s); o padrão é o do jogo, maiores são mais rápidos e menos fiéis")
+    parser.add_argument('--duracao-maxima', type=float, default=DURACAO_MAXIMA, help="Segundos de jogo por partida")
+    parser.add_argument('--saida', help="Arquivo JSON de resultados (padrão: saída padrão)")
+    args = parser.parse_args()
+    
+    pilotos = args.pilotos.split(',')
+    desconhecidos = set(pilotos) - set(PERFIS_PILOTO)
+    if desconhecidos:
+        parser.error(f"Pilotos desconhecidos: {', '.join(sorted(desconhecidos))}")
+    
+    print(f"{args.partidas} partidas x {len(pilotos)} piloto(s) em {args.processos} processo(s)", file=sys.stderr)
+    resultados = executar_fazenda(args.partidas, pilotos, args.curva, args.processos, args.semente,
+                                  args.dt, args.duracao_maxima)
+    
+    texto = json.dumps(resultados, indent=1, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto + '\n')
+        print(f"Resultados gravados em {args.saida}", file=sys.stderr)
+    else:
+        print(texto)
+
+
+if __name__ == '__main__':
+    main()
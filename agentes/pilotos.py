@@ -0,0 +1,103 @@
+"""
+Pilotos scriptados: jogam sozinhos, com habilidade ajustável
+"""
+import math
+import random
+import pygame
+from utils.replay import TECLAS
+
+
+VELOCIDADE_TIRO = 400.0  # px/s, a mesma de Ship.shoot (para mirar com antecipação)
+
+# Parâmetros de cada perfil de piloto (ver PilotoScriptado)
+PERFIS_PILOTO = {
+    'novato': {'mira': 20.0, 'reacao': 0.35, 'distancia_fuga': 50.0, 'chance_erro': 0.25},
+    'medio': {'mira': 10.0, 'reacao': 0.2, 'distancia_fuga': 80.0, 'chance_erro': 0.1},
+    'experiente': {'mira': 5.0, 'reacao': 0.1, 'distancia_fuga': 110.0, 'chance_erro': 0.02},
+}
+
+
+class PilotoScriptado:
+    def __init__(self, mira, reacao, distancia_fuga, chance_erro, rng=None):
+        """
+        Piloto que gira na direção do asteroide mais próximo e atira
+        
+        A cada `reacao` segundos o piloto escolhe o alvo e decide o que
+        fazer; entre decisões ele mantém as teclas, como um jogador humano.
+        
+        Args:
+            mira: Erro de ângulo (graus) aceito para atirar
+            reacao: Segundos entre decisões
+            distancia_fuga: Distância (px, até a borda do asteroide) abaixo da
+                qual o piloto foge, acelerando para longe
+            chance_erro: Probabilidade de uma decisão girar para o lado errado
+            rng: random.Random das decisões (None = módulo random)
+        """
+        self.mira = mira
+        self.reacao = reacao
+        self.distancia_fuga = distancia_fuga
+        self.chance_erro = chance_erro
+        self.rng = rng if rng is not None else random
+        
+        self.entradas = dict.fromkeys(TECLAS, False)
+        self.tempo_decisao = 0.0  # Segundos até a próxima decisão
+        self.tempo_giro = 0.0  # Segundos de giro que faltam na decisão atual
+    
+    def decidir(self, sim, dt):
+        """
+        Teclas pressionadas neste tick
+        
+        Args:
+            sim: GameSimulation
+            dt: Duração do tick em segundos
+        
+        Returns:
+            dict: Teclas ('esquerda', 'direita', 'cima', 'espaco') -> bool
+        """
+        entradas = self.entradas
+        
+        # Para de girar quando o giro planejado acabou
+        self.tempo_giro -= dt
+        if self.tempo_giro <= 0:
+            entradas['esquerda'] = entradas['direita'] = False
+        
+        self.tempo_decisao -= dt
+        if self.tempo_decisao > 0:
+            return entradas
+        self.tempo_decisao += self.reacao
+        
+        for tecla in TECLAS:
+            entradas[tecla] = False
+        
+        nave = sim.nave
+        if not nave.viva or not sim.asteroides:
+            return entradas
+        
+        # Alvo: asteroide com a borda mais próxima (pelo caminho mais curto, que pode passar pelas bordas)
+        pos = nave.pos
+        mundo = sim.mundo
+        alvo = min(sim.asteroides,
+                   key=lambda asteroide: math.sqrt(mundo.distancia2(pos, asteroide.pos)) - asteroide.raio_colisao)
+        relativo = pygame.math.Vector2(mundo.delta(pos.x, pos.y, alvo.pos.x, alvo.pos.y))
+        distancia = relativo.length() - alvo.raio_colisao
+        
+        # Mira com antecipação: onde o asteroide estará quando o tiro chegar
+        mira = relativo + alvo.vel * (relativo.length() / VELOCIDADE_TIRO)
+        angulo_alvo = math.degrees(math.atan2(mira.x, -mira.y))  # 0 = cima, como Ship.angulo
+        diferenca = (angulo_alvo - nave.angulo + 180) % 360 - 180
+        
+        fugindo = distancia < self.distancia_fuga
+        if fugindo:
+            # De costas para o asteroide, acelerando para longe
+            diferenca = (diferenca + 360) % 360 - 180
+            entradas['cima'] = abs(diferenca) < 45
+        
+        if self.rng.random() < self.chance_erro:
+            diferenca = -diferenca
+        
+        if abs(diferenca) > self.mira / 2:
+            entradas['direita' if diferenca > 0 else 'esquerda'] = True
+            self.tempo_giro = abs(diferenca) / nave.velocidade_rotacao
+        
+        entradas['espaco'] = not fugindo and abs(diferenca) <= self.mira
+        return entradas
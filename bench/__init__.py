@@ -0,0 +1 @@
+# Benchmark headless do jogo Asteroids 3D
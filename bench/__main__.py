@@ -0,0 +1,281 @@
+"""
+Benchmark headless do Asteroids 3D
+
+Roda os cenários de bench/cenarios.py sem janela (driver SDL dummy),
+com passo fixo, e mede o tempo de cada fase do frame (atualizações,
+colisões, cada camada de desenho, HUD). Os resultados saem em JSON e
+podem ser comparados com uma baseline salva.
+
+Uso:
+    python -m bench                              # Todos os cenários, JSON na saída padrão
+    python -m bench --cenarios padrao,game_over  # Só alguns cenários
+    python -m bench --baseline                   # Compara com bench/baseline.json
+    python -m bench --salvar-baseline            # Regrava bench/baseline.json
+
+Cenários com meta de FPS (horda_2000) medem frames inteiros e o
+benchmark termina com erro quando o frame médio passa da meta.
+"""
+import os
+
+# Sem janela e sem áudio (precisa vir antes de importar o pygame)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # O banner iria para a saída padrão, junto com o JSON
+
+import argparse
+import json
+import platform
+import sys
+import numpy as np
+import pygame
+from classes.star import Star
+from classes.starfield import CampoEstrelas
+from classes.hud import HUD
+from classes.game_simulation import GameSimulation, DT_FIXO, curva_arena, curva_horda
+from classes.game_renderer import criar_fila_render
+from utils.camera import Camera
+from utils.cores import COR_FUNDO
+from utils.passo_fixo import PassoFixo
+from utils.perfil import Perfilador
+from bench.cenarios import CENARIOS
+
+
+LARGURA = 800
+ALTURA = 600
+PROF_MIN = 0.15
+PROF_MAX = 0.75
+NUM_CAMADAS_ESTRELAS = 4
+
+ARQUIVO_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Diferenças abaixo disso (ms por tick) são ruído, mesmo que a fase seja pequena
+MINIMO_REGRESSAO_MS = 0.02
+
+
+def executar_cenario(cenario, ticks, aquecimento, semente):
+    """
+    Roda um cenário e mede o tempo de cada fase
+    
+    Args:
+        cenario: Cenario a executar
+        ticks: Número de ticks medidos
+        aquecimento: Ticks executados antes de começar a medir
+        semente: Semente dos geradores aleatórios
+    
+    Returns:
+        dict: 'ticks', 'ms_por_tick' e 'fases' (fase -> ms por tick), mais
+            'meta_ms' nos cenários com meta de FPS
+    """
+    tela = pygame.display.set_mode((LARGURA, ALTURA))
+    
+    camera = None
+    if cenario.arena:
+        curva = curva_arena(cenario.arena)
+        if cenario.horda:
+            curva.update(curva_horda(cenario.horda))
+        sim = GameSimulation(LARGURA * cenario.arena, ALTURA * cenario.arena, semente, curva,
+                             tela=(LARGURA, ALTURA))
+        camera = Camera(LARGURA, ALTURA, sim.mundo)
+    else:
+        sim = GameSimulation(LARGURA, ALTURA, semente)
+    
+    rng = sim.aleatorio.gerador('estrelas')
+    estrelas = [
+        Star(rng.randint(0, LARGURA), rng.randint(0, ALTURA), rng.uniform(PROF_MIN, PROF_MAX), LARGURA, ALTURA, rng)
+        for _ in range(cenario.num_estrelas)
+    ]
+    campo_estrelas = CampoEstrelas(estrelas, LARGURA, ALTURA, NUM_CAMADAS_ESTRELAS, PROF_MIN, PROF_MAX, rng)
+    hud = HUD(LARGURA, ALTURA)
+    
+    teclas_pressionadas = {'esquerda': False, 'direita': False, 'cima': False, 'espaco': False}
+    teclas_pressionadas.update(cenario.entradas)
+    
+    # Um passo de simulação por tick medido, desenhado com interpolação como no
+    # jogo; com meta de FPS, um frame do jogo por tick (os passos que couberem nele)
+    dt_tick = 1.0 / cenario.meta_fps if cenario.meta_fps else DT_FIXO
+    passo_fixo = PassoFixo(DT_FIXO)
+    fila_render = criar_fila_render(sim, campo_estrelas, hud, teclas_pressionadas, lambda: 60.0,
+                                    passo_fixo.atraso, camera=camera)
+    
+    perfilador = Perfilador()
+    sim.perfilador = perfilador
+    fila_render.perfilador = perfilador
+    
+    if cenario.preparar:
+        cenario.preparar(sim)
+    
+    parado = pygame.math.Vector2(0, 0)
+    for tick in range(aquecimento + ticks):
+        if tick == aquecimento:
+            perfilador.zerar()
+        
+        # Script do cenário fica fora da medição, a não ser que seja parte da carga
+        if cenario.a_cada_tick and not cenario.medir_script:
+            cenario.a_cada_tick(sim, tick)
+        
+        perfilador.iniciar_frame()
+        
+        if cenario.a_cada_tick and cenario.medir_script:
+            cenario.a_cada_tick(sim, tick)
+            perfilador.marcar('script_cenario')
+        
+        vel_paralaxe = sim.nave.vel if sim.estado_jogo == 'jogando' else parado
+        campo_estrelas.atualizar(dt_tick, vel_paralaxe)
+        perfilador.marcar('update_estrelas')
+        
+        for _ in range(passo_fixo.avancar(dt_tick)):
+            sim.step(teclas_pressionadas, DT_FIXO)
+        
+        if camera is not None:
+            camera.seguir(*sim.nave.pose(passo_fixo.atraso())[:2])
+        
+        tela.fill(COR_FUNDO)
+        perfilador.marcar('desenho_fundo')
+        fila_render.desenhar(tela)
+        pygame.display.flip()
+        perfilador.marcar('flip')
+        
+        perfilador.finalizar_frame()
+    
+    fases = perfilador.resumo()
+    resultado = {
+        'ticks': ticks,
+        'ms_por_tick': round(sum(fases.values()), 4),
+        'fases': {fase: round(ms, 4) for fase, ms in sorted(fases.items())}
+    }
+    if cenario.meta_fps:
+        resultado['meta_ms'] = round(1000.0 / cenario.meta_fps, 4)
+    return resultado
+
+
+def comparar(resultados, baseline, tolerancia):
+    """
+    Compara os resultados com a baseline
+    
+    Uma fase regrediu se ficou mais de `tolerancia` (fração) mais lenta e
+    a diferença passa de MINIMO_REGRESSAO_MS.
+    
+    Args:
+        resultados: dict retornado por executar_benchmark
+        baseline: dict no mesmo formato
+        tolerancia: Aumento relativo aceito (ex.: 0.25 = 25%)
+    
+    Returns:
+        list: (cenario, fase, ms_baseline, ms_atual) de cada regressão
+    """
+    regressoes = []
+    for nome, resultado in resultados['cenarios'].items():
+        referencia = baseline['cenarios'].get(nome)
+        if referencia is None:
+            continue
+        
+        medidas = [('ms_por_tick', referencia['ms_por_tick'], resultado['ms_por_tick'])]
+        for fase, ms in resultado['fases'].items():
+            if fase in referencia['fases']:
+                medidas.append((fase, referencia['fases'][fase], ms))
+        
+        for fase, ms_baseline, ms_atual in medidas:
+            if ms_atual > ms_baseline * (1 + tolerancia) and ms_atual - ms_baseline > MINIMO_REGRESSAO_MS:
+                regressoes.append((nome, fase, ms_baseline, ms_atual))
+    return regressoes
+
+
+def verificar_metas(resultados):
+    """
+    Cenários que estouraram a meta de desempenho
+    
+    Args:
+        resultados: dict retornado por executar_benchmark
+    
+    Returns:
+        list: (cenario, meta_ms, ms_por_tick) de cada cenário acima da meta
+    """
+    return [
+        (nome, resultado['meta_ms'], resultado['ms_por_tick'])
+        for nome, resultado in resultados['cenarios'].items()
+        if 'meta_ms' in resultado and resultado['ms_por_tick'] > resultado['meta_ms']
+    ]
+
+
+def executar_benchmark(cenarios, ticks, aquecimento, semente):
+    """
+    Roda vários cenários
+    
+    Returns:
+        dict: Metadados da máquina e resultados por cenário
+    """
+    pygame.init()
+    resultados = {
+        'ambiente': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'numpy': np.__version__,
+            'plataforma': platform.platform()
+        },
+        'ticks': ticks,
+        'semente': semente,
+        'cenarios': {}
+    }
+    for cenario in cenarios:
+        print(f"Executando {cenario.nome}: {cenario.descricao}", file=sys.stderr)
+        resultados['cenarios'][cenario.nome] = executar_cenario(cenario, ticks, aquecimento, semente)
+    pygame.quit()
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m bench', description="Benchmark headless do Asteroids 3D")
+    parser.add_argument('--cenarios', help="Nomes separados por vírgula (padrão: todos)")
+    parser.add_argument('--ticks', type=int, default=600, help="Ticks medidos por cenário")
+    parser.add_argument('--aquecimento', type=int, default=60, help="Ticks antes de começar a medir")
+    parser.add_argument('--semente', type=int, default=1)
+    parser.add_argument('--saida', help="Arquivo JSON de resultados (padrão: saída padrão)")
+    parser.add_argument('--baseline', nargs='?', const=ARQUIVO_BASELINE,
+                        help="Compara com a baseline (padrão: bench/baseline.json)")
+    parser.add_argument('--tolerancia', type=float, default=0.25, help="Piora relativa aceita")
+    parser.add_argument('--salvar-baseline', action='store_true', help="Grava os resultados como baseline")
+    args = parser.parse_args()
+    
+    cenarios = CENARIOS
+    if args.cenarios:
+        nomes = args.cenarios.split(',')
+        desconhecidos = set(nomes) - {cenario.nome for cenario in CENARIOS}
+        if desconhecidos:
+            parser.error(f"Cenários desconhecidos: {', '.join(sorted(desconhecidos))}")
+        cenarios = [cenario for cenario in CENARIOS if cenario.nome in nomes]
+    
+    resultados = executar_benchmark(cenarios, args.ticks, args.aquecimento, args.semente)
+    
+    texto = json.dumps(resultados, indent=2, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto + '\n')
+    else:
+        print(texto)
+    
+    if args.salvar_baseline:
+        with open(ARQUIVO_BASELINE, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto + '\n')
+        print(f"Baseline gravada em {ARQUIVO_BASELINE}", file=sys.stderr)
+    
+    # Metas e baseline são conferidas sempre; o código de saída reflete as duas
+    metas_estouradas = verificar_metas(resultados)
+    for nome, meta_ms, ms in metas_estouradas:
+        print(f"META ESTOURADA {nome}: {ms:.3f} ms por frame (meta {meta_ms:.3f} ms)", file=sys.stderr)
+    
+    regressoes = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as arquivo:
+            baseline = json.load(arquivo)
+        
+        regressoes = comparar(resultados, baseline, args.tolerancia)
+        for nome, fase, ms_baseline, ms_atual in regressoes:
+            print(f"REGRESSÃO {nome}/{fase}: {ms_baseline:.3f} ms -> {ms_atual:.3f} ms", file=sys.stderr)
+        if not regressoes:
+            print(f"Sem regressões (tolerância {args.tolerancia:.0%})", file=sys.stderr)
+    
+    return 1 if metas_estouradas or regressoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
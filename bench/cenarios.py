@@ -0,0 +1,148 @@
+"""
+Cenários scriptados do benchmark
+"""
+import pygame
+
+
+class Cenario:
+    def __init__(self, nome, descricao, entradas=None, num_estrelas=300, preparar=None, a_cada_tick=None,
+                 arena=None, horda=None, meta_fps=None, medir_script=False):
+        """
+        Descreve um cenário do benchmark
+        
+        Args:
+            nome: Identificador do cenário (chave no JSON de resultados)
+            descricao: Texto curto sobre o que o cenário estressa
+            entradas: dict de controles mantidos pressionados durante todo o cenário
+            num_estrelas: Número de estrelas do fundo
+            preparar: Função (sim) chamada uma vez antes do primeiro tick
+            a_cada_tick: Função (sim, tick) chamada antes de cada tick (fora da
+                medição, a não ser com medir_script)
+            arena: Lado do campo em telas, com a câmera seguindo a nave (None = uma tela)
+            horda: Limite de asteroides do modo horda (None = curva normal)
+            meta_fps: Meta de desempenho: cada tick medido vira um frame de
+                1/meta_fps s (vários passos de simulação e um desenho) e o
+                benchmark falha se o frame passar de 1000/meta_fps ms
+            medir_script: Medir a_cada_tick dentro do frame (fase
+                'script_cenario'), quando o que ele faz é parte da carga
+        """
+        self.nome = nome
+        self.descricao = descricao
+        self.entradas = entradas or {}
+        self.num_estrelas = num_estrelas
+        self.preparar = preparar
+        self.a_cada_tick = a_cada_tick
+        self.arena = arena
+        self.horda = horda
+        self.meta_fps = meta_fps
+        self.medir_script = medir_script
+
+
+def espalhar_asteroides(sim, quantidade, tamanho=None):
+    """
+    Adiciona asteroides em posições aleatórias do campo
+    
+    Args:
+        sim: GameSimulation
+        quantidade: Número de asteroides a adicionar
+        tamanho: 'grande', 'medio', 'pequeno' ou None (aleatório)
+    """
+    rng = sim.rng_spawn
+    for _ in range(quantidade):
+        x = rng.uniform(0, sim.largura)
+        y = rng.uniform(0, sim.altura)
+        tamanho_tipo = tamanho or rng.choice(['grande', 'medio', 'pequeno'])
+        sim.asteroides.append(sim.criar_asteroide(x, y, tamanho_tipo, rng=sim.rng_asteroides))
+
+
+def atingir_todos(sim):
+    """Coloca um projétil parado sobre cada asteroide vivo"""
+    parado = pygame.math.Vector2(0, 0)
+    for asteroide in list(sim.asteroides):
+        sim.criar_projetil(asteroide.pos, parado)
+
+
+def _preparar_invencivel(sim):
+    sim.invencivel = True
+
+
+def _preparar_500_asteroides(sim):
+    sim.invencivel = True
+    espalhar_asteroides(sim, 500)
+
+
+def _manter_500_asteroides(sim, tick):
+    # Repõe os asteroides destruídos pelos tiros
+    if len(sim.asteroides) < 500:
+        espalhar_asteroides(sim, 500 - len(sim.asteroides))
+
+
+def _preparar_arena(sim):
+    sim.invencivel = True
+    espalhar_asteroides(sim, 1000 - len(sim.asteroides))
+
+
+def _manter_horda(sim, tick):
+    # Repõe o que as reações em cadeia destruíram além do spawn da curva
+    if len(sim.asteroides) < 2000:
+        espalhar_asteroides(sim, 2000 - len(sim.asteroides), 'grande')
+
+
+def _preparar_tiro_maximo(sim):
+    sim.invencivel = True
+    sim.nave.tempo_cooldown_tiro = 0  # Um tiro por tick
+
+
+def _explosoes_em_cadeia(sim, tick):
+    # A cada meio segundo, 60 asteroides grandes novos e um projétil sobre
+    # cada asteroide vivo: grandes viram médios, que viram pequenos...
+    if tick % 30 == 0:
+        espalhar_asteroides(sim, 60, 'grande')
+        atingir_todos(sim)
+
+
+def _reiniciar_no_game_over(sim, tick):
+    if sim.estado_jogo == 'game_over':
+        sim.resetar()
+
+
+def _preparar_game_over(sim):
+    sim.estado_jogo = 'game_over'
+    sim.pontuacao_final = 12345
+
+
+CENARIOS = [
+    Cenario('padrao', "Partida normal girando e atirando",
+            entradas={'esquerda': True, 'espaco': True},
+            a_cada_tick=_reiniciar_no_game_over),
+    Cenario('asteroides_500', "500 asteroides simultâneos (colisão e desenho)",
+            entradas={'esquerda': True, 'espaco': True},
+            preparar=_preparar_500_asteroides, a_cada_tick=_manter_500_asteroides),
+    Cenario('tiro_maximo', "Um tiro por tick, acelerando e girando",
+            entradas={'esquerda': True, 'cima': True, 'espaco': True},
+            preparar=_preparar_tiro_maximo),
+    Cenario('explosoes_em_cadeia', "Dezenas de asteroides explodindo no mesmo tick",
+            preparar=_preparar_invencivel,
+            a_cada_tick=_explosoes_em_cadeia),
+    Cenario('estrelas_5000', "Fundo com 5.000 estrelas e a nave acelerando",
+            entradas={'direita': True, 'cima': True},
+            num_estrelas=5000, a_cada_tick=_reiniciar_no_game_over),
+    Cenario('game_over', "Tela de game over (overlay e painel)",
+            preparar=_preparar_game_over),
+    Cenario('arena_1000', "1.000 asteroides num campo de 8 x 8 telas, câmera seguindo a nave",
+            entradas={'esquerda': True, 'cima': True, 'espaco': True},
+            preparar=_preparar_arena, arena=8),
+    # A meta vale para a vista do jogo (6 x 6 telas): só ~1/36 dos asteroides
+    # é desenhado e os que estão além de ALCANCE_ATIVO da nave são atualizados
+    # só a cada DIVISOR_DISTANTE ticks. Não é uma meta de 60 FPS desenhando e
+    # simulando os 2.000 a cada tick. A reposição até 2.000 (centenas de
+    # asteroides novos por segundo) é medida dentro do frame
+    Cenario('horda_2000', "Modo horda: 2.000 asteroides em 6 x 6 telas, meta de 60 FPS com vista com culling "
+                          "e asteroides distantes atualizados a cada DIVISOR_DISTANTE ticks",
+            entradas={'esquerda': True, 'cima': True, 'espaco': True},
+            preparar=_preparar_invencivel, a_cada_tick=_manter_horda, arena=6, horda=2000, meta_fps=60,
+            medir_script=True),
+    Cenario('horda_2000_2x2', "2.000 asteroides em 2 x 2 telas: um quarto do campo desenhado (sem meta)",
+            entradas={'esquerda': True, 'cima': True, 'espaco': True},
+            preparar=_preparar_invencivel, a_cada_tick=_manter_horda, arena=2, horda=2000, medir_script=True),
+]
@@ -4,16 +4,28 @@ Classe Asteroid - Asteroide com efeito de profundidade 3D
 import pygame
 import random
 import math
+import numpy as np
 from utils.cores import interpolar_cor
+from utils.formas import banco_formas, VARIACAO_RAIO
 
 
 class Asteroid:
+    __slots__ = ('pos', 'vel', 'tamanho_tipo', 'tamanho_base', 'profundidade', 'tamanho', 'raio_colisao',
+                 'cor', 'rotacao', 'vel_rotacao', 'forma', 'pontos', 'vertices', 'vivo', 'rng', 'fase', 'distante')
+    
     # Tamanhos base para cada tipo
     TAMANHO_GRANDE = 40
     TAMANHO_MEDIO = 25
     TAMANHO_PEQUENO = 15
     
-    def __init__(self, x, y, tamanho_tipo='grande', profundidade=None, velocidade_inicial=None):
+    # Tamanhos inteiros possíveis (base x profundidade de 0.8 a 1.0), escalonados no banco de formas
+    TAMANHOS = tuple(
+        tamanho
+        for base in (TAMANHO_GRANDE, TAMANHO_MEDIO, TAMANHO_PEQUENO)
+        for tamanho in range(int(base * 0.8), base + 1)
+    )
+    
+    def __init__(self, x, y, tamanho_tipo='grande', profundidade=None, velocidade_inicial=None, rng=None):
         """
         Inicializa um asteroide
         
@@ -23,8 +35,19 @@ class Asteroid:
             tamanho_tipo: 'grande', 'medio' ou 'pequeno'
             profundidade: float de 0.8 a 1.0 (None = aleatório)
             velocidade_inicial: pygame.math.Vector2 (None = aleatório)
+            rng: random.Random da forma, velocidade e fragmentos (None = módulo random)
         """
-        self.pos = pygame.math.Vector2(x, y)
+        self.pos = pygame.math.Vector2()
+        self.vel = pygame.math.Vector2()
+        self.resetar(x, y, tamanho_tipo, profundidade, velocidade_inicial, rng)
+    
+    def resetar(self, x, y, tamanho_tipo='grande', profundidade=None, velocidade_inicial=None, rng=None):
+        """Reinicializa o asteroide para reuso (mesmos argumentos do construtor)"""
+        if rng is None:
+            rng = random
+        self.rng = rng
+        
+        self.pos.update(x, y)
         self.tamanho_tipo = tamanho_tipo
         
         # Definir tamanho base
@@ -37,7 +60,7 @@ class Asteroid:
         
         # Profundidade (asteroides usam 0.8-1.0 para ficarem "acima" das estrelas)
         if profundidade is None:
-            self.profundidade = random.uniform(0.8, 1.0)
+            self.profundidade = rng.uniform(0.8, 1.0)
         else:
             self.profundidade = profundidade
         
@@ -52,54 +75,39 @@ class Asteroid:
         if velocidade_inicial is None:
             # Velocidade base depende do tamanho (menores são mais rápidos)
             if tamanho_tipo == 'grande':
-                vel_base = random.uniform(30, 50)
+                vel_base = rng.uniform(30, 50)
             elif tamanho_tipo == 'medio':
-                vel_base = random.uniform(40, 70)
+                vel_base = rng.uniform(40, 70)
             else:  # pequeno
-                vel_base = random.uniform(60, 100)
+                vel_base = rng.uniform(60, 100)
             
             # Velocidade também afetada pela profundidade (mais próximo = mais rápido)
             vel_base *= self.profundidade
             
             # Direção aleatória
-            angulo = random.uniform(0, 2 * math.pi)
-            self.vel = pygame.math.Vector2(
+            angulo = rng.uniform(0, 2 * math.pi)
+            self.vel.update(
                 math.cos(angulo) * vel_base,
                 math.sin(angulo) * vel_base
             )
         else:
-            self.vel = velocidade_inicial.copy()
+            self.vel.update(velocidade_inicial)
         
         # Rotação
-        self.rotacao = random.uniform(0, 2 * math.pi)
-        self.vel_rotacao = random.uniform(-2, 2)
+        self.rotacao = rng.uniform(0, 2 * math.pi)
+        self.vel_rotacao = rng.uniform(-2, 2)
         
-        # Gerar forma irregular
-        self.pontos = self.gerar_forma_irregular()
+        # Forma irregular do banco (pré-calculada e compartilhada; vertices é
+        # a mesma forma em array, para o caminho vetorizado)
+        banco = banco_formas(self.TAMANHOS)
+        self.forma = rng.randrange(len(banco))
+        self.pontos, self.vertices = banco.forma(self.tamanho, self.forma)
         
-        self.vivo = True
-    
-    def gerar_forma_irregular(self):
-        """
-        Gera pontos para um polígono irregular (asteroide procedural)
+        # Arena: tick em que o asteroide reavalia se está longe da nave (ver GameSimulation)
+        self.fase = 0
+        self.distante = False
         
-        Returns:
-            list: Lista de pygame.math.Vector2 com pontos locais
-        """
-        num_pontos = random.randint(8, 12)
-        pontos = []
-        
-        for i in range(num_pontos):
-            angulo = (2 * math.pi / num_pontos) * i
-            # Variação aleatória no raio (70% a 130% do tamanho)
-            variacao = random.uniform(0.7, 1.3)
-            raio = self.tamanho * variacao
-            
-            x = raio * math.cos(angulo)
-            y = raio * math.sin(angulo)
-            pontos.append(pygame.math.Vector2(x, y))
-        
-        return pontos
+        self.vivo = True
     
     def atualizar(self, dt, largura_tela, altura_tela):
         """
@@ -116,16 +124,13 @@ class Asteroid:
         # Atualizar rotação
         self.rotacao += self.vel_rotacao * dt
         
-        # Screen wrapping
-        if self.pos.x > largura_tela + self.tamanho:
-            self.pos.x = -self.tamanho
-        elif self.pos.x < -self.tamanho:
-            self.pos.x = largura_tela + self.tamanho
-            
-        if self.pos.y > altura_tela + self.tamanho:
-            self.pos.y = -self.tamanho
-        elif self.pos.y < -self.tamanho:
-            self.pos.y = altura_tela + self.tamanho
+        # Mundo toroidal: continua do outro lado ao cruzar uma borda (o
+        # desenho repete do outro lado a parte que passou; ver MundoToroidal)
+        pos = self.pos
+        if not 0 <= pos.x < largura_tela:
+            pos.x %= largura_tela
+        if not 0 <= pos.y < altura_tela:
+            pos.y %= altura_tela
     
     def get_pontos_rotacionados(self):
         """
@@ -134,93 +139,195 @@ class Asteroid:
         Returns:
             list: Lista de tuplas (x, y) para pygame.draw.polygon
         """
-        pontos_rotacionados = []
+        # Seno e cosseno calculados uma vez por asteroide, não por vértice
+        cos_r = math.cos(self.rotacao)
+        sin_r = math.sin(self.rotacao)
+        pos_x = self.pos.x
+        pos_y = self.pos.y
         
-        for ponto in self.pontos:
-            # Rotacionar ponto
-            x_rot = ponto.x * math.cos(self.rotacao) - ponto.y * math.sin(self.rotacao)
-            y_rot = ponto.x * math.sin(self.rotacao) + ponto.y * math.cos(self.rotacao)
-            
-            # Adicionar posição do asteroide
-            x_final = self.pos.x + x_rot
-            y_final = self.pos.y + y_rot
-            
-            pontos_rotacionados.append((x_final, y_final))
-        
-        return pontos_rotacionados
+        return [
+            (pos_x + ponto.x * cos_r - ponto.y * sin_r, pos_y + ponto.x * sin_r + ponto.y * cos_r)
+            for ponto in self.pontos
+        ]
     
-    def fragmentar(self):
+    def fragmentar(self, criar=None, quantidade=2):
         """
         Fragmenta o asteroide em pedaços menores
         
+        Args:
+            criar: Fábrica dos fragmentos, ex.: Pool.obter (None = Asteroid)
+            quantidade: Fragmentos por asteroide grande ou médio
+        
         Returns:
             list: Lista de novos Asteroids menores (ou vazia se for pequeno)
         """
+        if criar is None:
+            criar = Asteroid
+        
+        rng = self.rng
         fragmentos = []
         
         if self.tamanho_tipo == 'grande':
-            # Gera 2 asteroides médios
-            for _ in range(2):
+            # Gera asteroides médios
+            for _ in range(quantidade):
                 # Offset aleatório da posição
-                offset_x = random.uniform(-20, 20)
-                offset_y = random.uniform(-20, 20)
+                offset_x = rng.uniform(-20, 20)
+                offset_y = rng.uniform(-20, 20)
                 
                 # Velocidade aleatória, mas mais rápida que o original
-                angulo = random.uniform(0, 2 * math.pi)
-                vel_magnitude = self.vel.length() * random.uniform(1.2, 1.5)
+                angulo = rng.uniform(0, 2 * math.pi)
+                vel_magnitude = self.vel.length() * rng.uniform(1.2, 1.5)
                 nova_vel = pygame.math.Vector2(
                     math.cos(angulo) * vel_magnitude,
                     math.sin(angulo) * vel_magnitude
                 )
                 
-                frag = Asteroid(
+                frag = criar(
                     self.pos.x + offset_x,
                     self.pos.y + offset_y,
                     'medio',
                     self.profundidade,  # Mantém a mesma profundidade
-                    nova_vel
+                    nova_vel,
+                    rng
                 )
                 fragmentos.append(frag)
                 
         elif self.tamanho_tipo == 'medio':
-            # Gera 2 asteroides pequenos
-            for _ in range(2):
-                offset_x = random.uniform(-15, 15)
-                offset_y = random.uniform(-15, 15)
+            # Gera asteroides pequenos
+            for _ in range(quantidade):
+                offset_x = rng.uniform(-15, 15)
+                offset_y = rng.uniform(-15, 15)
                 
-                angulo = random.uniform(0, 2 * math.pi)
-                vel_magnitude = self.vel.length() * random.uniform(1.3, 1.6)
+                angulo = rng.uniform(0, 2 * math.pi)
+                vel_magnitude = self.vel.length() * rng.uniform(1.3, 1.6)
                 nova_vel = pygame.math.Vector2(
                     math.cos(angulo) * vel_magnitude,
                     math.sin(angulo) * vel_magnitude
                 )
                 
-                frag = Asteroid(
+                frag = criar(
                     self.pos.x + offset_x,
                     self.pos.y + offset_y,
                     'pequeno',
                     self.profundidade,
-                    nova_vel
+                    nova_vel,
+                    rng
                 )
                 fragmentos.append(frag)
         
         # Pequenos não fragmentam (retorna lista vazia)
         return fragmentos
     
-    def desenhar(self, tela):
+    def desenhar(self, tela, pontos=None, espessura=2, antialias=False):
         """
         Desenha o asteroide
         
         Args:
             tela: Surface do Pygame
+            pontos: Contorno já transformado (de calcular_contornos);
+                None = calcular aqui
+            espessura: Espessura do contorno em pixels
+            antialias: Contorno suavizado de 1 pixel (ignora a espessura)
+        
+        Returns:
+            pygame.Rect: Área alterada na tela (None se não desenhou)
         """
         if not self.vivo:
-            return
+            return None
         
-        pontos = self.get_pontos_rotacionados()
+        if pontos is None:
+            pontos = self.get_pontos_rotacionados()
         
         # Desenhar polígono (wireframe)
-        pygame.draw.polygon(tela, self.cor, pontos, 2)
+        if antialias:
+            area = pygame.draw.aalines(tela, self.cor, True, pontos)
+        else:
+            area = pygame.draw.polygon(tela, self.cor, pontos, espessura)
         
         # Desenhar hitbox (debug - descomente se quiser ver)
         # pygame.draw.circle(tela, (255, 0, 0), (int(self.pos.x), int(self.pos.y)), int(self.raio_colisao), 1)
+        
+        return area
+
+
+def calcular_contornos(asteroides, atraso=0.0, camera=None):
+    """
+    Rotaciona e translada os contornos de vários asteroides de uma vez
+    
+    Os vértices locais de todos os asteroides são concatenados em um único
+    array e transformados em uma passada vetorizada do NumPy.
+    
+    Args:
+        asteroides: Lista de Asteroid
+        atraso: Tempo (s) que o desenho está atrás do último passo
+            (posição e rotação recuadas pelas velocidades)
+        camera: Camera da arena (None = coordenadas do mundo são as da tela)
+    
+    Returns:
+        list: Um contorno (lista de (x, y)) por asteroide, na mesma ordem
+    """
+    if not asteroides:
+        return []
+    
+    contagens = [len(asteroide.vertices) for asteroide in asteroides]
+    vertices = np.concatenate([asteroide.vertices for asteroide in asteroides])
+    estado = np.array([(asteroide.pos.x, asteroide.pos.y, asteroide.rotacao) for asteroide in asteroides])
+    if atraso:
+        estado -= atraso * np.array([(asteroide.vel.x, asteroide.vel.y, asteroide.vel_rotacao)
+                                     for asteroide in asteroides])
+    if camera is not None:
+        estado[:, :2] = camera.para_tela(estado[:, :2])
+    
+    # Seno/cosseno por asteroide, repetidos para cada um dos seus vértices
+    cos_r = np.repeat(np.cos(estado[:, 2]), contagens)
+    sin_r = np.repeat(np.sin(estado[:, 2]), contagens)
+    pos_x = np.repeat(estado[:, 0], contagens)
+    pos_y = np.repeat(estado[:, 1], contagens)
+    
+    local_x = vertices[:, 0]
+    local_y = vertices[:, 1]
+    xs = (pos_x + local_x * cos_r - local_y * sin_r).tolist()
+    ys = (pos_y + local_x * sin_r + local_y * cos_r).tolist()
+    
+    contornos = []
+    inicio = 0
+    for contagem in contagens:
+        fim = inicio + contagem
+        contornos.append(list(zip(xs[inicio:fim], ys[inicio:fim])))
+        inicio = fim
+    
+    return contornos
+
+
+def desenhar_asteroides(tela, asteroides, atraso=0.0, espessura=2, antialias=False, mundo=None, camera=None):
+    """
+    Desenha uma lista de asteroides já ordenada por profundidade
+    
+    Args:
+        tela: Surface do Pygame
+        asteroides: Lista de Asteroid (distantes primeiro)
+        atraso: Tempo (s) que o desenho está atrás do último passo
+        espessura: Espessura dos contornos em pixels
+        antialias: Contornos suavizados de 1 pixel
+        mundo: MundoToroidal (None = sem cópias do outro lado das bordas)
+        camera: Camera da arena; a lista deve trazer só os asteroides
+            próximos da vista (GradeEspacial.consultar_retangulo)
+    
+    Returns:
+        list: Áreas alteradas (uma por asteroide, None nos que não
+            desenharam, seguidas das cópias fantasma de cada um)
+    """
+    contornos = calcular_contornos(asteroides, atraso, camera)
+    areas = []
+    for asteroide, contorno in zip(asteroides, contornos):
+        areas.append(asteroide.desenhar(tela, contorno, espessura, antialias))
+        if mundo is None or not asteroide.vivo:
+            continue
+        
+        # Perto de uma borda: repetir o contorno do lado oposto
+        x = asteroide.pos.x - asteroide.vel.x * atraso
+        y = asteroide.pos.y - asteroide.vel.y * atraso
+        for dx, dy in mundo.fantasmas(x, y, asteroide.tamanho * VARIACAO_RAIO[1] + espessura):
+            copia = [(px + dx, py + dy) for px, py in contorno]
+            areas.append(asteroide.desenhar(tela, copia, espessura, antialias))
+    return areas
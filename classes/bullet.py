@@ -1,61 +1,81 @@
 """
-Classe Bullet - Projétil disparado pela nave
+Projéteis disparados pela nave
+
+Os projéteis são entidades do arquétipo 'projeteis' do registro da
+simulação (entidades/registro.py): uma linha por projétil nas colunas
+pos, vel, raio e vida, atualizadas e desenhadas todas de uma vez.
 """
+import numpy as np
 import pygame
+from entidades import sistemas
+
 
+RAIO_PROJETIL = 2  # Raio do projétil
+COR_PROJETIL = (255, 255, 255)  # Branco
+TEMPO_VIDA_PROJETIL = 1.5  # segundos
 
-class Bullet:
-    def __init__(self, pos, vel, angulo):
-        """
-        Inicializa um projétil
-        
-        Args:
-            pos: pygame.math.Vector2 com posição inicial
-            vel: pygame.math.Vector2 com velocidade
-            angulo: Ângulo de disparo (para efeitos visuais)
-        """
-        self.pos = pos.copy()
-        self.vel = vel.copy()
-        self.angulo = angulo
-        
-        # Configurações
-        self.raio = 2  # Raio do projétil
-        self.cor = (255, 255, 255)  # Branco
-        self.tempo_vida_max = 1.5  # segundos
-        self.tempo_vida = self.tempo_vida_max
-        self.vivo = True
-    
-    def atualizar(self, dt, largura_tela, altura_tela):
-        """
-        Atualiza posição e estado do projétil
-        
-        Args:
-            dt: Delta time em segundos
-            largura_tela: Largura da tela
-            altura_tela: Altura da tela
-        """
-        # Atualizar posição
-        self.pos += self.vel * dt
-        
+
+def atualizar_projeteis(projeteis, dt, largura_tela, altura_tela, envolver=False):
+    """
+    Move os projéteis e desconta o tempo de vida
+    
+    Um projétil morre com vida <= 0, mas fica nas colunas até o fim do
+    tick: o trecho que percorreu até morrer ainda passa pela colisão.
+    
+    Args:
+        projeteis: Arquetipo 'projeteis'
+        dt: Delta time em segundos
+        largura_tela: Largura da tela
+        altura_tela: Altura da tela
+        envolver: Continuar do outro lado ao sair do mundo, em vez de
+            sumir (arena: a borda do mundo não é a da tela)
+    """
+    if not len(projeteis):
+        return
+    
+    sistemas.mover(projeteis, dt)
+    
+    if envolver:
+        sistemas.envolver(projeteis, largura_tela, altura_tela)
+    else:
         # Destruir se sair da tela (sem screen wrapping, como no Asteroids clássico)
-        if (self.pos.x < 0 or self.pos.x > largura_tela or 
-            self.pos.y < 0 or self.pos.y > altura_tela):
-            self.vivo = False
-        
-        # Reduzir tempo de vida
-        self.tempo_vida -= dt
-        if self.tempo_vida <= 0:
-            self.vivo = False
-    
-    def desenhar(self, tela):
-        """
-        Desenha o projétil
-        
-        Args:
-            tela: Surface do Pygame
-        """
-        if not self.vivo:
-            return
-        
-        # Desenhar como círculo pequeno
-        pygame.draw.circle(tela, self.cor, (int(self.pos.x), int(self.pos.y)), self.raio)
+        projeteis.coluna('vida')[sistemas.fora(projeteis, largura_tela, altura_tela)] = 0.0
+    
+    sistemas.envelhecer(projeteis, dt)
+
+
+def desenhar_projeteis(tela, projeteis, atraso=0.0, camera=None):
+    """
+    Desenha os projéteis vivos
+    
+    Args:
+        tela: Surface do Pygame
+        projeteis: Arquetipo 'projeteis'
+        atraso: Tempo (s) que o desenho está atrás do último passo
+            (recua pela velocidade: movimento retilíneo)
+        camera: Camera da arena (None = coordenadas do mundo são as da tela)
+    
+    Returns:
+        list: Áreas alteradas na tela (pygame.Rect), uma por projétil desenhado
+    """
+    if not len(projeteis):
+        return []
+    
+    pos = projeteis.coluna('pos') - projeteis.coluna('vel') * atraso
+    raios = projeteis.coluna('raio')
+    desenhar = projeteis.coluna('vida') > 0
+    
+    if camera is not None:
+        # Fora da vista (além do raio): não desenha
+        pos = camera.para_tela(pos)
+        meia_largura = camera.largura_tela / 2
+        meia_altura = camera.altura_tela / 2
+        desenhar &= ((np.abs(pos[:, 0] - meia_largura) <= meia_largura + raios)
+                     & (np.abs(pos[:, 1] - meia_altura) <= meia_altura + raios))
+    
+    # Desenhar como círculos pequenos
+    centros = pos[desenhar].astype(np.int32).tolist()
+    return [
+        pygame.draw.circle(tela, COR_PROJETIL, centro, raio)
+        for centro, raio in zip(centros, raios[desenhar].astype(np.int32).tolist())
+    ]
@@ -0,0 +1,116 @@
+"""
+Montagem da fila de renderização do jogo (camadas de desenho em ordem)
+"""
+from operator import attrgetter
+from classes.asteroid import Asteroid, desenhar_asteroides
+from classes.bullet import desenhar_projeteis as desenhar_projeteis_lote
+from utils.formas import VARIACAO_RAIO
+from utils.fila_render import FilaRender, CamadaOrdenada
+from utils.qualidade import NIVEIS_QUALIDADE, NIVEL_PADRAO
+
+
+# Folga da consulta à grade pela vista da câmera: raio do maior asteroide desenhado
+MARGEM_VISTA = Asteroid.TAMANHO_GRANDE * VARIACAO_RAIO[1]
+
+
+def criar_fila_render(sim, campo_estrelas, hud, teclas_pressionadas, obter_fps, obter_atraso=None,
+                      obter_qualidade=None, camera=None):
+    """
+    Cria a fila com as camadas do jogo, do fundo para o topo
+    
+    Usada pelas versões desktop e web e pelo benchmark, para que todos
+    desenhem exatamente o mesmo frame. Cada camada também guarda os
+    retângulos que alterou (retornados pelas funções de desenho do Pygame),
+    usados pelo RenderizadorSujo.
+    
+    Args:
+        sim: GameSimulation a desenhar
+        campo_estrelas: CampoEstrelas do fundo
+        hud: HUD do jogo
+        teclas_pressionadas: dict de controles (para o thrust)
+        obter_fps: Função que retorna o FPS atual (mostrado no HUD)
+        obter_atraso: Função que retorna quanto (s) o desenho está atrás do
+            último passo da simulação, ex.: PassoFixo.atraso (None = sem interpolação)
+        obter_qualidade: Função que retorna o nível de qualidade atual (dict
+            de NIVEIS_QUALIDADE), ex.: GovernadorQualidade.config (None = 'alta')
+        camera: Camera da arena, já posicionada a cada frame (None = o campo
+            inteiro na tela). Só os asteroides das células da grade na vista
+            são transformados e desenhados
+    
+    Returns:
+        FilaRender: Fila pronta para desenhar
+    """
+    nave = sim.nave
+    if obter_atraso is None:
+        obter_atraso = lambda: 0.0
+    if obter_qualidade is None:
+        obter_qualidade = lambda: NIVEIS_QUALIDADE[NIVEL_PADRAO]
+    
+    # Cópias do outro lado das bordas só quando o campo inteiro está na tela
+    mundo = sim.mundo if camera is None else None
+    
+    def desenhar_lista_asteroides(tela, asteroides):
+        qualidade = obter_qualidade()
+        return desenhar_asteroides(tela, asteroides, obter_atraso(),
+                                   qualidade['espessura_linha'], qualidade['antialias'], mundo, camera)
+    
+    # Asteroides mantidos em ordem de profundidade (distantes primeiro)
+    camada_asteroides = None
+    if camera is None:
+        camada_asteroides = CamadaOrdenada(desenhar_lista_asteroides)
+        sim.asteroides.observar(camada_asteroides)
+    
+    # Retângulos alterados por cada camada no último frame
+    areas = {'thrust': [], 'asteroides': [], 'debris': [], 'nave': [], 'projeteis': []}
+    
+    def desenhar_thrust(tela):
+        if teclas_pressionadas['cima'] and nave.viva:
+            areas['thrust'] = [nave.desenhar_thrust(tela, obter_atraso(), mundo, camera)]
+        else:
+            areas['thrust'] = []
+    
+    def desenhar_asteroides_camada(tela):
+        if camada_asteroides is not None:
+            areas['asteroides'] = camada_asteroides.desenhar(tela) or []
+            return
+        
+        # Arena: só os asteroides das células na vista, ordenados a cada frame
+        visiveis = [asteroide for asteroide in sim.grade.consultar_retangulo(*camera.retangulo_mundo(MARGEM_VISTA))
+                    if asteroide.vivo]
+        visiveis.sort(key=attrgetter('profundidade'))
+        areas['asteroides'] = desenhar_lista_asteroides(tela, visiveis)
+    
+    def desenhar_particulas(tela):
+        sim.particulas.desenhar(tela, obter_atraso(), camera)
+    
+    def desenhar_debris(tela):
+        atraso = obter_atraso()
+        qualidade = obter_qualidade()
+        espessura = qualidade['espessura_linha']
+        antialias = qualidade['antialias']
+        areas['debris'] = [debris.desenhar(tela, atraso, espessura, antialias, camera) for debris in sim.ship_debris]
+    
+    def desenhar_nave(tela):
+        qualidade = obter_qualidade()
+        areas['nave'] = [nave.desenhar(tela, obter_atraso(), qualidade['espessura_linha'], qualidade['antialias'],
+                                       mundo, camera)]
+    
+    def desenhar_projeteis(tela):
+        atraso = obter_atraso()
+        areas['projeteis'] = desenhar_projeteis_lote(tela, sim.projeteis, atraso, camera)
+    
+    def desenhar_hud(tela):
+        hud.desenhar(tela, sim.pontos, sim.vidas, sim.nivel, len(sim.asteroides), obter_fps())
+        if sim.estado_jogo == 'game_over':
+            hud.desenhar_game_over(tela, sim.pontuacao_final)
+    
+    fila_render = FilaRender()
+    fila_render.adicionar('estrelas', campo_estrelas.desenhar)
+    fila_render.adicionar('thrust', desenhar_thrust, funcao_areas=lambda: areas['thrust'])
+    fila_render.adicionar('asteroides', desenhar_asteroides_camada, funcao_areas=lambda: areas['asteroides'])
+    fila_render.adicionar('particulas', desenhar_particulas, funcao_areas=lambda: sim.particulas.areas(obter_atraso(), camera))
+    fila_render.adicionar('debris', desenhar_debris, funcao_areas=lambda: areas['debris'])
+    fila_render.adicionar('nave', desenhar_nave, funcao_areas=lambda: areas['nave'])
+    fila_render.adicionar('projeteis', desenhar_projeteis, funcao_areas=lambda: areas['projeteis'])
+    fila_render.adicionar('hud', desenhar_hud, funcao_areas=lambda: hud.areas)
+    return fila_render
@@ -0,0 +1,560 @@
+"""
+Classe GameSimulation - Estado e regras do jogo, independente de display
+"""
+import math
+import pygame
+from classes.ship import Ship
+from classes.bullet import atualizar_projeteis, RAIO_PROJETIL, TEMPO_VIDA_PROJETIL
+from classes.asteroid import Asteroid
+from classes.particula import SistemaParticulas
+from classes.ship_debris import ShipDebris, criar_explosao_nave
+from entidades.arquetipos import ARQUETIPOS
+from entidades.registro import Registro
+from utils.fisica import checar_colisao_varrida, GradeEspacial
+from utils.formas import VARIACAO_RAIO
+from utils.mundo import MundoToroidal
+from utils.pool import Pool, ListaEntidades
+from utils.perfil import PerfiladorNulo
+from utils.aleatorio import GeradoresAleatorios
+
+
+# Passo de simulação (120 ticks por segundo, independente da taxa de desenho)
+FREQUENCIA_SIMULACAO = 120
+DT_FIXO = 1.0 / FREQUENCIA_SIMULACAO
+
+# Curva de dificuldade (valores de uma partida podem ser trocados; ver python -m agentes.fazenda)
+CURVA_DIFICULDADE = {
+    'asteroides_iniciais': 4,  # Asteroides no início da partida
+    'pontos_por_nivel': 500,  # Pontos necessários para subir de nível
+    'aumento_velocidade': 0.15,  # Velocidade extra dos asteroides novos, por nível
+    'intervalo_spawn': 4.0,  # Segundos entre spawns no nível 1
+    'reducao_intervalo': 0.3,  # Redução do intervalo por nível
+    'intervalo_minimo': 1.5,
+    'max_asteroides': 8,  # Asteroides simultâneos no nível 1
+    'aumento_max_asteroides': 1,  # Por nível
+    'limite_asteroides': 15,  # Teto em qualquer nível
+    'fragmentos': 2,  # Fragmentos de um asteroide grande ou médio destruído
+    'raio_reacao': 0.0,  # Alcance (px além da borda) da explosão que destrói vizinhos; 0 = sem reação em cadeia
+    'geracoes_reacao': 0,  # Explosões em sequência que uma reação em cadeia pode ter
+}
+
+# Arena (mundo maior que a tela): asteroides longe da nave andam em passos maiores
+ALCANCE_ATIVO = 1600  # px da nave, em cada eixo, simulados a cada tick (além do alcance de um tiro)
+DIVISOR_DISTANTE = 4  # Asteroides distantes andam 1 passo (de 4 * dt) a cada 4 ticks
+
+# Horda: milhares de asteroides numa arena (ver curva_horda)
+LIMITE_HORDA = 2000  # Asteroides simultâneos
+TELAS_HORDA = 6  # Lado da arena em telas, quando não foi escolhido outro
+
+
+def curva_arena(telas):
+    """
+    Curva de uma arena de telas x telas, com a densidade de asteroides de uma tela
+    
+    Args:
+        telas: Lado da arena em telas
+    
+    Returns:
+        dict: Valores de CURVA_DIFICULDADE a substituir (GameSimulation(curva=...))
+    """
+    area = telas * telas
+    curva = CURVA_DIFICULDADE
+    return {
+        'asteroides_iniciais': curva['asteroides_iniciais'] * area,
+        'max_asteroides': curva['max_asteroides'] * area,
+        'aumento_max_asteroides': curva['aumento_max_asteroides'] * area,
+        'limite_asteroides': curva['limite_asteroides'] * area,
+        'intervalo_spawn': curva['intervalo_spawn'] / area,
+        'reducao_intervalo': curva['reducao_intervalo'] / area,
+        'intervalo_minimo': curva['intervalo_minimo'] / area,
+    }
+
+
+def curva_horda(limite=LIMITE_HORDA):
+    """
+    Curva do modo horda: campo cheio desde o início e reações em cadeia
+    
+    Cada asteroide destruído se parte em 3 e a explosão destrói os vizinhos
+    que ela alcança, que explodem também (até 4 gerações). Um tiro num
+    grupo denso cria dezenas de fragmentos de uma vez, e as cadeias chegam
+    a centenas de asteroides novos por segundo.
+    
+    Args:
+        limite: Asteroides simultâneos (spawn para ao chegar nele)
+    
+    Returns:
+        dict: Valores de CURVA_DIFICULDADE a substituir (aplicar depois de curva_arena)
+    """
+    return {
+        'asteroides_iniciais': limite,
+        'pontos_por_nivel': 25 * limite,  # As cadeias pontuam rápido: níveis mais longos
+        'max_asteroides': limite,
+        'aumento_max_asteroides': 0,
+        'limite_asteroides': limite,
+        'intervalo_spawn': 0.02,  # Até 50 asteroides novos por segundo
+        'reducao_intervalo': 0.0,
+        'intervalo_minimo': 0.02,
+        'fragmentos': 3,
+        'raio_reacao': 40.0,
+        'geracoes_reacao': 4,
+    }
+
+
+class GameSimulation:
+    def __init__(self, largura=800, altura=600, semente=None, curva=None, tela=None):
+        """
+        Inicializa a simulação do jogo
+        
+        Não usa pygame.display, fontes nem relógio: pode ser avançada
+        sem janela (driver SDL dummy ou sem display algum), tantas vezes
+        por segundo quanto o processador permitir.
+        
+        Todo sorteio usa geradores derivados de `semente`: com a mesma
+        semente e as mesmas entradas por tick, a partida se repete igual.
+        
+        Com `tela` menor que o campo (arena), asteroides novos nascem fora
+        da vista e os que estão além de ALCANCE_ATIVO da nave são
+        atualizados a cada DIVISOR_DISTANTE ticks e ficam fora da grade.
+        
+        Args:
+            largura: Largura do campo de jogo
+            altura: Altura do campo de jogo
+            semente: Semente dos geradores aleatórios (None = sorteada)
+            curva: dict com valores de CURVA_DIFICULDADE a substituir (None = padrão)
+            tela: (largura, altura) da área vista em volta da nave, quando o
+                campo é maior que a tela (None = o campo inteiro na tela)
+        
+        Raises:
+            ValueError: Se a curva tem um parâmetro desconhecido
+        """
+        self.largura = largura
+        self.altura = altura
+        self.mundo = MundoToroidal(largura, altura)  # Bordas ligadas: distâncias e colisões dão a volta
+        self.tela = tela
+        self.arena = tela is not None and tuple(tela) != (largura, altura)
+        
+        # Um gerador por subsistema
+        self.aleatorio = GeradoresAleatorios(semente)
+        self.semente = self.aleatorio.semente
+        self.rng_spawn = self.aleatorio.gerador('spawn')
+        self.rng_asteroides = self.aleatorio.gerador('asteroides')
+        self.rng_debris = self.aleatorio.gerador('debris')
+        
+        self.nave = Ship(largura // 2, altura // 2, largura, altura)
+        
+        # Entidades em colunas (IDs com geração, uma linha por entidade)
+        self.entidades = Registro(ARQUETIPOS)
+        self.projeteis = self.entidades.arquetipos['projeteis']
+        
+        # Entidades mortas voltam para os pools e são reaproveitadas
+        self.pool_asteroides = Pool(Asteroid)
+        self.pool_debris = Pool(ShipDebris)
+        
+        self.asteroides = ListaEntidades('vivo', self.pool_asteroides)
+        self.particulas = SistemaParticulas(semente=self.aleatorio.semente_derivada('particulas'),
+                                            registro=self.entidades)  # Partículas de explosão
+        self.ship_debris = ListaEntidades('viva', self.pool_debris)  # Pedaços da nave
+        self.grade = GradeEspacial(mundo=self.mundo)  # Broad-phase de colisões contra asteroides
+        self.particulas_por_explosao = 15  # Só visual (ajustado pela qualidade)
+        
+        # Sistema de dificuldade progressiva
+        self.curva = dict(CURVA_DIFICULDADE)
+        if curva:
+            desconhecidos = set(curva) - set(CURVA_DIFICULDADE)
+            if desconhecidos:
+                raise ValueError(f"Parâmetros de curva desconhecidos: {', '.join(sorted(desconhecidos))}")
+            self.curva.update(curva)
+        
+        # Eventos do último step (sons, game over...) para quem estiver apresentando o jogo
+        self.eventos = []
+        
+        # Medição de tempo por fase (substituído por um Perfilador no benchmark)
+        self.perfilador = PerfiladorNulo()
+        
+        # Nave imune a colisões (cenários de benchmark com muitos asteroides)
+        self.invencivel = False
+        
+        self.resetar()
+    
+    def resetar(self):
+        """Reseta o jogo para um novo round"""
+        self.pontos = 0
+        self.vidas = 3
+        self.nivel = 1
+        self.tempo_spawn = 0
+        self.estado_jogo = 'jogando'  # 'jogando' ou 'game_over'
+        self.pontuacao_final = 0
+        self.tempo_jogo = 0.0
+        self.ticks = 0  # Ticks jogados (vez dos asteroides distantes da arena)
+        self.asteroides_criados = 0
+        
+        # Resetar nave
+        nave = self.nave
+        nave.pos = pygame.math.Vector2(self.largura // 2, self.altura // 2)
+        nave.vel = pygame.math.Vector2(0, 0)
+        nave.angulo = 0
+        nave.viva = True
+        nave.guardar_estado()  # Sem interpolar da posição antiga
+        
+        # Limpar e recriar asteroides
+        self.asteroides.limpar()
+        self.entidades.limpar('projeteis')
+        self.particulas.limpar()
+        self.ship_debris.limpar()
+        self.grade.limpar()
+        for _ in range(self.curva['asteroides_iniciais']):
+            self.asteroides.append(self.spawn_asteroide('grande'))
+    
+    def spawn_asteroide(self, tamanho='grande'):
+        """Spawna um asteroide na emenda mais longe da nave ou, na arena, fora da vista"""
+        rng = self.rng_spawn
+        if self.arena:
+            x, y = self._ponto_fora_da_vista(rng)
+        else:
+            x, y = self._ponto_na_emenda(rng)
+        
+        return self.criar_asteroide(x, y, tamanho, rng=self.rng_asteroides)
+    
+    def _ponto_na_emenda(self, rng):
+        """
+        Ponto sorteado na emenda das bordas, longe da nave (campo de uma tela)
+        
+        O campo inteiro está na tela, então não há "fora da vista": o
+        asteroide nasce na emenda (x = 0 ou y = 0) mais distante da nave,
+        no quarto dela oposto à nave, e não ao lado dela.
+        """
+        nave = self.nave.pos
+        if min(nave.x, self.largura - nave.x) >= min(nave.y, self.altura - nave.y):
+            # Emenda esquerda/direita
+            x = 0.0
+            y = (nave.y + rng.uniform(0.25, 0.75) * self.altura) % self.altura
+        else:
+            # Emenda de cima/baixo
+            x = (nave.x + rng.uniform(0.25, 0.75) * self.largura) % self.largura
+            y = 0.0
+        return x, y
+    
+    def criar_projetil(self, pos, vel):
+        """
+        Cria um projétil no registro de entidades
+        
+        Args:
+            pos: pygame.math.Vector2 com posição inicial
+            vel: pygame.math.Vector2 com velocidade
+        
+        Returns:
+            ID do projétil (ver Registro)
+        """
+        return self.entidades.criar('projeteis', pos=(pos.x, pos.y), vel=(vel.x, vel.y),
+                                    raio=RAIO_PROJETIL, vida=TEMPO_VIDA_PROJETIL)[0]
+    
+    def criar_asteroide(self, *args, **kwargs):
+        """Asteroide do pool (argumentos de Asteroid), com a sua vez entre os ticks da arena"""
+        asteroide = self.pool_asteroides.obter(*args, **kwargs)
+        asteroide.fase = self.asteroides_criados % DIVISOR_DISTANTE
+        self.asteroides_criados += 1
+        return asteroide
+    
+    def _ponto_fora_da_vista(self, rng):
+        """Ponto sorteado no campo, fora da área vista em volta da nave (arena)"""
+        x = rng.uniform(0, self.largura)
+        y = rng.uniform(0, self.altura)
+        
+        # Dentro da vista (mais a margem do maior asteroide): meia volta no campo
+        margem = Asteroid.TAMANHO_GRANDE * VARIACAO_RAIO[1]
+        dx, dy = self.mundo.delta(self.nave.pos.x, self.nave.pos.y, x, y)
+        if abs(dx) < self.tela[0] / 2 + margem and abs(dy) < self.tela[1] / 2 + margem:
+            x = (x + self.largura / 2) % self.largura
+        return x, y
+    
+    def calcular_dificuldade(self):
+        """Calcula o nível atual baseado na pontuação"""
+        return int(self.pontos // self.curva['pontos_por_nivel']) + 1
+    
+    def get_multiplicador_velocidade(self):
+        """Retorna multiplicador de velocidade baseado no nível"""
+        return 1.0 + (self.nivel - 1) * self.curva['aumento_velocidade']  # +15% por nível
+    
+    def get_intervalo_spawn(self):
+        """Retorna intervalo de spawn baseado no nível"""
+        # Diminui o intervalo, mas nunca menos que o mínimo (1.5 segundos)
+        curva = self.curva
+        return max(curva['intervalo_minimo'], curva['intervalo_spawn'] - (self.nivel - 1) * curva['reducao_intervalo'])
+    
+    def get_max_asteroides(self):
+        """Retorna número máximo de asteroides baseado no nível"""
+        curva = self.curva
+        return min(curva['limite_asteroides'],
+                   curva['max_asteroides'] + (self.nivel - 1) * curva['aumento_max_asteroides'])  # Máximo de 15
+    
+    def step(self, inputs, dt=DT_FIXO):
+        """
+        Avança a simulação em um tick
+        
+        Args:
+            inputs: dict com as teclas de controle ('esquerda', 'direita',
+                'cima', 'espaco') mapeadas para bool
+            dt: Delta time em segundos
+        
+        Returns:
+            list: Eventos ocorridos no tick ('tiro', 'explosao_asteroide',
+                'explosao_nave', 'subiu_nivel', 'game_over')
+        """
+        self.eventos = []
+        self.nave.guardar_estado()
+        
+        if self.estado_jogo == 'jogando':
+            perfilador = self.perfilador
+            self.tempo_jogo += dt
+            self.ticks += 1
+            self._processar_controles(inputs, dt)
+            perfilador.marcar('controles')
+            self._atualizar_entidades(dt)
+            self._atualizar_nivel_e_spawn(dt)
+            perfilador.marcar('spawn')
+            self._checar_colisoes(dt)
+            
+            # Remover mortos (in-place, devolvendo-os aos pools; projéteis pela vida)
+            self.asteroides.compactar()
+            self.entidades.remover_onde('projeteis', self.projeteis.coluna('vida') <= 0)
+            perfilador.marcar('compactar')
+        
+        # Efeitos visuais continuam mesmo no game over
+        self._atualizar_efeitos(dt)
+        
+        return self.eventos
+    
+    def _processar_controles(self, inputs, dt):
+        """Aplica os controles do jogador na nave"""
+        nave = self.nave
+        
+        if inputs.get('esquerda'):
+            nave.rotacionar(-1, dt)
+        if inputs.get('direita'):
+            nave.rotacionar(1, dt)
+        if inputs.get('cima'):
+            nave.acelerar(dt)
+        if inputs.get('espaco'):
+            dados_tiro = nave.shoot()
+            if dados_tiro:
+                self.criar_projetil(dados_tiro['pos'], dados_tiro['vel'])
+                self.eventos.append('tiro')
+    
+    def _atualizar_entidades(self, dt):
+        """Atualiza nave, projéteis e asteroides"""
+        perfilador = self.perfilador
+        self.nave.atualizar(dt)
+        perfilador.marcar('update_nave')
+        
+        atualizar_projeteis(self.projeteis, dt, self.largura, self.altura, self.arena)
+        perfilador.marcar('update_projeteis')
+        
+        if self.arena:
+            self._atualizar_asteroides_arena(dt)
+        else:
+            for asteroide in self.asteroides:
+                asteroide.atualizar(dt, self.largura, self.altura)
+        perfilador.marcar('update_asteroides')
+    
+    def _atualizar_asteroides_arena(self, dt):
+        """
+        Atualiza os asteroides da arena, os distantes em passos maiores
+        
+        Cada asteroide tem a sua vez (fase) a cada DIVISOR_DISTANTE ticks.
+        Na sua vez ele verifica se está além de ALCANCE_ATIVO da nave; se
+        está, anda de uma vez os DIVISOR_DISTANTE ticks seguintes e é
+        pulado até a próxima vez. O tempo de cada asteroide fica exato; só
+        o caminho dos distantes é percorrido em passos maiores.
+        """
+        largura = self.largura
+        altura = self.altura
+        delta = self.mundo.delta
+        nave_x = self.nave.pos.x
+        nave_y = self.nave.pos.y
+        vez = self.ticks % DIVISOR_DISTANTE
+        dt_distante = dt * DIVISOR_DISTANTE
+        
+        for asteroide in self.asteroides:
+            if asteroide.fase != vez:
+                if not asteroide.distante:
+                    asteroide.atualizar(dt, largura, altura)
+                continue
+            
+            dx, dy = delta(nave_x, nave_y, asteroide.pos.x, asteroide.pos.y)
+            asteroide.distante = abs(dx) > ALCANCE_ATIVO or abs(dy) > ALCANCE_ATIVO
+            asteroide.atualizar(dt_distante if asteroide.distante else dt, largura, altura)
+    
+    def _atualizar_nivel_e_spawn(self, dt):
+        """Atualiza o nível e spawna asteroides periodicamente"""
+        nivel_anterior = self.nivel
+        self.nivel = self.calcular_dificuldade()
+        
+        if self.nivel > nivel_anterior and self.nivel > 1:
+            self.eventos.append('subiu_nivel')
+        
+        # Spawnar novos asteroides periodicamente (com dificuldade progressiva)
+        self.tempo_spawn += dt
+        if (self.tempo_spawn >= self.get_intervalo_spawn()
+                and len(self.asteroides) < self.get_max_asteroides()):
+            novo_asteroide = self.spawn_asteroide('grande')
+            # Aplicar multiplicador de velocidade baseado no nível
+            novo_asteroide.vel *= self.get_multiplicador_velocidade()
+            self.asteroides.append(novo_asteroide)
+            self.tempo_spawn = 0
+    
+    def _checar_colisoes(self, dt):
+        """Colisões de projéteis e da nave contra asteroides"""
+        grade = self.grade
+        mundo = self.mundo
+        nave = self.nave
+        perfilador = self.perfilador
+        
+        # Broad-phase: reconstruir a grade com as posições deste tick. Cada
+        # asteroide cobre também o quanto andou no tick (para a colisão
+        # contínua). Distantes da nave (arena) não alcançam nem são alcançados
+        grade.limpar()
+        for asteroide in self.asteroides:
+            if asteroide.distante:
+                continue
+            grade.inserir(asteroide, asteroide.pos, asteroide.raio_colisao + asteroide.vel.length() * dt)
+        perfilador.marcar('colisao_grade')
+        
+        # Colisão: Projéteis vs Asteroides, contínua (trajeto inteiro do tick,
+        # relativo ao movimento de cada asteroide). Projéteis que saíram da
+        # tela ou expiraram neste tick ainda percorreram o trecho até ali.
+        # As colunas viram listas uma vez: floats do Python são mais rápidos
+        # que elementos de array um a um
+        projeteis = self.projeteis
+        vidas = projeteis.coluna('vida')
+        meio_dt = dt / 2
+        for linha, ((x, y), (vx, vy), raio) in enumerate(zip(projeteis.coluna('pos').tolist(),
+                                                              projeteis.coluna('vel').tolist(),
+                                                              projeteis.coluna('raio').tolist())):
+            # Consulta: círculo que envolve o trecho percorrido
+            meio = pygame.math.Vector2(x - vx * meio_dt, y - vy * meio_dt)
+            alcance = math.sqrt(vx * vx + vy * vy) * dt / 2 + raio
+            
+            atingido = None
+            primeiro_contato = 2.0
+            for asteroide in grade.consultar(meio, alcance):
+                if not asteroide.vivo:
+                    continue
+                
+                # Cópia do asteroide do mesmo lado da borda que o projétil
+                centro_x, centro_y = mundo.imagem_proxima(asteroide.pos.x, asteroide.pos.y, x, y)
+                vel_asteroide = asteroide.vel
+                contato = checar_colisao_varrida(
+                    x - (vx - vel_asteroide.x) * dt, y - (vy - vel_asteroide.y) * dt,
+                    x, y, raio,
+                    centro_x, centro_y, asteroide.raio_colisao
+                )
+                if contato is not None and contato < primeiro_contato:
+                    atingido = asteroide
+                    primeiro_contato = contato
+            
+            # O asteroide atingido é o primeiro no caminho do projétil
+            if atingido is not None:
+                vidas[linha] = 0.0
+                self._destruir_asteroide(atingido, dt)
+        perfilador.marcar('colisao_projeteis')
+        
+        # Colisão: Nave vs Asteroides
+        if nave.viva and not self.invencivel:
+            for asteroide in grade.consultar(nave.pos, nave.raio_colisao):
+                if not asteroide.vivo:
+                    continue
+                
+                if mundo.colidem(nave.pos, nave.raio_colisao, asteroide.pos, asteroide.raio_colisao):
+                    # Uma vida por tick: a nave renascida (ou o game over) não é testada de novo
+                    self._destruir_nave()
+                    break
+        perfilador.marcar('colisao_nave')
+    
+    def _destruir_asteroide(self, asteroide, dt):
+        """Destrói um asteroide atingido e os que a reação em cadeia alcançar (dt do tick, para a grade)"""
+        asteroide.vivo = False
+        if self.curva['raio_reacao'] <= 0:
+            self._explodir_asteroide(asteroide, dt)
+            return
+        
+        # Reação em cadeia (busca em largura): a explosão destrói os vizinhos
+        # que alcança e cada vizinho explode também, até geracoes_reacao. A
+        # busca termina antes de fragmentar, então os fragmentos novos não
+        # são alcançados pelas explosões que os criaram.
+        grade = self.grade
+        colidem = self.mundo.colidem
+        raio_reacao = self.curva['raio_reacao']
+        geracoes = self.curva['geracoes_reacao']
+        
+        fila = [(asteroide, 0)]
+        for atual, geracao in fila:  # Cresce durante o laço
+            if geracao >= geracoes:
+                continue
+            alcance = atual.raio_colisao + raio_reacao
+            for vizinho in grade.consultar(atual.pos, alcance):
+                if vizinho.vivo and colidem(atual.pos, alcance, vizinho.pos, vizinho.raio_colisao):
+                    vizinho.vivo = False
+                    fila.append((vizinho, geracao + 1))
+        
+        for atual, _ in fila:
+            self._explodir_asteroide(atual, dt)
+    
+    def _explodir_asteroide(self, asteroide, dt):
+        """Pontua, cria a explosão e fragmenta um asteroide destruído (dt do tick, para a grade)"""
+        # Criar explosão de partículas
+        self.particulas.emitir(
+            asteroide.pos.x,
+            asteroide.pos.y,
+            asteroide.cor,
+            num_particulas=self.particulas_por_explosao,
+            velocidade=100
+        )
+        self.eventos.append('explosao_asteroide')
+        
+        # Adicionar pontos baseado no tamanho e profundidade
+        if asteroide.tamanho_tipo == 'grande':
+            self.pontos += int(20 * asteroide.profundidade)
+        elif asteroide.tamanho_tipo == 'medio':
+            self.pontos += int(50 * asteroide.profundidade)
+        else:  # pequeno
+            self.pontos += int(100 * asteroide.profundidade)
+        
+        # Fragmentar asteroide
+        fragmentos = asteroide.fragmentar(self.criar_asteroide, self.curva['fragmentos'])
+        self.asteroides.extend(fragmentos)
+        
+        # Fragmentos já podem ser atingidos neste mesmo tick
+        for fragmento in fragmentos:
+            self.grade.inserir(fragmento, fragmento.pos,
+                               fragmento.raio_colisao + fragmento.vel.length() * dt)
+    
+    def _destruir_nave(self):
+        """Explode a nave, desconta uma vida e verifica o game over"""
+        nave = self.nave
+        nave.viva = False
+        self.vidas -= 1
+        
+        # Criar explosão da nave (pedaços do triângulo voando)
+        self.ship_debris.extend(criar_explosao_nave(nave, self.pool_debris.obter, self.rng_debris))
+        self.eventos.append('explosao_nave')
+        
+        if self.vidas <= 0:
+            self.estado_jogo = 'game_over'
+            self.pontuacao_final = self.pontos
+            self.eventos.append('game_over')
+        else:
+            # Respawn
+            nave.pos = pygame.math.Vector2(self.largura // 2, self.altura // 2)
+            nave.vel = pygame.math.Vector2(0, 0)
+            nave.viva = True
+            nave.guardar_estado()  # Sem interpolar do ponto da explosão
+    
+    def _atualizar_efeitos(self, dt):
+        """Atualiza partículas e pedaços da nave"""
+        self.particulas.atualizar(dt)
+        self.perfilador.marcar('update_particulas')
+        
+        for debris in self.ship_debris:
+            debris.atualizar(dt)
+        self.ship_debris.compactar()
+        self.perfilador.marcar('update_debris')
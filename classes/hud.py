@@ -0,0 +1,187 @@
+"""
+Classe HUD - Pontuação, vidas, nível, instruções e tela de game over
+"""
+import pygame
+from utils.texto import CacheTexto
+
+
+# Cores do HUD
+COR_TEXTO = (255, 255, 255)
+COR_NIVEL = (255, 200, 100)
+COR_SECUNDARIA = (150, 150, 150)
+COR_FPS = (100, 100, 100)
+
+INSTRUCOES = [
+    "Setas/WASD: Mover",
+    "ESPAÇO: Atirar",
+    "ESC: Sair"
+]
+
+
+def compor_painel(itens):
+    """
+    Junta vários textos já renderizados em uma única Surface
+    
+    Args:
+        itens: Lista de (surface, rect) com a posição de cada texto na tela
+    
+    Returns:
+        tuple: (pygame.Surface com alpha, posição (x, y) do painel na tela)
+    """
+    area = itens[0][1].unionall([rect for _, rect in itens[1:]])
+    painel = pygame.Surface(area.size, pygame.SRCALPHA)
+    
+    for surface, rect in itens:
+        # Textos não se sobrepõem: copiar os pixels (com alpha) sem misturar
+        painel.blit(surface, rect.move(-area.x, -area.y), special_flags=pygame.BLEND_RGBA_MAX)
+    
+    if pygame.display.get_surface() is not None:
+        painel = painel.convert_alpha()
+    return painel, area.topleft
+
+
+class HUD:
+    def __init__(self, largura_tela, altura_tela):
+        """
+        Inicializa o HUD, carregando as fontes uma única vez
+        
+        Args:
+            largura_tela: Largura da tela
+            altura_tela: Altura da tela
+        """
+        self.largura_tela = largura_tela
+        self.altura_tela = altura_tela
+        
+        # Fontes do HUD
+        self.fonte = pygame.font.Font(None, 28)
+        self.fonte_grande = pygame.font.Font(None, 36)
+        
+        # Fontes da tela de game over
+        self.fonte_titulo = pygame.font.Font(None, 72)
+        self.fonte_pontuacao = pygame.font.Font(None, 48)
+        self.fonte_media = pygame.font.Font(None, 32)
+        self.fonte_pequena = pygame.font.Font(None, 24)
+        
+        self.cache = CacheTexto()
+        
+        # Painéis estáticos, compostos uma única vez
+        self.painel_instrucoes = self._criar_painel_instrucoes()
+        self.overlay = self._criar_overlay()
+        
+        # Painel do game over, criado na transição e mantido até o reset
+        self.painel_game_over = None
+        self.pontuacao_painel = None
+        
+        # Retângulos desenhados no último frame (modo de retângulos sujos)
+        self.areas = []
+        
+        # Ajustados pela qualidade: frames entre atualizações dos valores
+        # mostrados (menos textos novos para renderizar) e nome do nível
+        self.intervalo_atualizacao = 1
+        self.frames_valores = 0
+        self.valores = None
+        self.qualidade = None  # None = não mostrar
+    
+    def _criar_painel_instrucoes(self):
+        """Renderiza as linhas de instrução em um único painel"""
+        itens = []
+        y_offset = self.altura_tela - 90
+        for instrucao in INSTRUCOES:
+            surface = self.fonte.render(instrucao, True, COR_SECUNDARIA)
+            itens.append((surface, surface.get_rect(topleft=(10, y_offset))))
+            y_offset += 25
+        return compor_painel(itens)
+    
+    def _criar_overlay(self):
+        """Overlay semi-transparente da tela de game over"""
+        overlay = pygame.Surface((self.largura_tela, self.altura_tela))
+        if pygame.display.get_surface() is not None:
+            overlay = overlay.convert()
+        overlay.fill((0, 0, 0))
+        overlay.set_alpha(200)
+        return overlay
+    
+    def _criar_painel_game_over(self, pontuacao_final):
+        """Renderiza todos os textos do game over em um único painel"""
+        largura = self.largura_tela
+        altura = self.altura_tela
+        
+        textos = [
+            (self.fonte_titulo, "GAME OVER", (255, 100, 100), (largura // 2, altura // 2 - 100)),
+            (self.fonte_pontuacao, f"PONTUAÇÃO FINAL: {pontuacao_final}", (255, 255, 255), (largura // 2, altura // 2 - 20)),
+            (self.fonte_media, "Pressione ENTER para reiniciar", (200, 200, 200), (largura // 2, altura // 2 + 50)),
+            (self.fonte_pequena, "ou ESC para sair", (150, 150, 150), (largura // 2, altura // 2 + 85)),
+            (self.fonte_pequena, "por elen-c-sales", (100, 150, 200), (largura // 2, altura - 40))  # Créditos
+        ]
+        
+        itens = []
+        for fonte, texto, cor, centro in textos:
+            surface = fonte.render(texto, True, cor)
+            itens.append((surface, surface.get_rect(center=centro)))
+        return compor_painel(itens)
+    
+    def desenhar(self, tela, pontos, vidas, nivel, num_asteroides, fps):
+        """
+        Desenha o HUD do jogo
+        
+        Args:
+            tela: Surface do Pygame
+            pontos: Pontuação atual
+            vidas: Vidas restantes
+            nivel: Nível atual
+            num_asteroides: Número de asteroides na tela
+            fps: FPS medido
+        """
+        # Valores congelados entre atualizações: o cache de texto acerta e nada é renderizado
+        self.frames_valores += 1
+        if self.valores is None or self.frames_valores >= self.intervalo_atualizacao:
+            self.valores = (pontos, vidas, nivel, num_asteroides, int(fps))
+            self.frames_valores = 0
+        pontos, vidas, nivel, num_asteroides, fps = self.valores
+        
+        render = self.cache.render
+        fonte = self.fonte
+        painel, posicao = self.painel_instrucoes
+        
+        self.areas = [
+            # Pontos, vidas, nível e asteroides na tela
+            tela.blit(render(self.fonte_grande, f"PONTOS: {pontos}", COR_TEXTO), (10, 10)),
+            tela.blit(render(fonte, f"VIDAS: {vidas}", COR_TEXTO), (10, 50)),
+            tela.blit(render(fonte, f"NÍVEL: {nivel}", COR_NIVEL), (10, 80)),
+            tela.blit(render(fonte, f"Asteroides: {num_asteroides}", COR_SECUNDARIA), (10, 110)),
+            
+            # FPS
+            tela.blit(render(fonte, f"FPS: {fps}", COR_FPS), (self.largura_tela - 100, 10)),
+            
+            # Instruções (painel estático)
+            tela.blit(painel, posicao)
+        ]
+        
+        # Nível de qualidade atual (alinhado à direita, abaixo do FPS)
+        if self.qualidade is not None:
+            texto = render(self.fonte_pequena, f"Qualidade: {self.qualidade}", COR_FPS)
+            self.areas.append(tela.blit(texto, texto.get_rect(topright=(self.largura_tela - 10, 35))))
+    
+    def desenhar_game_over(self, tela, pontuacao_final):
+        """
+        Desenha a tela de game over
+        
+        O overlay e os textos são montados apenas na transição para o
+        game over e reaproveitados até descartar_game_over().
+        
+        Args:
+            tela: Surface do Pygame
+            pontuacao_final: Pontuação ao fim do jogo
+        """
+        if self.painel_game_over is None or self.pontuacao_painel != pontuacao_final:
+            self.painel_game_over = self._criar_painel_game_over(pontuacao_final)
+            self.pontuacao_painel = pontuacao_final
+        
+        self.areas.append(tela.blit(self.overlay, (0, 0)))
+        painel, posicao = self.painel_game_over
+        tela.blit(painel, posicao)
+    
+    def descartar_game_over(self):
+        """Libera o painel de game over (chamado ao reiniciar o jogo)"""
+        self.painel_game_over = None
+        self.pontuacao_painel = None
@@ -0,0 +1,145 @@
+"""
+Classe PainelPerfil - Gráfico de tempo por frame e tabela de fases na tela
+"""
+import pygame
+
+
+COR_FUNDO_PAINEL = (10, 10, 20)
+COR_ORCAMENTO = (255, 255, 255)
+COR_TEXTO = (220, 220, 220)
+
+# Cores das fases no gráfico empilhado (por ordem de aparição da fase)
+CORES_FASES = [
+    (230, 25, 75), (60, 180, 75), (255, 225, 25), (0, 130, 200),
+    (245, 130, 48), (145, 30, 180), (70, 240, 240), (240, 50, 230),
+    (210, 245, 60), (250, 190, 212), (0, 128, 128), (220, 190, 255),
+    (170, 110, 40), (255, 250, 200), (255, 128, 128), (170, 255, 195)
+]
+
+
+class PainelPerfil:
+    def __init__(self, largura_tela, altura_tela, fps_alvo=60, largura_grafico=240, altura_grafico=100):
+        """
+        Inicializa o painel do perfilador
+        
+        O gráfico é uma Surface que rola um pixel para a esquerda a cada
+        frame novo; só a coluna do frame novo é desenhada. A tabela de
+        médias/p99 é renderizada de novo apenas a cada meio segundo.
+        
+        Args:
+            largura_tela: Largura da tela
+            altura_tela: Altura da tela
+            fps_alvo: FPS desejado (define a linha de orçamento do frame)
+            largura_grafico: Largura do gráfico (= número de frames mostrados)
+            altura_grafico: Altura do gráfico em pixels
+        """
+        self.largura_grafico = largura_grafico
+        self.altura_grafico = altura_grafico
+        self.posicao = (largura_tela - largura_grafico - 10, 60)  # Abaixo do FPS e da qualidade
+        
+        # Topo do gráfico = dois orçamentos de frame
+        self.orcamento_ms = 1000.0 / fps_alvo
+        self.pixels_por_ms = altura_grafico / (2 * self.orcamento_ms)
+        self.y_orcamento = altura_grafico - int(self.orcamento_ms * self.pixels_por_ms)
+        
+        self.fonte = pygame.font.Font(None, 18)
+        
+        self.grafico = pygame.Surface((largura_grafico, altura_grafico))
+        if pygame.display.get_surface() is not None:
+            self.grafico = self.grafico.convert()
+        self.grafico.fill(COR_FUNDO_PAINEL)
+        self.grafico.set_alpha(220)
+        
+        self.frames_desenhados = 0  # total_registrado do histórico já no gráfico
+        
+        self.tabela = None
+        self.intervalo_tabela = 30  # Frames entre atualizações da tabela
+        self.frames_tabela = 0
+        self.max_linhas_tabela = 10
+        
+        self.areas = []  # Retângulos desenhados no último frame
+    
+    def _desenhar_coluna(self, x, linha_ms):
+        """Desenha as fases de um frame empilhadas, de baixo para cima"""
+        grafico = self.grafico
+        altura = self.altura_grafico
+        
+        grafico.fill(COR_FUNDO_PAINEL, (x, 0, 1, altura))
+        
+        base = float(altura)
+        for coluna, ms in enumerate(linha_ms):
+            if ms <= 0:
+                continue
+            topo = max(0.0, base - ms * self.pixels_por_ms)
+            y_topo = int(topo)
+            if int(base) > y_topo:
+                grafico.fill(CORES_FASES[coluna % len(CORES_FASES)], (x, y_topo, 1, int(base) - y_topo))
+            base = topo
+            if base <= 0:
+                break
+        
+        grafico.set_at((x, self.y_orcamento), COR_ORCAMENTO)
+    
+    def _atualizar_grafico(self, historico):
+        """Acrescenta ao gráfico os frames registrados desde o último desenho"""
+        novos = min(historico.total_registrado - self.frames_desenhados, self.largura_grafico)
+        if novos <= 0:
+            return
+        
+        self.grafico.scroll(-novos, 0)
+        inicio = self.largura_grafico - novos
+        for indice, linha in enumerate(historico.ultimos(novos).tolist()):
+            self._desenhar_coluna(inicio + indice, linha)
+        
+        self.frames_desenhados = historico.total_registrado
+    
+    def _criar_tabela(self, historico):
+        """Renderiza média e p99 das fases mais lentas"""
+        estatisticas = historico.estatisticas()
+        if not estatisticas:
+            return None
+        
+        cores = {fase: CORES_FASES[coluna % len(CORES_FASES)] for coluna, fase in enumerate(historico.fases)}
+        fases = sorted(estatisticas[:-1], key=lambda linha: linha[1], reverse=True)[:self.max_linhas_tabela]
+        linhas = [("fase", "média", "p99", COR_TEXTO)]
+        linhas += [(fase, f"{media:.2f}", f"{p99:.2f}", cores[fase]) for fase, media, p99 in fases]
+        fase, media, p99 = estatisticas[-1]
+        linhas.append((fase + " (ms)", f"{media:.2f}", f"{p99:.2f}", COR_TEXTO))
+        
+        altura_linha = self.fonte.get_linesize()
+        largura = self.largura_grafico
+        tabela = pygame.Surface((largura, altura_linha * len(linhas) + 8))
+        if pygame.display.get_surface() is not None:
+            tabela = tabela.convert()
+        tabela.fill(COR_FUNDO_PAINEL)
+        tabela.set_alpha(220)
+        
+        y = 4
+        for nome, media, p99, cor in linhas:
+            tabela.blit(self.fonte.render(nome, True, cor), (6, y))
+            superficie = self.fonte.render(media, True, COR_TEXTO)
+            tabela.blit(superficie, superficie.get_rect(topright=(largura - 60, y)))
+            superficie = self.fonte.render(p99, True, COR_TEXTO)
+            tabela.blit(superficie, superficie.get_rect(topright=(largura - 6, y)))
+            y += altura_linha
+        return tabela
+    
+    def desenhar(self, tela, historico):
+        """
+        Desenha o gráfico empilhado e a tabela de fases
+        
+        Args:
+            tela: Surface do Pygame
+            historico: HistoricoFrames com os tempos dos frames
+        """
+        self._atualizar_grafico(historico)
+        
+        self.frames_tabela += 1
+        if self.tabela is None or self.frames_tabela >= self.intervalo_tabela:
+            self.tabela = self._criar_tabela(historico)
+            self.frames_tabela = 0
+        
+        x, y = self.posicao
+        self.areas = [tela.blit(self.grafico, (x, y))]
+        if self.tabela is not None:
+            self.areas.append(tela.blit(self.tabela, (x, y + self.altura_grafico + 4)))
@@ -1,107 +1,168 @@
 """
-Classe Particula - Efeito de explosão
+Classe SistemaParticulas - Efeito de explosão
+
+As partículas são entidades do arquétipo 'particulas' de um Registro
+(entidades/registro.py): colunas NumPy densas, em vez de um objeto Python
+por partícula. As vivas ocupam sempre as linhas [0, len(sistema)).
 """
-import pygame
-import random
 import math
+import numpy as np
+from entidades import sistemas
+from entidades.arquetipos import ARQUETIPOS
+from entidades.registro import Registro
+from utils.sprites import CacheSprites
 
 
-class Particula:
-    def __init__(self, x, y, cor, velocidade_base=100):
+class SistemaParticulas:
+    def __init__(self, capacidade=4096, friccao=0.95 ** 60, semente=None, registro=None):
+        """
+        Inicializa o sistema de partículas
+        
+        Args:
+            capacidade: Número máximo de partículas vivas ao mesmo tempo
+            friccao: Fração da velocidade mantida após 1 s (0.95 por frame a 60 FPS)
+            semente: Semente do gerador aleatório (None = aleatória)
+            registro: Registro com o arquétipo 'particulas' (None = um só
+                para este sistema)
+        """
+        self.capacidade = capacidade
+        self.friccao = friccao
+        self.rng = np.random.default_rng(semente)
+        
+        if registro is None:
+            registro = Registro({'particulas': ARQUETIPOS['particulas']})
+        self.registro = registro
+        self.dados = registro.arquetipos['particulas']
+        self.dados.garantir_capacidade(capacidade)  # Com o limite, as colunas nunca são realocadas
+        
+        self.limite = capacidade  # Orçamento de partículas vivas (ajustado pela qualidade)
+        
+        # Sprites pré-renderizados por (tamanho, cor, alpha) quantizados
+        self.sprites = CacheSprites()
+    
+    def __len__(self):
+        return len(self.dados)
+    
+    def limpar(self):
+        """Remove todas as partículas"""
+        self.registro.limpar('particulas')
+    
+    def emitir(self, x, y, cor, num_particulas=20, velocidade=150):
         """
-        Inicializa uma partícula de explosão
+        Emite uma explosão de partículas de uma vez
         
         Args:
-            x: Posição X inicial
-            y: Posição Y inicial
-            cor: Cor da partícula (RGB)
-            velocidade_base: Velocidade base das partículas
+            x: Posição X da explosão
+            y: Posição Y da explosão
+            cor: Cor base das partículas (RGB)
+            num_particulas: Número de partículas
+            velocidade: Velocidade base das partículas
+        
+        Returns:
+            int: Número de partículas efetivamente emitidas (limitado pelo orçamento)
         """
-        self.pos = pygame.math.Vector2(x, y)
-        
-        # Direção aleatória
-        angulo = random.uniform(0, 2 * math.pi)
-        velocidade = random.uniform(velocidade_base * 0.5, velocidade_base * 1.5)
-        
-        self.vel = pygame.math.Vector2(
-            math.cos(angulo) * velocidade,
-            math.sin(angulo) * velocidade
-        )
-        
-        self.cor = cor
-        self.tamanho = random.randint(2, 4)
-        self.tempo_vida_max = random.uniform(0.3, 0.8)
-        self.tempo_vida = self.tempo_vida_max
-        self.viva = True
+        n = min(num_particulas, self.limite - len(self.dados))
+        if n <= 0:
+            return 0
+        rng = self.rng
+        
+        # Direção e velocidade aleatórias
+        angulos = rng.uniform(0, 2 * math.pi, n)
+        velocidades = rng.uniform(velocidade * 0.5, velocidade * 1.5, n)
+        vel = np.column_stack((np.cos(angulos) * velocidades, np.sin(angulos) * velocidades))
+        
+        # Variação de cor para efeito mais interessante (entre 0-255)
+        variacao = rng.integers(-30, 31, (n, 3))
+        cores = np.clip(np.asarray(cor[:3], dtype=np.int32) + variacao, 0, 255)
+        
+        tamanhos = rng.integers(2, 5, n)
+        vidas = rng.uniform(0.3, 0.8, n)
+        
+        self.registro.criar('particulas', n, pos=(x, y), vel=vel, raio=tamanhos,
+                            vida=vidas, vida_max=vidas, cor=cores)
+        return n
     
     def atualizar(self, dt):
         """
-        Atualiza posição e estado da partícula
+        Atualiza posição e tempo de vida de todas as partículas
         
         Args:
             dt: Delta time em segundos
         """
-        # Atualizar posição
-        self.pos += self.vel * dt
+        dados = self.dados
+        if not len(dados):
+            return
         
-        # Desacelerar (fricção)
-        self.vel *= 0.95
+        sistemas.mover(dados, dt)
+        vel = dados.coluna('vel')
+        vel *= self.friccao ** dt  # Desacelerar (fricção por segundo)
         
-        # Reduzir tempo de vida
-        self.tempo_vida -= dt
-        if self.tempo_vida <= 0:
-            self.viva = False
+        # Mortas saem das colunas; as vivas do fim ocupam os buracos
+        self.registro.remover_onde('particulas', sistemas.envelhecer(dados, dt))
+    
+    def _tamanhos(self):
+        """Tamanho (raio) de cada partícula em pixels inteiros"""
+        return self.dados.coluna('raio').astype(np.int32)
+    
+    def _cantos(self, atraso, camera=None):
+        """Canto superior esquerdo de cada sprite (posição recuada pelo atraso)"""
+        pos = self.dados.coluna('pos')
+        if atraso:
+            pos = pos - self.dados.coluna('vel') * atraso
+        if camera is not None:
+            pos = camera.para_tela(pos)
+        return (pos - self._tamanhos()[:, None]).astype(np.int32)
+    
+    def _visiveis(self, cantos, camera):
+        """Máscara das partículas cujo sprite toca a tela da câmera"""
+        lados = 2 * self._tamanhos()
+        return ((cantos[:, 0] + lados > 0) & (cantos[:, 0] < camera.largura_tela)
+                & (cantos[:, 1] + lados > 0) & (cantos[:, 1] < camera.altura_tela))
     
-    def desenhar(self, tela):
+    def desenhar(self, tela, atraso=0.0, camera=None):
         """
-        Desenha a partícula com fade out
+        Desenha as partículas com fade out
         
         Args:
             tela: Surface do Pygame
+            atraso: Tempo (s) que o desenho está atrás do último passo
+            camera: Camera da arena (None = coordenadas do mundo são as da tela);
+                partículas fora da vista não são desenhadas
         """
-        if not self.viva:
+        dados = self.dados
+        if not len(dados):
             return
         
-        # Calcular alpha baseado no tempo de vida restante
-        alpha = int(255 * (self.tempo_vida / self.tempo_vida_max))
+        # Alpha baseado no tempo de vida restante
+        alphas = 255 * dados.coluna('vida') / dados.coluna('vida_max')
+        tamanhos = self._tamanhos()
+        cores = dados.coluna('cor')
+        cantos = self._cantos(atraso, camera)
         
-        # Garantir que a cor tenha valores inteiros válidos
-        r = int(self.cor[0])
-        g = int(self.cor[1])
-        b = int(self.cor[2])
+        if camera is not None:
+            visiveis = self._visiveis(cantos, camera)
+            alphas, tamanhos, cores, cantos = alphas[visiveis], tamanhos[visiveis], cores[visiveis], cantos[visiveis]
         
-        # Criar surface com alpha
-        particula_surface = pygame.Surface((self.tamanho * 2, self.tamanho * 2), pygame.SRCALPHA)
-        cor_com_alpha = (r, g, b, alpha)
-        pygame.draw.circle(particula_surface, cor_com_alpha, (self.tamanho, self.tamanho), self.tamanho)
-        
-        tela.blit(particula_surface, (int(self.pos.x - self.tamanho), int(self.pos.y - self.tamanho)))
-
-
-def criar_explosao(x, y, cor, num_particulas=20, velocidade=150):
-    """
-    Cria uma explosão de partículas
-    
-    Args:
-        x: Posição X da explosão
-        y: Posição Y da explosão
-        cor: Cor base das partículas
-        num_particulas: Número de partículas a criar
-        velocidade: Velocidade base das partículas
+        chaves = self.sprites.chaves_lote(tamanhos, cores, alphas)
+        self.sprites.desenhar_lote(tela, chaves, cantos.tolist())
     
-    Returns:
-        list: Lista de Particulas
-    """
-    particulas = []
-    
-    for _ in range(num_particulas):
-        # Variação de cor para efeito mais interessante
-        # Garantir que valores fiquem entre 0-255
-        cor_variada = (
-            max(0, min(255, int(cor[0]) + random.randint(-30, 30))),
-            max(0, min(255, int(cor[1]) + random.randint(-30, 30))),
-            max(0, min(255, int(cor[2]) + random.randint(-30, 30)))
-        )
-        particulas.append(Particula(x, y, cor_variada, velocidade))
-    
-    return particulas
+    def areas(self, atraso=0.0, camera=None):
+        """
+        Retângulos ocupados pelos sprites das partículas (mesmas posições de desenhar)
+        
+        Args:
+            atraso: O mesmo atraso passado a desenhar()
+            camera: A mesma câmera passada a desenhar()
+        
+        Returns:
+            list: [x, y, largura, altura] de cada partícula desenhada
+        """
+        if not len(self.dados):
+            return []
+        
+        lados = 2 * self._tamanhos()
+        cantos = self._cantos(atraso, camera)
+        if camera is not None:
+            visiveis = self._visiveis(cantos, camera)
+            lados, cantos = lados[visiveis], cantos[visiveis]
+        return np.column_stack((cantos, lados, lados)).tolist()
@@ -20,13 +20,18 @@ class Ship:
         self.vel = pygame.math.Vector2(0, 0)
         self.angulo = 0  # Em graus, 0 = apontando para cima
         
+        # Pose no início do último passo da simulação (para interpolar o desenho)
+        self.pos_anterior = pygame.math.Vector2(x, y)
+        self.angulo_anterior = 0
+        self.dt_passo = 0.0
+        
         self.largura_tela = largura_tela
         self.altura_tela = altura_tela
         
         # Configurações de física
         self.aceleracao_thrust = 200  # pixels/s²
         self.velocidade_rotacao = 180  # graus/s
-        self.friccao = 0.98  # Multiplicador de velocidade (inércia)
+        self.friccao = 0.98 ** 60  # Fração da velocidade mantida após 1 s (0.98 por frame a 60 FPS)
         self.vel_maxima = 300  # pixels/s
         
         # Configurações visuais
@@ -82,6 +87,11 @@ class Ship:
         if self.vel.length() > self.vel_maxima:
             self.vel.scale_to_length(self.vel_maxima)
     
+    def guardar_estado(self):
+        """Guarda a pose atual como a do passo anterior (início de cada passo e teleportes)"""
+        self.pos_anterior.update(self.pos)
+        self.angulo_anterior = self.angulo
+    
     def atualizar(self, dt):
         """
         Atualiza posição e estado da nave
@@ -89,8 +99,10 @@ class Ship:
         Args:
             dt: Delta time em segundos
         """
-        # Aplicar fricção (inércia)
-        self.vel *= self.friccao
+        self.dt_passo = dt
+        
+        # Aplicar fricção (inércia), por segundo: igual em qualquer taxa de passos
+        self.vel *= self.friccao ** dt
         
         # Atualizar posição
         self.pos += self.vel * dt
@@ -105,25 +117,50 @@ class Ship:
                 self.pode_atirar = True
     
     def check_bounds(self):
-        """Screen wrapping - aparecer do outro lado quando sair da tela"""
-        if self.pos.x > self.largura_tela:
-            self.pos.x = 0
-        elif self.pos.x < 0:
-            self.pos.x = self.largura_tela
-            
-        if self.pos.y > self.altura_tela:
-            self.pos.y = 0
-        elif self.pos.y < 0:
-            self.pos.y = self.altura_tela
+        """Mundo toroidal: continuar do outro lado ao sair da tela"""
+        pos = self.pos
+        if not 0 <= pos.x < self.largura_tela:
+            pos.x %= self.largura_tela
+        if not 0 <= pos.y < self.altura_tela:
+            pos.y %= self.altura_tela
     
-    def get_pontos_rotacionados(self):
+    def pose(self, atraso=0.0):
+        """
+        Posição e ângulo para desenhar, interpolados entre o passo anterior e o atual
+        
+        Args:
+            atraso: Tempo (s) que o desenho está atrás do último passo
+        
+        Returns:
+            tuple: (x, y, angulo)
+        """
+        if atraso <= 0 or self.dt_passo <= 0:
+            return self.pos.x, self.pos.y, self.angulo
+        
+        anterior = self.pos_anterior
+        dx = self.pos.x - anterior.x
+        dy = self.pos.y - anterior.y
+        
+        # Atravessou a borda da tela no passo: desenhar já do outro lado
+        if abs(dx) > self.largura_tela / 2 or abs(dy) > self.altura_tela / 2:
+            return self.pos.x, self.pos.y, self.angulo
+        
+        alfa = max(0.0, 1.0 - atraso / self.dt_passo)
+        giro = (self.angulo - self.angulo_anterior + 180) % 360 - 180  # Caminho curto entre 359° e 0°
+        return anterior.x + dx * alfa, anterior.y + dy * alfa, self.angulo_anterior + giro * alfa
+    
+    def get_pontos_rotacionados(self, atraso=0.0):
         """
         Retorna os pontos da nave rotacionados para desenhar
         
+        Args:
+            atraso: Tempo (s) que o desenho está atrás do último passo
+        
         Returns:
             list: Lista de pontos (x, y) para desenhar o polígono
         """
-        angulo_rad = math.radians(self.angulo)
+        x, y, angulo = self.pose(atraso)
+        angulo_rad = math.radians(angulo)
         pontos_rotacionados = []
         
         for ponto in self.forma_base:
@@ -132,8 +169,8 @@ class Ship:
             y_rot = ponto.x * math.sin(angulo_rad) + ponto.y * math.cos(angulo_rad)
             
             # Adicionar posição da nave
-            x_final = self.pos.x + x_rot
-            y_final = self.pos.y + y_rot
+            x_final = x + x_rot
+            y_final = y + y_rot
             
             pontos_rotacionados.append((x_final, y_final))
         
@@ -188,35 +225,78 @@ class Ship:
             'angulo': self.angulo
         }
     
-    def desenhar(self, tela):
+    def desenhar(self, tela, atraso=0.0, espessura=2, antialias=False, mundo=None, camera=None):
         """
         Desenha a nave na tela
         
         Args:
             tela: Surface do Pygame
+            atraso: Tempo (s) que o desenho está atrás do último passo
+            espessura: Espessura do contorno em pixels
+            antialias: Contorno suavizado de 1 pixel (ignora a espessura)
+            mundo: MundoToroidal (None = sem cópia do outro lado das bordas)
+            camera: Camera da arena (None = coordenadas do mundo são as da tela)
+        
+        Returns:
+            pygame.Rect: Área alterada na tela (None se não desenhou)
         """
         if not self.viva:
-            return
+            return None
         
-        pontos = self.get_pontos_rotacionados()
+        pontos = self._na_tela(self.get_pontos_rotacionados(atraso), atraso, camera)
+        if pontos is None:
+            return None
         
         # Desenhar nave (wireframe)
-        pygame.draw.polygon(tela, self.cor, pontos, 2)
+        area = self._desenhar_contorno(tela, pontos, espessura, antialias)
+        
+        # Perto de uma borda: a parte que passou aparece do outro lado
+        if mundo is not None:
+            x, y, _ = self.pose(atraso)
+            for dx, dy in mundo.fantasmas(x, y, self.tamanho + espessura):
+                copia = [(px + dx, py + dy) for px, py in pontos]
+                area = area.union(self._desenhar_contorno(tela, copia, espessura, antialias))
         
         # Desenhar círculo de colisão (debug - opcional)
         # pygame.draw.circle(tela, (255, 0, 0), (int(self.pos.x), int(self.pos.y)), self.raio_colisao, 1)
+        
+        return area
+    
+    def _na_tela(self, pontos, atraso, camera):
+        """Leva pontos desenhados em volta da nave para a tela da câmera (None = fora da vista)"""
+        if camera is None:
+            return pontos
+        x, y, _ = self.pose(atraso)
+        deslocamento = camera.deslocamento(x, y, self.tamanho)
+        if deslocamento is None:
+            return None
+        dx, dy = deslocamento
+        return [(px + dx, py + dy) for px, py in pontos]
     
-    def desenhar_thrust(self, tela):
+    def _desenhar_contorno(self, tela, pontos, espessura, antialias):
+        """Desenha o contorno da nave e retorna a área alterada"""
+        if antialias:
+            return pygame.draw.aalines(tela, self.cor, True, pontos)
+        return pygame.draw.polygon(tela, self.cor, pontos, espessura)
+    
+    def desenhar_thrust(self, tela, atraso=0.0, mundo=None, camera=None):
         """
         Desenha efeito visual de thrust (chama do motor)
         
         Args:
             tela: Surface do Pygame
+            atraso: Tempo (s) que o desenho está atrás do último passo
+            mundo: MundoToroidal (None = sem cópia do outro lado das bordas)
+            camera: Camera da arena (None = coordenadas do mundo são as da tela)
+        
+        Returns:
+            pygame.Rect: Área alterada na tela (None se não desenhou)
         """
         if not self.viva:
-            return
+            return None
         
-        angulo_rad = math.radians(self.angulo)
+        x, y, angulo = self.pose(atraso)
+        angulo_rad = math.radians(angulo)
         
         # Pontos da base da nave (de onde sai o thrust)
         base_esquerda = self.forma_base[1]
@@ -227,7 +307,7 @@ class Ship:
         for ponto in [base_esquerda, base_direita]:
             x_rot = ponto.x * math.cos(angulo_rad) - ponto.y * math.sin(angulo_rad)
             y_rot = ponto.x * math.sin(angulo_rad) + ponto.y * math.cos(angulo_rad)
-            pontos_base.append((self.pos.x + x_rot, self.pos.y + y_rot))
+            pontos_base.append((x + x_rot, y + y_rot))
         
         # Ponto da chama (atrás da nave)
         comprimento_chama = self.tamanho * 0.8
@@ -236,9 +316,20 @@ class Ship:
         x_chama = chama_offset.x * math.cos(angulo_rad) - chama_offset.y * math.sin(angulo_rad)
         y_chama = chama_offset.x * math.sin(angulo_rad) + chama_offset.y * math.cos(angulo_rad)
         
-        ponto_chama = (self.pos.x + x_chama, self.pos.y + y_chama)
+        ponto_chama = (x + x_chama, y + y_chama)
         
         # Desenhar triângulo da chama
-        pontos_chama = [pontos_base[0], ponto_chama, pontos_base[1]]
-        pygame.draw.polygon(tela, (255, 150, 0), pontos_chama, 0)  # Laranja
-        pygame.draw.polygon(tela, (255, 255, 0), pontos_chama, 1)  # Contorno amarelo
+        pontos_chama = self._na_tela([pontos_base[0], ponto_chama, pontos_base[1]], atraso, camera)
+        if pontos_chama is None:
+            return None
+        area = self._desenhar_chama(tela, pontos_chama)
+        
+        if mundo is not None:
+            for dx, dy in mundo.fantasmas(x, y, self.tamanho + 1):  # A chama fica dentro do raio da nave
+                area = area.union(self._desenhar_chama(tela, [(px + dx, py + dy) for px, py in pontos_chama]))
+        return area
+    
+    def _desenhar_chama(self, tela, pontos_chama):
+        """Desenha o triângulo da chama e retorna a área alterada"""
+        area = pygame.draw.polygon(tela, (255, 150, 0), pontos_chama, 0)  # Laranja
+        return area.union(pygame.draw.polygon(tela, (255, 255, 0), pontos_chama, 1))  # Contorno amarelo
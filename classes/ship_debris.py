@@ -4,10 +4,16 @@ Classe ShipDebris - Pedaços da nave (debris) quando explode
 import pygame
 import random
 import math
+from utils.cores import tabela_fade, quantizar_fade
 
 
 class ShipDebris:
-    def __init__(self, x, y, pontos_linha, angulo_nave):
+    __slots__ = ('pos', 'ponto1', 'ponto2', 'vel', 'angulo', 'vel_rotacao', 'cor', 'tabela_fade',
+                 'tempo_vida_max', 'tempo_vida', 'viva')
+    
+    FRICCAO = 0.97 ** 60  # Fração da velocidade mantida após 1 s (0.97 por frame a 60 FPS)
+    
+    def __init__(self, x, y, pontos_linha, angulo_nave, rng=None):
         """
         Inicializa um pedaço (linha) da nave explodida
         
@@ -16,27 +22,42 @@ class ShipDebris:
             y: Posição Y inicial
             pontos_linha: Tupla com (ponto1, ponto2) - os dois vértices da linha
             angulo_nave: Ângulo da nave no momento da explosão
+            rng: random.Random da velocidade e rotação (None = módulo random)
         """
-        self.pos = pygame.math.Vector2(x, y)
+        self.pos = pygame.math.Vector2()
+        self.ponto1 = pygame.math.Vector2()
+        self.ponto2 = pygame.math.Vector2()
+        self.vel = pygame.math.Vector2()
+        
+        self.cor = (255, 255, 255)  # Branco
+        self.tabela_fade = tabela_fade(self.cor)  # Cores pré-calculadas do fade out
+        self.tempo_vida_max = 1.0
+        
+        self.resetar(x, y, pontos_linha, angulo_nave, rng)
+    
+    def resetar(self, x, y, pontos_linha, angulo_nave, rng=None):
+        """Reinicializa o pedaço para reuso (mesmos argumentos do construtor)"""
+        if rng is None:
+            rng = random
+        
+        self.pos.update(x, y)
         
         # Armazenar os pontos da linha em coordenadas locais
-        self.ponto1 = pygame.math.Vector2(pontos_linha[0])
-        self.ponto2 = pygame.math.Vector2(pontos_linha[1])
+        self.ponto1.update(pontos_linha[0])
+        self.ponto2.update(pontos_linha[1])
         
         # Velocidade aleatória para esse pedaço
-        angulo = random.uniform(0, 2 * math.pi)
-        velocidade = random.uniform(80, 150)
-        self.vel = pygame.math.Vector2(
+        angulo = rng.uniform(0, 2 * math.pi)
+        velocidade = rng.uniform(80, 150)
+        self.vel.update(
             math.cos(angulo) * velocidade,
             math.sin(angulo) * velocidade
         )
         
         # Rotação do pedaço
         self.angulo = angulo_nave
-        self.vel_rotacao = random.uniform(-5, 5)
+        self.vel_rotacao = rng.uniform(-5, 5)
         
-        self.cor = (255, 255, 255)  # Branco
-        self.tempo_vida_max = 1.0
         self.tempo_vida = self.tempo_vida_max
         self.viva = True
     
@@ -44,52 +65,79 @@ class ShipDebris:
         """Atualiza posição e rotação do debris"""
         self.pos += self.vel * dt
         self.angulo += self.vel_rotacao * dt
-        self.vel *= 0.97  # Desacelerar
+        self.vel *= self.FRICCAO ** dt  # Desacelerar
         
         self.tempo_vida -= dt
         if self.tempo_vida <= 0:
             self.viva = False
     
-    def desenhar(self, tela):
-        """Desenha o pedaço da nave"""
+    def desenhar(self, tela, atraso=0.0, espessura=2, antialias=False, camera=None):
+        """
+        Desenha o pedaço da nave
+        
+        Args:
+            tela: Surface do Pygame
+            atraso: Tempo (s) que o desenho está atrás do último passo
+            espessura: Espessura da linha em pixels
+            antialias: Linha suavizada de 1 pixel (ignora a espessura)
+            camera: Camera da arena (None = coordenadas do mundo são as da tela)
+        
+        Returns:
+            pygame.Rect: Área alterada na tela (None se não desenhou)
+        """
         if not self.viva:
-            return
+            return None
+        
+        # Pose interpolada: recua pela velocidade o tempo de atraso
+        pos_x = self.pos.x - self.vel.x * atraso
+        pos_y = self.pos.y - self.vel.y * atraso
+        if camera is not None:
+            raio = max(self.ponto1.length(), self.ponto2.length())
+            deslocamento = camera.deslocamento(pos_x, pos_y, raio)
+            if deslocamento is None:
+                return None
+            pos_x += deslocamento[0]
+            pos_y += deslocamento[1]
         
         # Calcular alpha para fade out
         alpha_factor = self.tempo_vida / self.tempo_vida_max
         
         # Rotacionar e transladar os pontos
-        angulo_rad = math.radians(self.angulo)
+        angulo_rad = math.radians(self.angulo - self.vel_rotacao * atraso)
         cos_a = math.cos(angulo_rad)
         sin_a = math.sin(angulo_rad)
         
         # Ponto 1 rotacionado
-        x1 = self.ponto1.x * cos_a - self.ponto1.y * sin_a + self.pos.x
-        y1 = self.ponto1.x * sin_a + self.ponto1.y * cos_a + self.pos.y
+        x1 = self.ponto1.x * cos_a - self.ponto1.y * sin_a + pos_x
+        y1 = self.ponto1.x * sin_a + self.ponto1.y * cos_a + pos_y
         
         # Ponto 2 rotacionado
-        x2 = self.ponto2.x * cos_a - self.ponto2.y * sin_a + self.pos.x
-        y2 = self.ponto2.x * sin_a + self.ponto2.y * cos_a + self.pos.y
+        x2 = self.ponto2.x * cos_a - self.ponto2.y * sin_a + pos_x
+        y2 = self.ponto2.x * sin_a + self.ponto2.y * cos_a + pos_y
         
-        # Desenhar a linha com fade (ajustando cor)
-        if alpha_factor < 1.0:
-            cor = tuple(int(c * alpha_factor) for c in self.cor)
-        else:
-            cor = self.cor
+        # Desenhar a linha com fade (cor quantizada da tabela)
+        cor = self.tabela_fade[quantizar_fade(alpha_factor)]
         
-        pygame.draw.line(tela, cor, (int(x1), int(y1)), (int(x2), int(y2)), 2)
+        if antialias:
+            return pygame.draw.aaline(tela, cor, (x1, y1), (x2, y2))
+        return pygame.draw.line(tela, cor, (int(x1), int(y1)), (int(x2), int(y2)), espessura)
 
 
-def criar_explosao_nave(nave):
+def criar_explosao_nave(nave, criar=None, rng=None):
     """
     Cria os pedaços da nave explodida
     
     Args:
         nave: Objeto Ship
+        criar: Fábrica dos pedaços, ex.: Pool.obter (None = ShipDebris)
+        rng: random.Random dos pedaços (None = módulo random)
     
     Returns:
         list: Lista de ShipDebris
     """
+    if criar is None:
+        criar = ShipDebris
+    
     debris_list = []
     
     # Pegar os 3 pontos do triângulo da nave
@@ -104,7 +152,7 @@ def criar_explosao_nave(nave):
     
     # Criar um debris para cada linha
     for linha in linhas:
-        debris = ShipDebris(nave.pos.x, nave.pos.y, linha, nave.angulo)
+        debris = criar(nave.pos.x, nave.pos.y, linha, nave.angulo, rng)
         debris_list.append(debris)
     
     return debris_list
@@ -7,7 +7,7 @@ from utils.cores import interpolar_cor
 
 
 class Star:
-    def __init__(self, x, y, profundidade, largura_tela=800, altura_tela=600):
+    def __init__(self, x, y, profundidade, largura_tela=800, altura_tela=600, rng=None):
         """
         Inicializa uma estrela com efeito de profundidade
         
@@ -17,19 +17,21 @@ class Star:
             profundidade: float de 0.2 a 0.8 (quanto maior, mais próxima)
             largura_tela: Largura da tela para wrap-around
             altura_tela: Altura da tela para wrap-around
+            rng: random.Random do tamanho e do reposicionamento (None = módulo random)
         """
         self.x = x
         self.y = y
         self.profundidade = profundidade
         self.largura_tela = largura_tela
         self.altura_tela = altura_tela
+        self.rng = rng if rng is not None else random
         
         # Tamanho baseado em profundidade
         # Estrelas distantes: 1px, Estrelas próximas: 2px
         if self.profundidade < 0.5:
             self.tamanho = 1
         else:
-            self.tamanho = 2 if random.random() > 0.7 else 1
+            self.tamanho = 2 if self.rng.random() > 0.7 else 1
         
         # Cor interpolada (azul escuro -> branco)
         self.cor = interpolar_cor(profundidade)
@@ -60,10 +62,10 @@ class Star:
         # Wrap-around: Se sair pela parte inferior, reaparece no topo
         if self.y > self.altura_tela:
             self.y = 0
-            self.x = random.randint(0, self.largura_tela)
+            self.x = self.rng.randint(0, self.largura_tela)
         elif self.y < 0:
             self.y = self.altura_tela
-            self.x = random.randint(0, self.largura_tela)
+            self.x = self.rng.randint(0, self.largura_tela)
         
         # Wrap horizontal (para o efeito paralaxe)
         if self.x > self.largura_tela:
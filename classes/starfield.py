@@ -0,0 +1,230 @@
+"""
+Classe CampoEstrelas - Fundo estrelado em camadas de paralaxe pré-renderizadas
+"""
+import pygame
+import random
+from bisect import bisect_right
+
+
+# Cor usada como transparente (colorkey) nas camadas; nenhuma estrela é preta
+COR_TRANSPARENTE = (0, 0, 0)
+
+
+class CamadaEstrelas:
+    # Cada camada é dividida em faixas horizontais, para que reposicionar uma
+    # estrela só precise recodificar (RLE) a faixa dela, e não a tela toda
+    NUM_FAIXAS = 8
+    
+    def __init__(self, estrelas, profundidade, largura_tela, altura_tela, rng=None):
+        """
+        Inicializa uma camada de estrelas de profundidade parecida
+        
+        Args:
+            estrelas: Lista de Star pertencentes a esta faixa de profundidade
+            profundidade: Profundidade média da faixa
+            largura_tela: Largura da tela
+            altura_tela: Altura da tela
+            rng: random.Random do reposicionamento das estrelas (None = módulo random)
+        """
+        self.profundidade = profundidade
+        self.rng = rng if rng is not None else random
+        self.largura_tela = largura_tela
+        self.altura_tela = altura_tela
+        
+        # Mesmas velocidades de Star.atualizar, pela profundidade média da faixa
+        self.velocidade = 3 * profundidade
+        self.fator_paralaxe = profundidade * 0.3
+        
+        # Deslocamento da camada na tela (sempre entre 0 e largura/altura)
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.repinturas = 0  # Conta as estrelas reposicionadas (mudam as faixas)
+        
+        # Estrelas ordenadas pelo deslocamento vertical em que cruzam a borda da tela
+        self.estrelas = sorted(estrelas, key=self._limite_wrap)
+        self.limites = [self._limite_wrap(estrela) for estrela in self.estrelas]
+        
+        self.altura_faixa = -(-altura_tela // self.NUM_FAIXAS)
+        self.faixas = []
+        for _ in range(self.NUM_FAIXAS):
+            faixa = pygame.Surface((largura_tela, self.altura_faixa))
+            if pygame.display.get_surface() is not None:
+                faixa = faixa.convert()
+            faixa.fill(COR_TRANSPARENTE)
+            self.faixas.append(faixa)
+        
+        for estrela in self.estrelas:
+            self._pintar(estrela, estrela.cor)
+        
+        for faixa in self.faixas:
+            faixa.set_colorkey(COR_TRANSPARENTE, pygame.RLEACCEL)
+    
+    def _limite_wrap(self, estrela):
+        """Valor de offset_y em que a estrela cruza a borda inferior/superior"""
+        return (self.altura_tela - estrela.y) % self.altura_tela
+    
+    def _pintar(self, estrela, cor):
+        """Desenha (ou apaga, com COR_TRANSPARENTE) uma estrela nas faixas que ela toca"""
+        x = int(estrela.x)
+        y = int(estrela.y)
+        tamanho = estrela.tamanho
+        altura_faixa = self.altura_faixa
+        
+        primeira = max(0, (y - tamanho) // altura_faixa)
+        ultima = min(self.NUM_FAIXAS - 1, (y + tamanho) // altura_faixa)
+        for indice in range(primeira, ultima + 1):
+            pygame.draw.circle(self.faixas[indice], cor, (x, y - indice * altura_faixa), tamanho)
+    
+    def atualizar(self, dt, vel_nave=None):
+        """
+        Rola a camada (scroll vertical lento e paralaxe com a nave)
+        
+        Args:
+            dt: Delta time em segundos
+            vel_nave: pygame.math.Vector2 com velocidade da nave (opcional)
+        """
+        dy = self.velocidade * dt
+        dx = 0.0
+        if vel_nave:
+            dx = -vel_nave.x * self.fator_paralaxe * dt
+            dy -= vel_nave.y * self.fator_paralaxe * dt
+        
+        self.offset_x = (self.offset_x + dx) % self.largura_tela
+        
+        offset_anterior = self.offset_y
+        self.offset_y = (self.offset_y + dy) % self.altura_tela
+        if dy:
+            self._reposicionar_estrelas(offset_anterior, self.offset_y, dy > 0)
+    
+    def _reposicionar_estrelas(self, inicio, fim, descendo):
+        """
+        Estrelas que cruzaram a borda vertical reaparecem em um X aleatório
+        (mesmo comportamento de Star.atualizar)
+        """
+        if descendo:
+            cruzaram = self._estrelas_entre(inicio, fim)
+        else:
+            cruzaram = self._estrelas_entre(fim, inicio)
+        
+        for estrela in cruzaram:
+            self._pintar(estrela, COR_TRANSPARENTE)
+            
+            # X aleatório na tela, convertido para a coordenada local da camada
+            x_tela = self.rng.randint(0, self.largura_tela)
+            estrela.x = (x_tela - self.offset_x) % self.largura_tela
+            self._pintar(estrela, estrela.cor)
+            self.repinturas += 1
+    
+    def _estrelas_entre(self, inicio, fim):
+        """Estrelas com limite de wrap no intervalo (inicio, fim], circular"""
+        limites = self.limites
+        a = bisect_right(limites, inicio)
+        b = bisect_right(limites, fim)
+        
+        if inicio <= fim:
+            return self.estrelas[a:b]
+        return self.estrelas[a:] + self.estrelas[:b]
+    
+    def assinatura(self):
+        """Deslocamento em pixels inteiros (só muda quando a camada se move na tela)"""
+        return (int(self.offset_x), int(self.offset_y), self.repinturas)
+    
+    def desenhar(self, tela):
+        """
+        Desenha a camada com wrap-around horizontal e vertical
+        
+        Args:
+            tela: Surface do Pygame
+        """
+        largura = self.largura_tela
+        altura = self.altura_tela
+        altura_faixa = self.altura_faixa
+        x = int(self.offset_x)
+        offset_y = int(self.offset_y)
+        
+        blits = []
+        for indice, faixa in enumerate(self.faixas):
+            y = (indice * altura_faixa + offset_y) % altura
+            blits.append((faixa, (x, y)))
+            if x:
+                blits.append((faixa, (x - largura, y)))
+            
+            # Faixa atravessando a borda inferior também aparece no topo
+            if y + altura_faixa > altura:
+                blits.append((faixa, (x, y - altura)))
+                if x:
+                    blits.append((faixa, (x - largura, y - altura)))
+        
+        tela.blits(blits, False)
+
+
+class CampoEstrelas:
+    def __init__(self, estrelas, largura_tela, altura_tela, num_camadas=4, prof_min=0.15, prof_max=0.75, rng=None):
+        """
+        Agrupa as estrelas em camadas por faixa de profundidade
+        
+        Cada camada é pré-renderizada em uma Surface e rolada inteira pelo
+        seu deslocamento de paralaxe, em vez de desenhar cada estrela a
+        cada frame.
+        
+        Args:
+            estrelas: Lista de Star
+            largura_tela: Largura da tela
+            altura_tela: Altura da tela
+            num_camadas: Número de faixas de profundidade
+            prof_min: Profundidade mínima das estrelas
+            prof_max: Profundidade máxima das estrelas
+            rng: random.Random do reposicionamento das estrelas (None = módulo random)
+        """
+        largura_faixa = (prof_max - prof_min) / num_camadas
+        
+        faixas = [[] for _ in range(num_camadas)]
+        for estrela in estrelas:
+            indice = int((estrela.profundidade - prof_min) / largura_faixa)
+            faixas[max(0, min(num_camadas - 1, indice))].append(estrela)
+        
+        # Camadas distantes primeiro (ordem de desenho)
+        self.camadas = []
+        for indice, faixa in enumerate(faixas):
+            if not faixa:
+                continue
+            profundidade = prof_min + largura_faixa * (indice + 0.5)
+            self.camadas.append(CamadaEstrelas(faixa, profundidade, largura_tela, altura_tela, rng))
+        
+        # Quantas camadas desenhar, das mais próximas para trás (ajustado pela qualidade)
+        self.camadas_visiveis = len(self.camadas)
+    
+    def _visiveis(self):
+        """Camadas desenhadas: as `camadas_visiveis` mais próximas"""
+        return self.camadas[max(0, len(self.camadas) - self.camadas_visiveis):]
+    
+    def atualizar(self, dt, vel_nave=None):
+        """
+        Atualiza o deslocamento de todas as camadas (também das ocultas,
+        para que reapareçam no lugar certo)
+        
+        Args:
+            dt: Delta time em segundos
+            vel_nave: pygame.math.Vector2 com velocidade da nave (opcional)
+        """
+        for camada in self.camadas:
+            camada.atualizar(dt, vel_nave)
+    
+    def assinatura(self):
+        """
+        Valor que muda sempre que o desenho do campo muda
+        
+        Returns:
+            tuple: Deslocamentos inteiros e repinturas de cada camada visível
+        """
+        return tuple(camada.assinatura() for camada in self._visiveis())
+    
+    def desenhar(self, tela):
+        """
+        Desenha as camadas visíveis, das mais distantes para as mais próximas
+        
+        Args:
+            tela: Surface do Pygame
+        """
+        for camada in self._visiveis():
+            camada.desenhar(tela)
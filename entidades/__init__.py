@@ -0,0 +1 @@
+# Registro de entidades do Asteroids 3D (IDs com geração e colunas por arquétipo)
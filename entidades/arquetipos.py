@@ -0,0 +1,33 @@
+"""
+Colunas de cada arquétipo de entidade do jogo
+
+Todo arquétipo tem posição, velocidade, raio, profundidade e tempo de
+vida; os sistemas de entidades/sistemas.py trabalham sobre essas colunas
+em qualquer arquétipo: projéteis (classes/bullet.py) e partículas
+(classes/particula.py).
+
+Asteroides e destroços da nave ainda não estão aqui: continuam objetos
+com pool (utils/pool.py). GradeEspacial, calcular_contornos, os agentes e
+o hash do replay trabalham sobre esses objetos, e passá-los para colunas
+é uma mudança à parte.
+"""
+import numpy as np
+
+
+# Coluna -> (largura, dtype, padrão); largura 1 = escalar
+COLUNAS_BASE = {
+    'pos': (2, np.float64, 0.0),
+    'vel': (2, np.float64, 0.0),
+    'raio': (1, np.float64, 0.0),
+    'profundidade': (1, np.float64, 1.0),  # 1.0 = plano da nave
+    'vida': (1, np.float64, np.inf),  # Segundos restantes (inf = sem prazo; <= 0 = morta)
+}
+
+ARQUETIPOS = {
+    'projeteis': dict(COLUNAS_BASE),
+    'particulas': {
+        **COLUNAS_BASE,
+        'vida_max': (1, np.float64, 1.0),  # Para o fade out
+        'cor': (3, np.uint8, 0),
+    },
+}
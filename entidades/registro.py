@@ -0,0 +1,328 @@
+"""
+Registro de entidades: IDs com geração e colunas densas por arquétipo
+
+Cada arquétipo guarda as suas entidades em colunas NumPy densas: as
+linhas [0, quantidade) são as entidades vivas, sem buracos, e os sistemas
+percorrem colunas inteiras em vez de objetos. Fora das colunas, uma
+entidade é conhecida pelo seu ID, que vale enquanto ela vive. Removida a
+entidade, o ID deixa de valer, mesmo que o seu índice e a sua linha sejam
+reaproveitados por outra.
+"""
+import numpy as np
+
+
+BITS_INDICE = 32  # ID = geração << BITS_INDICE | índice
+MASCARA_INDICE = (1 << BITS_INDICE) - 1
+
+
+class Arquetipo:
+    def __init__(self, nome, colunas, capacidade=64):
+        """
+        Colunas densas das entidades de um tipo
+        
+        As colunas dobram de tamanho quando enchem; quem guardou uma coluna
+        deve pedi-la de novo com coluna() depois de criar entidades.
+        
+        Args:
+            nome: Nome do arquétipo
+            colunas: dict nome -> (largura, dtype, padrão); largura 1 = escalar,
+                2 = vetor (x, y)...
+            capacidade: Linhas reservadas de início
+        """
+        self.nome = nome
+        self.esquema = dict(colunas)
+        self.quantidade = 0
+        self.capacidade = 0
+        self.ids = np.zeros(0, dtype=np.int64)  # ID da entidade de cada linha
+        self.dados = {
+            coluna: np.zeros((0,) if largura == 1 else (0, largura), dtype=dtype)
+            for coluna, (largura, dtype, _) in self.esquema.items()
+        }
+        self.garantir_capacidade(capacidade)
+    
+    def __len__(self):
+        return self.quantidade
+    
+    def coluna(self, nome):
+        """
+        Coluna nas linhas vivas
+        
+        Args:
+            nome: Nome da coluna
+        
+        Returns:
+            np.ndarray: Vista (sem cópia); alterá-la altera as entidades
+        """
+        return self.dados[nome][:self.quantidade]
+    
+    def garantir_capacidade(self, capacidade):
+        """
+        Reserva linhas para pelo menos `capacidade` entidades
+        
+        Args:
+            capacidade: Número de linhas necessário
+        """
+        if capacidade <= self.capacidade:
+            return
+        capacidade = max(capacidade, 2 * self.capacidade)
+        n = self.quantidade
+        
+        for coluna, array in self.dados.items():
+            novo = np.zeros((capacidade,) + array.shape[1:], dtype=array.dtype)
+            novo[:n] = array[:n]
+            self.dados[coluna] = novo
+        
+        ids = np.zeros(capacidade, dtype=np.int64)
+        ids[:n] = self.ids[:n]
+        self.ids = ids
+        self.capacidade = capacidade
+    
+    def _acrescentar(self, ids, valores):
+        """
+        Escreve entidades novas no fim das colunas
+        
+        Args:
+            ids: IDs das entidades novas
+            valores: dict coluna -> valor (um para todas ou um por entidade);
+                colunas ausentes recebem o padrão do esquema
+        
+        Returns:
+            tuple: (inicio, fim) das linhas ocupadas
+        
+        Raises:
+            ValueError: Se algum valor é de uma coluna que o arquétipo não tem
+        """
+        desconhecidas = set(valores) - set(self.esquema)
+        if desconhecidas:
+            raise ValueError(f"Colunas desconhecidas em '{self.nome}': {', '.join(sorted(desconhecidas))}")
+        
+        inicio = self.quantidade
+        fim = inicio + len(ids)
+        self.garantir_capacidade(fim)
+        
+        self.ids[inicio:fim] = ids
+        for coluna, (_, _, padrao) in self.esquema.items():
+            self.dados[coluna][inicio:fim] = valores.get(coluna, padrao)
+        self.quantidade = fim
+        return inicio, fim
+    
+    def _remover_linha(self, linha):
+        """
+        Remove uma linha trazendo a última para o seu lugar (swap-remove)
+        
+        Returns:
+            int ou None: ID da entidade que mudou de linha (None se a
+                removida era a última)
+        """
+        ultima = self.quantidade - 1
+        self.quantidade = ultima
+        if linha == ultima:
+            return None
+        
+        for array in self.dados.values():
+            array[linha] = array[ultima]
+        self.ids[linha] = self.ids[ultima]
+        return int(self.ids[linha])
+    
+    def _remover_mascara(self, mascara):
+        """
+        Remove as linhas marcadas de uma vez
+        
+        Os buracos que ficam antes do novo fim são preenchidos pelas linhas
+        vivas que estão depois dele; só essas são copiadas.
+        
+        Args:
+            mascara: Array bool com uma posição por linha viva
+        
+        Returns:
+            tuple: (IDs removidos, linhas que receberam outra entidade)
+        """
+        n = self.quantidade
+        removidos = self.ids[:n][mascara]
+        vivas = n - len(removidos)
+        
+        buracos = np.flatnonzero(mascara[:vivas])
+        origens = np.flatnonzero(~mascara[vivas:n]) + vivas
+        if len(buracos):
+            for array in self.dados.values():
+                array[buracos] = array[origens]
+            self.ids[buracos] = self.ids[origens]
+        
+        self.quantidade = vivas
+        return removidos, buracos
+
+
+class Registro:
+    def __init__(self, esquemas, capacidade=64):
+        """
+        Inicializa o registro com um arquétipo por esquema
+        
+        Cada entidade ocupa um índice. O índice guarda o arquétipo e a
+        linha da entidade e uma geração, que sobe quando ela é removida.
+        O ID junta geração e índice, então um ID antigo nunca aponta para
+        a entidade que reaproveitou o índice.
+        
+        Args:
+            esquemas: dict nome do arquétipo -> colunas (ver Arquetipo)
+            capacidade: Linhas reservadas de início em cada arquétipo
+        """
+        self.arquetipos = {nome: Arquetipo(nome, colunas, capacidade) for nome, colunas in esquemas.items()}
+        self._numero_arquetipo = {nome: numero for numero, nome in enumerate(self.arquetipos)}
+        self._lista_arquetipos = list(self.arquetipos.values())
+        
+        # Por índice de entidade
+        self.geracoes = np.zeros(0, dtype=np.int64)
+        self.arquetipo_de = np.zeros(0, dtype=np.int16)  # -1 = índice livre
+        self.linha_de = np.zeros(0, dtype=np.int64)
+        self.num_indices = 0
+        
+        # Pilha de índices livres para reaproveitar
+        self.livres = np.zeros(0, dtype=np.int64)
+        self.num_livres = 0
+    
+    def __len__(self):
+        return sum(len(arquetipo) for arquetipo in self._lista_arquetipos)
+    
+    def criar(self, nome, quantidade=1, **valores):
+        """
+        Cria entidades de um arquétipo
+        
+        Args:
+            nome: Nome do arquétipo
+            quantidade: Número de entidades
+            **valores: Coluna -> valor (um para todas ou um por entidade)
+        
+        Returns:
+            np.ndarray: IDs das entidades criadas
+        """
+        arquetipo = self.arquetipos[nome]
+        
+        # Índices livres primeiro, depois índices novos
+        reaproveitados = min(quantidade, self.num_livres)
+        indices = np.empty(quantidade, dtype=np.int64)
+        indices[:reaproveitados] = self.livres[self.num_livres - reaproveitados:self.num_livres]
+        self.num_livres -= reaproveitados
+        
+        novos = quantidade - reaproveitados
+        if novos:
+            inicio = self.num_indices
+            self._garantir_indices(inicio + novos)
+            indices[reaproveitados:] = np.arange(inicio, inicio + novos)
+            self.num_indices += novos
+        
+        ids = (self.geracoes[indices] << BITS_INDICE) | indices
+        inicio, fim = arquetipo._acrescentar(ids, valores)
+        self.arquetipo_de[indices] = self._numero_arquetipo[nome]
+        self.linha_de[indices] = np.arange(inicio, fim)
+        return ids
+    
+    def vivo(self, id_entidade):
+        """True se a entidade do ID ainda existe"""
+        indice = id_entidade & MASCARA_INDICE
+        return (indice < self.num_indices and self.arquetipo_de[indice] >= 0
+                and self.geracoes[indice] == id_entidade >> BITS_INDICE)
+    
+    def localizar(self, id_entidade):
+        """
+        Onde estão as colunas de uma entidade
+        
+        Args:
+            id_entidade: ID retornado por criar()
+        
+        Returns:
+            tuple ou None: (Arquetipo, linha), ou None se a entidade não existe mais
+        """
+        if not self.vivo(id_entidade):
+            return None
+        indice = id_entidade & MASCARA_INDICE
+        return self._lista_arquetipos[self.arquetipo_de[indice]], int(self.linha_de[indice])
+    
+    def remover(self, id_entidade):
+        """
+        Remove uma entidade em O(1)
+        
+        A última linha do arquétipo ocupa o lugar da removida; os IDs das
+        outras entidades continuam valendo.
+        
+        Args:
+            id_entidade: ID retornado por criar()
+        
+        Returns:
+            bool: False se o ID já não valia
+        """
+        local = self.localizar(id_entidade)
+        if local is None:
+            return False
+        
+        arquetipo, linha = local
+        movido = arquetipo._remover_linha(linha)
+        if movido is not None:
+            self.linha_de[movido & MASCARA_INDICE] = linha
+        self._liberar(np.array([id_entidade & MASCARA_INDICE], dtype=np.int64))
+        return True
+    
+    def remover_onde(self, nome, mascara):
+        """
+        Remove de uma vez as entidades marcadas de um arquétipo
+        
+        Args:
+            nome: Nome do arquétipo
+            mascara: Array bool com uma posição por linha viva (ex.: vida <= 0)
+        
+        Returns:
+            int: Número de entidades removidas
+        """
+        if not mascara.any():
+            return 0
+        
+        arquetipo = self.arquetipos[nome]
+        removidos, linhas = arquetipo._remover_mascara(mascara)
+        if len(linhas):
+            self.linha_de[arquetipo.ids[linhas] & MASCARA_INDICE] = linhas
+        self._liberar(removidos & MASCARA_INDICE)
+        return len(removidos)
+    
+    def limpar(self, nome=None):
+        """
+        Remove todas as entidades de um arquétipo (None = de todos)
+        
+        Args:
+            nome: Nome do arquétipo
+        """
+        arquetipos = self._lista_arquetipos if nome is None else [self.arquetipos[nome]]
+        for arquetipo in arquetipos:
+            self._liberar(arquetipo.ids[:arquetipo.quantidade] & MASCARA_INDICE)
+            arquetipo.quantidade = 0
+    
+    def _liberar(self, indices):
+        """Invalida os IDs dos índices (nova geração) e os devolve à pilha de livres"""
+        if not len(indices):
+            return
+        self.geracoes[indices] += 1
+        self.arquetipo_de[indices] = -1
+        
+        fim = self.num_livres + len(indices)
+        if fim > len(self.livres):
+            livres = np.zeros(max(fim, 2 * len(self.livres)), dtype=np.int64)
+            livres[:self.num_livres] = self.livres[:self.num_livres]
+            self.livres = livres
+        self.livres[self.num_livres:fim] = indices
+        self.num_livres = fim
+    
+    def _garantir_indices(self, quantidade):
+        """Aumenta as tabelas por índice para caber `quantidade` índices"""
+        if quantidade <= len(self.geracoes):
+            return
+        capacidade = max(quantidade, 2 * len(self.geracoes), 64)
+        n = self.num_indices
+        
+        geracoes = np.zeros(capacidade, dtype=np.int64)
+        geracoes[:n] = self.geracoes[:n]
+        arquetipo_de = np.full(capacidade, -1, dtype=np.int16)
+        arquetipo_de[:n] = self.arquetipo_de[:n]
+        linha_de = np.zeros(capacidade, dtype=np.int64)
+        linha_de[:n] = self.linha_de[:n]
+        
+        self.geracoes = geracoes
+        self.arquetipo_de = arquetipo_de
+        self.linha_de = linha_de
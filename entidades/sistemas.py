@@ -0,0 +1,63 @@
+"""
+Sistemas: atualizações vetorizadas sobre as colunas de um arquétipo
+
+Cada função trabalha sobre todas as entidades de um arquétipo de uma vez
+(as colunas de entidades/arquetipos.py), sem laço em Python.
+"""
+import numpy as np
+
+
+def mover(arquetipo, dt):
+    """
+    Movimento retilíneo: pos += vel * dt
+    
+    Args:
+        arquetipo: Arquetipo com as colunas 'pos' e 'vel'
+        dt: Delta time em segundos
+    """
+    pos = arquetipo.coluna('pos')
+    pos += arquetipo.coluna('vel') * dt
+
+
+def envelhecer(arquetipo, dt):
+    """
+    Desconta dt do tempo de vida
+    
+    Args:
+        arquetipo: Arquetipo com a coluna 'vida'
+        dt: Delta time em segundos
+    
+    Returns:
+        np.ndarray: Máscara das entidades cuja vida acabou (vida <= 0)
+    """
+    vida = arquetipo.coluna('vida')
+    vida -= dt
+    return vida <= 0
+
+
+def envolver(arquetipo, largura, altura):
+    """
+    Mundo toroidal: traz as posições para [0, largura) x [0, altura)
+    
+    Dentro do mundo a posição não muda (mesmo resultado do % do Python).
+    
+    Args:
+        arquetipo: Arquetipo com a coluna 'pos'
+        largura: Largura do mundo
+        altura: Altura do mundo
+    """
+    pos = arquetipo.coluna('pos')
+    np.mod(pos, (largura, altura), out=pos)
+
+
+def fora(arquetipo, largura, altura):
+    """
+    Entidades fora do retângulo [0, largura] x [0, altura]
+    
+    Returns:
+        np.ndarray: Máscara bool, uma posição por entidade
+    """
+    pos = arquetipo.coluna('pos')
+    x = pos[:, 0]
+    y = pos[:, 1]
+    return (x < 0) | (x > largura) | (y < 0) | (y > altura)
@@ -2,154 +2,124 @@
 Asteroids 3D - Jogo com efeito de profundidade usando Pygame
 Inspirado no clássico Atari com visual moderno de paralaxe
 """
+import argparse
+import gc
 import pygame
-import random
+import time
 from classes.star import Star
+from classes.starfield import CampoEstrelas
+from classes.hud import HUD
+from classes.game_renderer import criar_fila_render
+from classes.painel_perfil import PainelPerfil
+from utils.audio import GerenciadorAudio, configurar_mixer
+from utils.camera import Camera
 from utils.cores import COR_FUNDO
+from utils.passo_fixo import PassoFixo
+from utils.perfil import Perfilador, HistoricoFrames
+from utils.qualidade import GovernadorQualidade, aplicar_qualidade, indice_nivel, NIVEL_PADRAO, NIVEIS_QUALIDADE
+from utils.replay import GravadorEntradas, carregar_replay, resumo_estado, MAX_LADO_CAMPO, MAX_SEMENTE
+from utils.retangulos_sujos import RenderizadorSujo
 
 
 # Configurações da tela
 LARGURA = 800
 ALTURA = 600
-FPS = 60
+FPS = 60  # FPS de referência (orçamento de frame no perfilador e na qualidade adaptativa)
+FPS_MAXIMO = 0  # Limite da taxa de desenho (0 = sem limite; com --vsync, o monitor dita o ritmo)
 
 # Configurações do starfield
 NUM_ESTRELAS = 300  # Mais estrelas para céu realista
 PROF_MIN = 0.15  # Profundidade mínima (estrelas muito distantes)
 PROF_MAX = 0.75  # Profundidade máxima (estrelas próximas, mas não muito para não confundir com asteroides)
+NUM_CAMADAS_ESTRELAS = 4  # Faixas de profundidade pré-renderizadas (paralaxe)
 
 
-def criar_estrelas():
+def criar_estrelas(rng):
     """Cria campo de estrelas com diferentes profundidades"""
     estrelas = []
     for _ in range(NUM_ESTRELAS):
-        x = random.randint(0, LARGURA)
-        y = random.randint(0, ALTURA)
-        profundidade = random.uniform(PROF_MIN, PROF_MAX)
-        estrelas.append(Star(x, y, profundidade, LARGURA, ALTURA))
+        x = rng.randint(0, LARGURA)
+        y = rng.randint(0, ALTURA)
+        profundidade = rng.uniform(PROF_MIN, PROF_MAX)
+        estrelas.append(Star(x, y, profundidade, LARGURA, ALTURA, rng))
     return estrelas
 
 
-def main():
-    """Loop principal do jogo"""
+def main(gravar=None, replay=None, rapido=False, semente=None, retangulos_sujos=False, vsync=False,
+         qualidade=None, arena=None, horda=None):
+    """
+    Loop principal do jogo
+    
+    Args:
+        gravar: Arquivo onde gravar as entradas da sessão (opcional)
+        replay: Arquivo de sessão a reproduzir no lugar do teclado (opcional)
+        rapido: No replay, não esperar o tempo real entre os frames
+        semente: Semente da partida (None = sorteada; o replay usa a gravada)
+        retangulos_sujos: Enviar ao display só as áreas que mudaram no frame
+        vsync: Sincronizar o desenho com a taxa do monitor
+        qualidade: Nome de um nível fixo de qualidade (None = adaptativa)
+        arena: Lado do campo em telas, com a câmera seguindo a nave (None = uma tela)
+        horda: Limite de asteroides do modo horda (None = partida normal; a
+            arena padrão da horda é de TELAS_HORDA telas)
+    """
+    reprodutor = carregar_replay(replay) if replay else None
+    if reprodutor is not None:
+        semente = reprodutor.semente
+        arena = reprodutor.largura // LARGURA if reprodutor.largura != LARGURA else None  # Campo gravado
+        horda = reprodutor.horda or None
+    
     # Inicialização
+    configurar_mixer()  # Buffer pequeno para menos latência (antes do pygame.init)
     pygame.init()
     pygame.mixer.init()  # Inicializar sistema de som
     
-    tela = pygame.display.set_mode((LARGURA, ALTURA))
+    tela = None
+    if vsync:
+        try:
+            tela = pygame.display.set_mode((LARGURA, ALTURA), pygame.SCALED, vsync=1)
+        except pygame.error:
+            print("Aviso: vsync indisponível neste sistema.")
+            vsync = False
+    if tela is None:
+        tela = pygame.display.set_mode((LARGURA, ALTURA))
     pygame.display.set_caption("Asteroids 3D - Efeito de Profundidade")
     clock = pygame.time.Clock()
+    hud = HUD(LARGURA, ALTURA)  # Fontes carregadas uma única vez
     
-    # Carregar sons
+    # Carregar sons (canais reservados e volumes por categoria em utils/audio.py)
     try:
-        som_tiro = pygame.mixer.Sound("assets/tiro2.wav")
-        som_explosao_asteroide = pygame.mixer.Sound("assets/explode4.wav")
-        som_explosao_nave = pygame.mixer.Sound("assets/explode1.wav")
-        
-        # Ajustar volumes
-        som_tiro.set_volume(0.3)
-        som_explosao_asteroide.set_volume(0.5)
-        som_explosao_nave.set_volume(0.7)
-        
-        sons_carregados = True
+        audio = GerenciadorAudio()
     except:
         print("Aviso: Não foi possível carregar os arquivos de som.")
-        sons_carregados = False
-    
-    # Criar campo de estrelas
-    estrelas = criar_estrelas()
+        audio = None
     
-    # Criar nave do jogador
-    from classes.ship import Ship
-    from classes.bullet import Bullet
-    from classes.asteroid import Asteroid
-    from classes.particula import Particula, criar_explosao
-    from classes.ship_debris import ShipDebris, criar_explosao_nave
-    from utils.fisica import checar_colisao_circular
-    
-    nave = Ship(LARGURA // 2, ALTURA // 2, LARGURA, ALTURA)
-    projeteis = []
-    asteroides = []
-    particulas = []  # Lista de partículas de explosão
-    ship_debris = []  # Lista de pedaços da nave
-    
-    # Criar asteroides iniciais
-    def spawn_asteroide(tamanho='grande'):
-        """Spawna um asteroide na borda da tela"""
-        # Escolher borda aleatória
-        borda = random.choice(['cima', 'baixo', 'esquerda', 'direita'])
-        
-        if borda == 'cima':
-            x = random.randint(0, LARGURA)
-            y = -50
-        elif borda == 'baixo':
-            x = random.randint(0, LARGURA)
-            y = ALTURA + 50
-        elif borda == 'esquerda':
-            x = -50
-            y = random.randint(0, ALTURA)
-        else:  # direita
-            x = LARGURA + 50
-            y = random.randint(0, ALTURA)
-        
-        return Asteroid(x, y, tamanho)
+    # Criar simulação (nave, asteroides, projéteis, pontuação, dificuldade)
+    from classes.game_simulation import GameSimulation, DT_FIXO, curva_arena, curva_horda, TELAS_HORDA
     
-    # Spawnar asteroides iniciais
-    for _ in range(4):
-        asteroides.append(spawn_asteroide('grande'))
+    camera = None
+    if horda and not arena:
+        arena = TELAS_HORDA
+    if arena:
+        # Arena: campo de arena x arena telas, mesma densidade de asteroides de uma tela
+        curva = curva_arena(arena)
+        if horda:
+            curva.update(curva_horda(horda))  # Horda: milhares de asteroides e reações em cadeia
+        sim = GameSimulation(LARGURA * arena, ALTURA * arena, semente, curva, tela=(LARGURA, ALTURA))
+        camera = Camera(LARGURA, ALTURA, sim.mundo)
+    else:
+        sim = GameSimulation(LARGURA, ALTURA, semente)
+    nave = sim.nave
     
-    # Game state
-    pontos = 0
-    vidas = 3
-    tempo_spawn = 0
-    intervalo_spawn = 4.0  # segundos entre spawns
-    estado_jogo = 'jogando'  # 'jogando' ou 'game_over'
-    pontuacao_final = 0
+    # Passos fixos de DT_FIXO (120 Hz), desacoplados da taxa de desenho
+    passo_fixo = PassoFixo(DT_FIXO)
     
-    # Sistema de dificuldade progressiva
-    nivel = 1
-    pontos_por_nivel = 500  # Pontos necessários para subir de nível
+    # Criar campo de estrelas (camadas pré-renderizadas por profundidade)
+    rng_estrelas = sim.aleatorio.gerador('estrelas')
+    campo_estrelas = CampoEstrelas(criar_estrelas(rng_estrelas), LARGURA, ALTURA, NUM_CAMADAS_ESTRELAS,
+                                   PROF_MIN, PROF_MAX, rng_estrelas)
     
-    def calcular_dificuldade():
-        """Calcula o nível atual baseado na pontuação"""
-        return (pontos // pontos_por_nivel) + 1
-    
-    def get_multiplicador_velocidade():
-        """Retorna multiplicador de velocidade baseado no nível"""
-        return 1.0 + (nivel - 1) * 0.15  # +15% por nível
-    
-    def get_intervalo_spawn():
-        """Retorna intervalo de spawn baseado no nível"""
-        # Diminui o intervalo, mas nunca menos que 1.5 segundos
-        return max(1.5, 4.0 - (nivel - 1) * 0.3)
-    
-    def get_max_asteroides():
-        """Retorna número máximo de asteroides baseado no nível"""
-        return min(15, 8 + (nivel - 1) * 1)  # Máximo de 15 asteroides
-    
-    def resetar_jogo():
-        """Reseta o jogo para um novo round"""
-        nonlocal pontos, vidas, asteroides, projeteis, nave, tempo_spawn, estado_jogo, particulas, ship_debris, nivel
-        
-        pontos = 0
-        vidas = 3
-        tempo_spawn = 0
-        estado_jogo = 'jogando'
-        nivel = 1  # Resetar nível
-        
-        # Resetar nave
-        nave.pos = pygame.math.Vector2(LARGURA // 2, ALTURA // 2)
-        nave.vel = pygame.math.Vector2(0, 0)
-        nave.angulo = 0
-        nave.viva = True
-        
-        # Limpar e recriar asteroides
-        asteroides.clear()
-        projeteis.clear()
-        particulas.clear()
-        ship_debris.clear()
-        for _ in range(4):
-            asteroides.append(spawn_asteroide('grande'))
+    # Gravação das entradas (para reproduzir a sessão depois)
+    gravador = GravadorEntradas(sim.semente, sim.largura, sim.altura, horda or 0) if gravar else None
     
     # Controles
     teclas_pressionadas = {
@@ -159,10 +129,53 @@ def main():
         'espaco': False
     }
     
+    # Qualidade adaptativa: desce de nível quando os frames estouram o orçamento
+    if qualidade is None:
+        governador = GovernadorQualidade(1000.0 / FPS, NIVEL_PADRAO)
+    else:
+        governador = GovernadorQualidade(1000.0 / FPS, indice_nivel(qualidade), adaptativo=False)
+    aplicar_qualidade(governador.config(), sim, campo_estrelas, hud)
+    
+    # Fila de renderização (camadas desenhadas do fundo para o topo)
+    fila_render = criar_fila_render(sim, campo_estrelas, hud, teclas_pressionadas, clock.get_fps,
+                                    passo_fixo.atraso, governador.config, camera)
+    
+    # Perfilador: tempo de cada fase dos últimos frames (F3 mostra, F4 grava CSV)
+    historico_frames = HistoricoFrames()
+    perfilador = Perfilador(historico=historico_frames)
+    sim.perfilador = perfilador
+    fila_render.perfilador = perfilador
+    painel_perfil = PainelPerfil(LARGURA, ALTURA, FPS)
+    fila_render.adicionar('perfil', lambda tela: painel_perfil.desenhar(tela, historico_frames),
+                          funcao_areas=lambda: painel_perfil.areas)
+    fila_render.ativar('perfil', False)
+    mostrar_perfil = False
+    
+    # Retângulos sujos: fundo (cor + estrelas) em cache, redesenhado só quando as estrelas rolam
+    renderizador = None
+    if retangulos_sujos:
+        def desenhar_fundo(superficie):
+            superficie.fill(COR_FUNDO)
+            campo_estrelas.desenhar(superficie)
+        
+        fila_render.ativar('estrelas', False)
+        renderizador = RenderizadorSujo(tela, fila_render, desenhar_fundo, campo_estrelas.assinatura)
+        renderizador.perfilador = perfilador
+    
+    # Pools, formas e superfícies criados até aqui vivem a partida toda: fora
+    # das coletas de lixo, que com milhares de asteroides (horda) travam frames
+    gc.freeze()
+    
     # Loop principal
     rodando = True
     while rodando:
-        dt = clock.tick(FPS) / 1000.0  # Delta time em segundos
+        # Tempo do frame em ms (no replay em tempo real, espera o dt gravado)
+        if reprodutor is not None and not rapido:
+            dt_ms = clock.tick(1000.0 / max(1, reprodutor.proximo_dt_ms()))
+        else:
+            dt_ms = clock.tick(FPS_MAXIMO)
+        perfilador.iniciar_frame()
+        reiniciar = False
         
         # Eventos
         for evento in pygame.event.get():
@@ -171,13 +184,26 @@ def main():
             elif evento.type == pygame.KEYDOWN:
                 if evento.key == pygame.K_ESCAPE:
                     rodando = False
+                
+                # Perfilador
+                elif evento.key == pygame.K_F3:
+                    mostrar_perfil = not mostrar_perfil
+                    fila_render.ativar('perfil', mostrar_perfil)
+                elif evento.key == pygame.K_F4:
+                    caminho = time.strftime("perfil_%Y%m%d_%H%M%S.csv")
+                    historico_frames.exportar_csv(caminho)
+                    print(f"Perfil gravado em {caminho}")
                     
+                # No replay, as entradas vêm do arquivo
+                elif reprodutor is not None:
+                    continue
+                
                 # Reiniciar jogo na tela de game over
-                elif evento.key == pygame.K_RETURN and estado_jogo == 'game_over':
-                    resetar_jogo()
+                elif evento.key == pygame.K_RETURN and sim.estado_jogo == 'game_over':
+                    reiniciar = True
                 
                 # Controles durante o jogo
-                elif estado_jogo == 'jogando':
+                elif sim.estado_jogo == 'jogando':
                     if evento.key == pygame.K_LEFT or evento.key == pygame.K_a:
                         teclas_pressionadas['esquerda'] = True
                     elif evento.key == pygame.K_RIGHT or evento.key == pygame.K_d:
@@ -187,7 +213,7 @@ def main():
                     elif evento.key == pygame.K_SPACE:
                         teclas_pressionadas['espaco'] = True
                     
-            elif evento.type == pygame.KEYUP and estado_jogo == 'jogando':
+            elif evento.type == pygame.KEYUP and sim.estado_jogo == 'jogando' and reprodutor is None:
                 if evento.key == pygame.K_LEFT or evento.key == pygame.K_a:
                     teclas_pressionadas['esquerda'] = False
                 elif evento.key == pygame.K_RIGHT or evento.key == pygame.K_d:
@@ -197,265 +223,103 @@ def main():
                 elif evento.key == pygame.K_SPACE:
                     teclas_pressionadas['espaco'] = False
         
-        # Processar apenas se estiver jogando
-        if estado_jogo == 'jogando':
-            # Processar controles da nave
-            if teclas_pressionadas['esquerda']:
-                nave.rotacionar(-1, dt)
-            if teclas_pressionadas['direita']:
-                nave.rotacionar(1, dt)
-            if teclas_pressionadas['cima']:
-                nave.acelerar(dt)
-            if teclas_pressionadas['espaco']:
-                dados_tiro = nave.shoot()
-                if dados_tiro:
-                    projeteis.append(Bullet(dados_tiro['pos'], dados_tiro['vel'], dados_tiro['angulo']))
-                    # Som de tiro
-                    if sons_carregados:
-                        som_tiro.play()
+        if reprodutor is not None:
+            if reprodutor.terminou():
+                break
+            dt_ms, reiniciar = reprodutor.proximo(teclas_pressionadas)
+        elif gravador is not None:
+            gravador.registrar(teclas_pressionadas, dt_ms, reiniciar)
         
-            # Atualizar
-            # Atualizar estrelas com efeito paralaxe baseado na velocidade da nave
-            for estrela in estrelas:
-                estrela.atualizar(dt, nave.vel)
-            
-            nave.atualizar(dt)
-            
-            # Atualizar projéteis e remover mortos
-            for projetil in projeteis[:]:
-                projetil.atualizar(dt, LARGURA, ALTURA)
-                if not projetil.vivo:
-                    projeteis.remove(projetil)
-            
-            # Atualizar asteroides
-            for asteroide in asteroides[:]:
-                asteroide.atualizar(dt, LARGURA, ALTURA)
-            
-            # Atualizar nível baseado na pontuação
-            nivel_anterior = nivel
-            nivel = calcular_dificuldade()
-            
-            # Notificar subida de nível
-            if nivel > nivel_anterior and nivel > 1:
-                # Aqui poderia adicionar som ou efeito visual de level up
-                pass
-            
-            # Spawnar novos asteroides periodicamente (com dificuldade progressiva)
-            intervalo_atual = get_intervalo_spawn()
-            max_asteroides_atual = get_max_asteroides()
-            multiplicador_vel = get_multiplicador_velocidade()
-            
-            tempo_spawn += dt
-            if tempo_spawn >= intervalo_atual and len(asteroides) < max_asteroides_atual:
-                novo_asteroide = spawn_asteroide('grande')
-                # Aplicar multiplicador de velocidade baseado no nível
-                novo_asteroide.vel *= multiplicador_vel
-                asteroides.append(novo_asteroide)
-                tempo_spawn = 0
-            
-            # Colisão: Projéteis vs Asteroides
-            for projetil in projeteis[:]:
-                if not projetil.vivo:
-                    continue
-                    
-                for asteroide in asteroides[:]:
-                    if not asteroide.vivo:
-                        continue
-                    
-                    if checar_colisao_circular(projetil.pos, projetil.raio, asteroide.pos, asteroide.raio_colisao):
-                        # Destruir projétil e asteroide
-                        projetil.vivo = False
-                        asteroide.vivo = False
-                        
-                        # Criar explosão de partículas
-                        particulas.extend(criar_explosao(
-                            asteroide.pos.x, 
-                            asteroide.pos.y, 
-                            asteroide.cor, 
-                            num_particulas=15,
-                            velocidade=100
-                        ))
-                        
-                        # Som de explosão
-                        if sons_carregados:
-                            som_explosao_asteroide.play()
-                        
-                        # Adicionar pontos baseado no tamanho e profundidade
-                        if asteroide.tamanho_tipo == 'grande':
-                            pontos += int(20 * asteroide.profundidade)
-                        elif asteroide.tamanho_tipo == 'medio':
-                            pontos += int(50 * asteroide.profundidade)
-                        else:  # pequeno
-                            pontos += int(100 * asteroide.profundidade)
-                        
-                        # Fragmentar asteroide
-                        fragmentos = asteroide.fragmentar()
-                        asteroides.extend(fragmentos)
-                        
-                        break
-            
-            # Colisão: Nave vs Asteroides
-            if nave.viva:
-                for asteroide in asteroides[:]:
-                    if not asteroide.vivo:
-                        continue
-                    
-                    if checar_colisao_circular(nave.pos, nave.raio_colisao, asteroide.pos, asteroide.raio_colisao):
-                        # Nave morreu
-                        nave.viva = False
-                        vidas -= 1
-                        
-                        # Criar explosão da nave (pedaços do triângulo voando)
-                        ship_debris.extend(criar_explosao_nave(nave))
-                        
-                        # Som de explosão da nave
-                        if sons_carregados:
-                            som_explosao_nave.play()
-                        
-                        # Verificar game over
-                        if vidas <= 0:
-                            estado_jogo = 'game_over'
-                            pontuacao_final = pontos
-                        else:
-                            # Respawn
-                            nave.pos = pygame.math.Vector2(LARGURA // 2, ALTURA // 2)
-                            nave.vel = pygame.math.Vector2(0, 0)
-                            nave.viva = True
-            
-            # Remover asteroides mortos
-            asteroides = [a for a in asteroides if a.vivo]
-            projeteis = [p for p in projeteis if p.vivo]
-            
-            # Atualizar partículas
-            for particula in particulas[:]:
-                particula.atualizar(dt)
-            particulas = [p for p in particulas if p.viva]
-            
-            # Atualizar pedaços da nave
-            for debris in ship_debris[:]:
-                debris.atualizar(dt)
-            ship_debris = [d for d in ship_debris if d.viva]
-        else:
-            # Ainda atualizar estrelas, partículas e debris no game over (efeito visual)
-            for estrela in estrelas:
-                estrela.atualizar(dt, pygame.math.Vector2(0, 0))
-            for particula in particulas[:]:
-                particula.atualizar(dt)
-            particulas = [p for p in particulas if p.viva]
-            for debris in ship_debris[:]:
-                debris.atualizar(dt)
-            ship_debris = [d for d in ship_debris if d.viva]
-        
-        # Desenhar
-        tela.fill(COR_FUNDO)
-        
-        # Desenhar estrelas (ordenadas por profundidade - distantes primeiro)
-        estrelas_ordenadas = sorted(estrelas, key=lambda s: s.profundidade)
-        for estrela in estrelas_ordenadas:
-            estrela.desenhar(tela)
-        
-        # Desenhar thrust se estiver acelerando
-        if teclas_pressionadas['cima'] and nave.viva:
-            nave.desenhar_thrust(tela)
-        
-        # Desenhar asteroides (ordenados por profundidade - distantes primeiro)
-        asteroides_ordenados = sorted(asteroides, key=lambda a: a.profundidade)
-        for asteroide in asteroides_ordenados:
-            asteroide.desenhar(tela)
-        
-        # Desenhar partículas de explosão
-        for particula in particulas:
-            particula.desenhar(tela)
-        
-        # Desenhar pedaços da nave (debris)
-        for debris in ship_debris:
-            debris.desenhar(tela)
-        
-        # Desenhar nave (só se estiver viva)
-        nave.desenhar(tela)
+        if reiniciar:
+            sim.resetar()
+            hud.descartar_game_over()
         
-        # Desenhar projéteis
-        for projetil in projeteis:
-            projetil.desenhar(tela)
+        dt = dt_ms / 1000.0  # Tempo do frame em segundos
+        perfilador.marcar('eventos')
         
-        # Desenhar HUD
-        fonte = pygame.font.Font(None, 28)
-        fonte_grande = pygame.font.Font(None, 36)
-        
-        # Pontos
-        pontos_text = fonte_grande.render(f"PONTOS: {pontos}", True, (255, 255, 255))
-        tela.blit(pontos_text, (10, 10))
-        
-        # Vidas
-        vidas_text = fonte.render(f"VIDAS: {vidas}", True, (255, 255, 255))
-        tela.blit(vidas_text, (10, 50))
-        
-        # Nível
-        nivel_text = fonte.render(f"NÍVEL: {nivel}", True, (255, 200, 100))
-        tela.blit(nivel_text, (10, 80))
+        # Atualizar estrelas com efeito paralaxe baseado na velocidade da nave
+        # (paradas no game over)
+        if sim.estado_jogo == 'jogando':
+            vel_paralaxe = nave.vel
+        else:
+            vel_paralaxe = pygame.math.Vector2(0, 0)
+        campo_estrelas.atualizar(dt, vel_paralaxe)
+        perfilador.marcar('update_estrelas')
         
-        # Asteroides na tela
-        ast_text = fonte.render(f"Asteroides: {len(asteroides)}", True, (150, 150, 150))
-        tela.blit(ast_text, (10, 110))
+        # Avançar a simulação em passos fixos (zero, um ou vários por frame)
+        for _ in range(passo_fixo.avancar(dt)):
+            eventos = sim.step(teclas_pressionadas, DT_FIXO)
+            if audio is not None:
+                audio.registrar(eventos)
         
-        # FPS
-        fps_text = fonte.render(f"FPS: {int(clock.get_fps())}", True, (100, 100, 100))
-        tela.blit(fps_text, (LARGURA - 100, 10))
+        # Sons dos eventos do frame (uma voz por categoria)
+        if audio is not None:
+            audio.tocar()
+        perfilador.marcar('sons')
         
-        # Instruções
-        instrucoes = [
-            "Setas/WASD: Mover",
-            "ESPAÇO: Atirar",
-            "ESC: Sair"
-        ]
-        y_offset = ALTURA - 90
-        for instrucao in instrucoes:
-            texto = fonte.render(instrucao, True, (150, 150, 150))
-            tela.blit(texto, (10, y_offset))
-            y_offset += 25
+        # Câmera da arena na pose desenhada da nave
+        if camera is not None:
+            camera.seguir(*nave.pose(passo_fixo.atraso())[:2])
         
-        # Tela de Game Over
-        if estado_jogo == 'game_over':
-            # Overlay semi-transparente
-            overlay = pygame.Surface((LARGURA, ALTURA))
-            overlay.set_alpha(200)
-            overlay.fill((0, 0, 0))
-            tela.blit(overlay, (0, 0))
-            
-            # Fontes
-            fonte_titulo = pygame.font.Font(None, 72)
-            fonte_grande = pygame.font.Font(None, 48)
-            fonte_media = pygame.font.Font(None, 32)
-            fonte_pequena = pygame.font.Font(None, 24)
-            
-            # GAME OVER
-            texto_gameover = fonte_titulo.render("GAME OVER", True, (255, 100, 100))
-            rect_gameover = texto_gameover.get_rect(center=(LARGURA // 2, ALTURA // 2 - 100))
-            tela.blit(texto_gameover, rect_gameover)
-            
-            # Pontuação Final
-            texto_pontos = fonte_grande.render(f"PONTUAÇÃO FINAL: {pontuacao_final}", True, (255, 255, 255))
-            rect_pontos = texto_pontos.get_rect(center=(LARGURA // 2, ALTURA // 2 - 20))
-            tela.blit(texto_pontos, rect_pontos)
-            
-            # Instruções
-            texto_reiniciar = fonte_media.render("Pressione ENTER para reiniciar", True, (200, 200, 200))
-            rect_reiniciar = texto_reiniciar.get_rect(center=(LARGURA // 2, ALTURA // 2 + 50))
-            tela.blit(texto_reiniciar, rect_reiniciar)
-            
-            texto_sair = fonte_pequena.render("ou ESC para sair", True, (150, 150, 150))
-            rect_sair = texto_sair.get_rect(center=(LARGURA // 2, ALTURA // 2 + 85))
-            tela.blit(texto_sair, rect_sair)
+        # Desenhar
+        if renderizador is not None:
+            renderizador.desenhar()
+        else:
+            tela.fill(COR_FUNDO)
+            perfilador.marcar('desenho_fundo')
+            fila_render.desenhar(tela)
             
-            # Créditos
-            texto_creditos = fonte_pequena.render("por elen-c-sales", True, (100, 150, 200))
-            rect_creditos = texto_creditos.get_rect(center=(LARGURA // 2, ALTURA - 40))
-            tela.blit(texto_creditos, rect_creditos)
+            pygame.display.flip()
+            perfilador.marcar('flip')
+        perfilador.finalizar_frame()
         
-        pygame.display.flip()
+        # Tempo de trabalho do frame (com vsync, o flip inclui a espera pelo monitor)
+        tempos = perfilador.frame_atual
+        segundos = sum(tempos.values()) - (tempos.get('flip', 0.0) if vsync else 0.0)
+        if governador.registrar(1000.0 * segundos):
+            aplicar_qualidade(governador.config(), sim, campo_estrelas, hud)
+    
+    if gravador is not None:
+        gravador.salvar(gravar, resumo_estado(sim))
+        print(f"Sessão gravada em {gravar} ({len(gravador)} ticks, semente {sim.semente})")
+    
+    if reprodutor is not None:
+        if not reprodutor.terminou():
+            print(f"Replay interrompido no tick {reprodutor.tick} de {len(reprodutor)}")
+        elif reprodutor.conferir(sim):
+            print(f"Replay concluído: {len(reprodutor)} ticks, estado final idêntico ao gravado")
+        else:
+            print(f"Replay concluído: {len(reprodutor)} ticks, mas o estado final DIVERGIU do gravado")
     
     pygame.quit()
 
 
 if __name__ == "__main__":
-    main()
+    from classes.game_simulation import LIMITE_HORDA, TELAS_HORDA
+    
+    max_telas = MAX_LADO_CAMPO // max(LARGURA, ALTURA)  # O replay guarda o tamanho do campo em 16 bits
+    
+    parser = argparse.ArgumentParser(description="Asteroids 3D")
+    parser.add_argument('--gravar', metavar='ARQUIVO', help="Grava as entradas da sessão")
+    parser.add_argument('--replay', metavar='ARQUIVO', help="Reproduz uma sessão gravada")
+    parser.add_argument('--rapido', action='store_true', help="Replay o mais rápido possível")
+    parser.add_argument('--semente', type=int, help=f"Semente da partida (0 a {MAX_SEMENTE})")
+    parser.add_argument('--retangulos-sujos', action='store_true',
+                        help="Atualiza no display só as áreas que mudaram")
+    parser.add_argument('--vsync', action='store_true', help="Desenha na taxa do monitor")
+    parser.add_argument('--qualidade', choices=[nivel['nome'] for nivel in NIVEIS_QUALIDADE],
+                        help="Nível fixo de qualidade (padrão: adaptativa)")
+    parser.add_argument('--arena', type=int, metavar='TELAS',
+                        help=f"Campo de TELAS x TELAS telas com a câmera seguindo a nave (2 a {max_telas})")
+    parser.add_argument('--horda', type=int, nargs='?', const=LIMITE_HORDA, metavar='LIMITE',
+                        help=f"Modo horda: até LIMITE asteroides (padrão {LIMITE_HORDA}) e reações em cadeia, "
+                             f"numa arena de {TELAS_HORDA} telas se --arena não foi dado")
+    args = parser.parse_args()
+    if args.semente is not None and not 0 <= args.semente <= MAX_SEMENTE:
+        parser.error(f"--semente precisa estar entre 0 e {MAX_SEMENTE}")  # uint64 no cabeçalho do replay
+    if args.arena is not None and not 2 <= args.arena <= max_telas:
+        parser.error(f"--arena precisa de 2 a {max_telas} telas")
+    if args.horda is not None and not 1 <= args.horda <= 0xFFFF:
+        parser.error("--horda precisa de um limite entre 1 e 65535")
+    main(args.gravar, args.replay, args.rapido, args.semente, args.retangulos_sujos, args.vsync,
+         args.qualidade, args.arena, args.horda)
@@ -0,0 +1 @@
+# Testes do Asteroids 3D
@@ -0,0 +1,21 @@
+"""
+Testes do benchmark headless (python -m bench)
+"""
+import json
+import os
+import subprocess
+import sys
+
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_saida_padrao_e_json_valido():
+    processo = subprocess.run(
+        [sys.executable, '-m', 'bench', '--cenarios', 'game_over', '--ticks', '5', '--aquecimento', '0'],
+        cwd=RAIZ, capture_output=True, text=True, timeout=120, check=True
+    )
+    resultados = json.loads(processo.stdout)
+    
+    assert set(resultados['cenarios']) == {'game_over'}
+    assert resultados['cenarios']['game_over']['ticks'] == 5
@@ -0,0 +1,64 @@
+"""
+Testes da colisão contínua e da grade espacial
+"""
+import pygame
+import pytest
+from utils.fisica import GradeEspacial, checar_colisao_varrida
+from utils.mundo import MundoToroidal
+
+
+def test_varrida_acha_o_primeiro_contato():
+    # Círculo de raio 1 andando de x=0 a x=100 contra alvo de raio 9 em x=50
+    assert checar_colisao_varrida(0, 0, 100, 0, 1, 50, 0, 9) == pytest.approx(0.4)
+
+
+def test_varrida_nao_atravessa_alvo_pequeno():
+    # A posição final já passou do alvo: o teste só do fim erraria
+    assert checar_colisao_varrida(0, 0, 100, 0, 2, 50, 1, 3) is not None
+
+
+def test_varrida_sem_colisao():
+    assert checar_colisao_varrida(0, 0, 100, 0, 1, 50, 30, 9) is None  # Passa longe
+    assert checar_colisao_varrida(0, 0, 30, 0, 1, 50, 0, 9) is None  # Para antes
+    assert checar_colisao_varrida(0, 0, -100, 0, 1, 50, 0, 9) is None  # Se afasta
+
+
+def test_varrida_ja_encostado():
+    assert checar_colisao_varrida(45, 0, 100, 0, 1, 50, 0, 9) == 0.0
+
+
+def _grade_toroidal():
+    return GradeEspacial(80, mundo=MundoToroidal(800, 600))
+
+
+def test_grade_consulta_atravessa_a_borda():
+    grade = _grade_toroidal()
+    grade.inserir('direita', pygame.math.Vector2(795, 300), 10)
+    grade.inserir('baixo', pygame.math.Vector2(400, 595), 10)
+    grade.inserir('canto', pygame.math.Vector2(798, 598), 10)
+    
+    assert 'direita' in grade.consultar(pygame.math.Vector2(5, 300), 5)
+    assert 'baixo' in grade.consultar(pygame.math.Vector2(400, 3), 5)
+    assert 'canto' in grade.consultar(pygame.math.Vector2(2, 2), 5)
+
+
+def test_grade_consulta_devolve_cada_objeto_uma_vez():
+    grade = _grade_toroidal()
+    grade.inserir('a', pygame.math.Vector2(10, 10), 10)
+    
+    # Consulta maior que o mundo: todas as células, sem repetir
+    assert grade.consultar(pygame.math.Vector2(400, 300), 1000) == ['a']
+
+
+def test_grade_consulta_longe_nao_traz_objeto():
+    grade = _grade_toroidal()
+    grade.inserir('a', pygame.math.Vector2(795, 300), 10)
+    
+    assert grade.consultar(pygame.math.Vector2(400, 300), 5) == []
+
+
+def test_grade_retangulo_atravessa_a_borda():
+    grade = _grade_toroidal()
+    grade.inserir('a', pygame.math.Vector2(10, 10), 10)
+    
+    assert grade.consultar_retangulo(700, 500, 900, 700) == ['a']
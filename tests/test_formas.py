@@ -0,0 +1,45 @@
+"""
+Testes do banco de formas de asteroides e do seu cache em disco
+"""
+import os
+import subprocess
+import sys
+import numpy as np
+from utils.formas import BancoFormas, chave_cache
+
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_cache_salvo_e_relido(tmp_path):
+    caminho = tmp_path / 'formas.npz'
+    banco = BancoFormas.gerar()
+    banco.salvar(str(caminho))
+    
+    relido = BancoFormas.carregar(str(caminho))
+    assert relido is not None
+    assert np.array_equal(relido.raios, banco.raios)
+    assert np.array_equal(relido.contagens, banco.contagens)
+
+
+def test_cache_de_outros_parametros_e_descartado(tmp_path):
+    caminho = tmp_path / 'formas.npz'
+    BancoFormas.gerar().salvar(str(caminho))
+    
+    assert BancoFormas.carregar(str(caminho), semente=2) is None
+    assert BancoFormas.carregar(str(caminho), num_formas=16) is None
+    assert BancoFormas.carregar(str(tmp_path / 'nao_existe.npz')) is None
+
+
+def test_chave_igual_entre_processos():
+    # Uma chave que mudasse a cada execução nunca acertaria o cache em disco
+    comando = [sys.executable, '-c', 'from utils.formas import chave_cache; print(chave_cache())']
+    chaves = {
+        subprocess.run(comando, cwd=RAIZ, capture_output=True, text=True, check=True).stdout.split()[-1]
+        for _ in range(2)
+    }
+    assert chaves == {chave_cache()}
+
+
+def test_mesma_semente_gera_as_mesmas_formas():
+    assert np.array_equal(BancoFormas.gerar().raios, BancoFormas.gerar().raios)
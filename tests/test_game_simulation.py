@@ -0,0 +1,63 @@
+"""
+Testes da GameSimulation (headless, sem janela)
+"""
+from classes.game_simulation import GameSimulation
+from utils.replay import resumo_estado
+
+
+PARADO = {'esquerda': False, 'direita': False, 'cima': False, 'espaco': False}
+
+
+def _simulacao_com_asteroides_na_nave(vidas, quantidade=3):
+    """Simulação sem asteroides iniciais e `quantidade` asteroides sobre a nave"""
+    sim = GameSimulation(semente=1, curva={'asteroides_iniciais': 0})
+    sim.vidas = vidas
+    for _ in range(quantidade):
+        asteroide = sim.criar_asteroide(sim.nave.pos.x, sim.nave.pos.y, 'grande', rng=sim.rng_asteroides)
+        asteroide.vel.update(0, 0)
+        sim.asteroides.append(asteroide)
+    return sim
+
+
+def test_varios_asteroides_na_nave_custam_uma_vida():
+    sim = _simulacao_com_asteroides_na_nave(vidas=1)
+    eventos = sim.step(PARADO)
+    
+    assert sim.vidas == 0
+    assert sim.estado_jogo == 'game_over'
+    assert eventos.count('explosao_nave') == 1
+    assert eventos.count('game_over') == 1
+
+
+def test_nave_renascida_nao_e_testada_no_mesmo_tick():
+    # O respawn é no centro, sobre os mesmos asteroides
+    sim = _simulacao_com_asteroides_na_nave(vidas=3)
+    eventos = sim.step(PARADO)
+    
+    assert sim.vidas == 2
+    assert sim.estado_jogo == 'jogando'
+    assert eventos.count('explosao_nave') == 1
+    assert sim.nave.viva
+
+
+def _jogar(semente, ticks=600):
+    """Partida com entradas fixas (girando, acelerando e atirando em ciclos)"""
+    sim = GameSimulation(semente=semente)
+    for tick in range(ticks):
+        fase = (tick // 60) % 4
+        sim.step({'esquerda': fase == 0, 'direita': fase == 2, 'cima': fase in (1, 2), 'espaco': tick % 3 == 0})
+    return sim
+
+
+def test_mesma_semente_e_entradas_repetem_a_partida():
+    primeira = _jogar(semente=42)
+    segunda = _jogar(semente=42)
+    
+    assert primeira.pontos > 0  # A partida teve tiros acertando asteroides
+    assert resumo_estado(primeira) == resumo_estado(segunda)
+    assert len(primeira.projeteis) == len(segunda.projeteis)
+    assert len(primeira.particulas) == len(segunda.particulas)
+
+
+def test_sementes_diferentes_mudam_a_partida():
+    assert resumo_estado(_jogar(semente=1, ticks=120)) != resumo_estado(_jogar(semente=2, ticks=120))
@@ -0,0 +1,40 @@
+"""
+Testes do acumulador de passo fixo
+"""
+import pytest
+from utils.passo_fixo import PassoFixo
+
+
+def test_acumula_o_tempo_que_sobra():
+    passo = PassoFixo(0.01)
+    
+    assert passo.avancar(0.025) == 2
+    assert passo.acumulado == pytest.approx(0.005)
+    
+    # O resto do frame anterior completa mais um passo
+    assert passo.avancar(0.006) == 1
+    assert passo.acumulado == pytest.approx(0.001)
+
+
+def test_frame_curto_nao_avanca():
+    passo = PassoFixo(0.01)
+    
+    assert passo.avancar(0.004) == 0
+    assert passo.avancar(0.004) == 0
+    assert passo.avancar(0.004) == 1
+
+
+def test_alfa_e_atraso():
+    passo = PassoFixo(0.01)
+    passo.avancar(0.0175)
+    
+    assert passo.alfa() == pytest.approx(0.75)
+    assert passo.atraso() == pytest.approx(0.0025)
+
+
+def test_travada_longa_limita_os_passos():
+    passo = PassoFixo(0.01, max_passos=8)
+    
+    assert passo.avancar(2.0) == 8
+    assert passo.acumulado <= passo.dt
+    assert passo.atraso() >= 0.0
@@ -0,0 +1,75 @@
+"""
+Testes do registro de entidades (IDs com geração e colunas por arquétipo)
+"""
+import numpy as np
+from entidades.arquetipos import ARQUETIPOS
+from entidades.registro import Registro, MASCARA_INDICE
+
+
+def _registro():
+    return Registro({'projeteis': ARQUETIPOS['projeteis']}, capacidade=2)
+
+
+def test_criar_preenche_colunas_e_padroes():
+    registro = _registro()
+    ids = registro.criar('projeteis', 3, pos=[(1, 2), (3, 4), (5, 6)], raio=2)
+    projeteis = registro.arquetipos['projeteis']
+    
+    assert len(projeteis) == 3
+    assert projeteis.coluna('pos').tolist() == [[1, 2], [3, 4], [5, 6]]
+    assert projeteis.coluna('raio').tolist() == [2, 2, 2]
+    assert np.isinf(projeteis.coluna('vida')).all()
+    assert [registro.localizar(id_entidade)[1] for id_entidade in ids] == [0, 1, 2]
+
+
+def test_remover_traz_a_ultima_linha():
+    registro = _registro()
+    primeiro, meio, ultimo = registro.criar('projeteis', 3, pos=[(1, 0), (2, 0), (3, 0)])
+    projeteis = registro.arquetipos['projeteis']
+    
+    assert registro.remover(meio)
+    
+    assert len(projeteis) == 2
+    assert projeteis.coluna('pos')[:, 0].tolist() == [1, 3]
+    assert registro.localizar(ultimo) == (projeteis, 1)
+    assert registro.localizar(primeiro) == (projeteis, 0)
+
+
+def test_id_antigo_nao_vale_depois_do_reaproveitamento():
+    registro = _registro()
+    antigo = registro.criar('projeteis')[0]
+    registro.remover(antigo)
+    novo = registro.criar('projeteis')[0]
+    
+    # Mesmo índice, outra geração
+    assert novo & MASCARA_INDICE == antigo & MASCARA_INDICE
+    assert novo != antigo
+    assert not registro.vivo(antigo)
+    assert registro.localizar(antigo) is None
+    assert not registro.remover(antigo)
+    assert registro.vivo(novo)
+
+
+def test_remover_onde_mantem_localizar_consistente():
+    registro = _registro()
+    ids = registro.criar('projeteis', 6, vida=[1, 0, 1, 0, 0, 1])
+    projeteis = registro.arquetipos['projeteis']
+    
+    assert registro.remover_onde('projeteis', projeteis.coluna('vida') <= 0) == 3
+    
+    assert len(projeteis) == 3
+    for id_entidade, vida in zip(ids.tolist(), [1, 0, 1, 0, 0, 1]):
+        local = registro.localizar(id_entidade)
+        if vida:
+            assert projeteis.ids[local[1]] == id_entidade
+        else:
+            assert local is None
+
+
+def test_limpar_invalida_todos_os_ids():
+    registro = _registro()
+    ids = registro.criar('projeteis', 4)
+    registro.limpar()
+    
+    assert len(registro) == 0
+    assert not any(registro.vivo(id_entidade) for id_entidade in ids.tolist())
@@ -0,0 +1,45 @@
+"""
+Testes da gravação e reprodução de sessões
+"""
+import pytest
+from classes.game_simulation import GameSimulation
+from utils.replay import GravadorEntradas, carregar_replay, resumo_estado, TECLAS
+
+
+def _entradas(tick):
+    return {'esquerda': tick % 5 == 0, 'direita': False, 'cima': tick % 2 == 0, 'espaco': tick % 7 == 0}
+
+
+def test_ida_e_volta_reproduz_entradas_e_estado(tmp_path):
+    caminho = tmp_path / 'sessao.rep'
+    sim = GameSimulation(semente=7)
+    gravador = GravadorEntradas(sim.semente, sim.largura, sim.altura)
+    for tick in range(300):
+        entradas = _entradas(tick)
+        gravador.registrar(entradas, 8, reiniciar=tick == 150)
+        sim.step(entradas)
+    gravador.salvar(caminho, resumo_estado(sim))
+    
+    reprodutor = carregar_replay(caminho)
+    assert (reprodutor.semente, reprodutor.largura, reprodutor.altura) == (7, sim.largura, sim.altura)
+    assert len(reprodutor) == 300
+    
+    reproduzida = GameSimulation(semente=reprodutor.semente)
+    teclas = dict.fromkeys(TECLAS, False)
+    tick = 0
+    while not reprodutor.terminou():
+        dt_ms, reiniciar = reprodutor.proximo(teclas)
+        assert dt_ms == 8
+        assert reiniciar == (tick == 150)
+        assert teclas == _entradas(tick)
+        reproduzida.step(teclas)
+        tick += 1
+    
+    assert reprodutor.conferir(reproduzida)
+
+
+def test_gravador_recusa_o_que_nao_cabe_no_cabecalho():
+    with pytest.raises(ValueError):
+        GravadorEntradas(-1, 800, 600)
+    with pytest.raises(ValueError):
+        GravadorEntradas(1, 800 * 82, 600)
@@ -0,0 +1,58 @@
+"""
+Testes do renderizador por retângulos sujos
+"""
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+import pytest
+from utils.fila_render import FilaRender
+from utils.retangulos_sujos import RenderizadorSujo
+
+
+@pytest.fixture
+def tela():
+    pygame.display.init()
+    yield pygame.display.set_mode((200, 150))
+    pygame.display.quit()
+
+
+def _desenhar_ponto(tela):
+    pygame.draw.circle(tela, (255, 255, 255), (50, 50), 3)
+
+
+def _renderizador(tela):
+    fila = FilaRender()
+    fila.adicionar('ponto', _desenhar_ponto, funcao_areas=lambda: [pygame.Rect(47, 47, 7, 7)])
+    fila.adicionar('sem_areas', lambda tela: None)  # Não informa as áreas
+    fila.ativar('sem_areas', False)
+    return RenderizadorSujo(tela, fila, lambda fundo: fundo.fill((0, 0, 0)), lambda: 0), fila
+
+
+def test_frame_parcial_depois_do_primeiro(tela):
+    renderizador, _ = _renderizador(tela)
+    renderizador.desenhar()
+    renderizador.desenhar()
+    
+    assert renderizador.frames_completos == 1
+    assert renderizador.frames_parciais == 1
+
+
+def test_camada_sem_areas_depois_de_frame_parcial_faz_flip_completo(tela):
+    renderizador, fila = _renderizador(tela)
+    renderizador.desenhar()
+    renderizador.desenhar()
+    
+    fila.ativar('sem_areas')
+    renderizador.desenhar()
+    
+    assert renderizador.frames_completos == 2
+    assert renderizador.anteriores is None
+    
+    # Sem a camada, volta aos frames parciais depois de um completo
+    fila.ativar('sem_areas', False)
+    renderizador.desenhar()
+    renderizador.desenhar()
+    assert renderizador.frames_parciais == 2
@@ -0,0 +1,53 @@
+"""
+Geradores aleatórios com semente, um por subsistema
+"""
+import hashlib
+import random
+
+
+class GeradoresAleatorios:
+    """
+    Deriva geradores independentes (spawn, asteroides, partículas...) de
+    uma única semente
+    
+    Cada subsistema tem seu próprio fluxo de números, então uma mudança em
+    um deles (ex.: mais partículas por explosão) não altera a sequência dos
+    outros. Com a mesma semente e as mesmas entradas, a partida se repete
+    exatamente.
+    """
+    
+    def __init__(self, semente=None):
+        """
+        Inicializa os geradores
+        
+        Args:
+            semente: int (None = sorteada pelo módulo random)
+        """
+        if semente is None:
+            semente = random.getrandbits(32)
+        self.semente = semente
+    
+    def semente_derivada(self, nome):
+        """
+        Semente estável do subsistema (não depende de hash() do Python)
+        
+        Args:
+            nome: Nome do subsistema
+        
+        Returns:
+            int: Semente de 64 bits
+        """
+        resumo = hashlib.sha256(f"{self.semente}:{nome}".encode('utf-8')).digest()
+        return int.from_bytes(resumo[:8], 'little')
+    
+    def gerador(self, nome):
+        """
+        Cria o gerador de um subsistema
+        
+        Args:
+            nome: Nome do subsistema
+        
+        Returns:
+            random.Random: Gerador com a semente derivada
+        """
+        return random.Random(self.semente_derivada(nome))
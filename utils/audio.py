@@ -0,0 +1,134 @@
+"""
+Gerenciador de áudio: canais reservados por categoria, polifonia limitada
+e explosões do mesmo frame agrupadas em uma só voz
+"""
+import os
+import pygame
+
+
+# Mixer: buffer pequeno = menos latência entre o evento e o som
+FREQUENCIA_MIXER = 44100
+BUFFER_MIXER = 512  # Amostras (~12 ms a 44,1 kHz; o padrão do SDL é maior)
+
+# Categoria (= nome do evento da simulação): (arquivos em rodízio, canais reservados, volume)
+CATEGORIAS_SOM = {
+    'tiro': (('tiro1.wav', 'tiro2.wav'), 3, 0.3),
+    'explosao_asteroide': (('explode2.wav', 'explode3.wav', 'explode4.wav'), 4, 0.5),
+    'explosao_nave': (('explode1.wav',), 1, 0.7),
+}
+
+
+def configurar_mixer(frequencia=FREQUENCIA_MIXER, buffer=BUFFER_MIXER):
+    """
+    Configura o mixer com buffer pequeno (chamar antes de pygame.init())
+    
+    Args:
+        frequencia: Taxa de amostragem em Hz
+        buffer: Tamanho do buffer em amostras (potência de 2)
+    """
+    pygame.mixer.pre_init(frequencia, -16, 2, buffer)
+
+
+class CategoriaSom:
+    """
+    Vozes de uma categoria: canais próprios, variações em rodízio
+    """
+    
+    def __init__(self, sons, canais, volume):
+        """
+        Inicializa a categoria
+        
+        Args:
+            sons: Lista de pygame.mixer.Sound (variações tocadas em rodízio)
+            canais: Lista de pygame.mixer.Channel reservados para a categoria
+            volume: Volume de uma ocorrência (0 a 1)
+        """
+        self.sons = sons
+        self.canais = canais
+        self.volume = volume
+        
+        self.proximo_som = 0
+        self.inicio_canal = [0] * len(canais)  # Frame em que cada canal começou a tocar
+        self.pendentes = 0  # Ocorrências registradas no frame
+    
+    def _escolher_canal(self):
+        """Canal livre, ou o que começou a tocar há mais tempo (voz roubada)"""
+        for indice, canal in enumerate(self.canais):
+            if not canal.get_busy():
+                return indice
+        return self.inicio_canal.index(min(self.inicio_canal))
+    
+    def tocar(self, frame):
+        """
+        Toca as ocorrências pendentes como uma única voz
+        
+        N sons iguais ao mesmo tempo somam amplitude de forma parecida com
+        raiz de N, então a voz agrupada soa mais alta sem estourar.
+        
+        Args:
+            frame: Número do frame atual (idade das vozes)
+        """
+        if self.pendentes == 0:
+            return
+        
+        volume = min(1.0, self.volume * self.pendentes ** 0.5)
+        self.pendentes = 0
+        
+        som = self.sons[self.proximo_som]
+        self.proximo_som = (self.proximo_som + 1) % len(self.sons)
+        
+        indice = self._escolher_canal()
+        canal = self.canais[indice]
+        canal.play(som)
+        canal.set_volume(volume)  # Depois do play, que pode reiniciar o volume do canal
+        self.inicio_canal[indice] = frame
+
+
+class GerenciadorAudio:
+    def __init__(self, categorias=CATEGORIAS_SOM, pasta='assets'):
+        """
+        Carrega os sons e reserva os canais de cada categoria
+        
+        Os canais reservados não são usados por Sound.play(), então uma
+        categoria nunca corta as vozes de outra (ex.: uma chuva de tiros não
+        silencia a explosão da nave).
+        
+        Args:
+            categorias: dict nome -> (arquivos, canais, volume)
+            pasta: Pasta dos arquivos de som
+        
+        Raises:
+            pygame.error, FileNotFoundError: Se o mixer ou um arquivo falhar
+        """
+        total_canais = sum(canais for _, canais, _ in categorias.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total_canais))
+        pygame.mixer.set_reserved(total_canais)
+        
+        self.categorias = {}
+        proximo_canal = 0
+        for nome, (arquivos, canais, volume) in categorias.items():
+            sons = [pygame.mixer.Sound(os.path.join(pasta, arquivo)) for arquivo in arquivos]
+            lista_canais = [pygame.mixer.Channel(proximo_canal + i) for i in range(canais)]
+            proximo_canal += canais
+            self.categorias[nome] = CategoriaSom(sons, lista_canais, volume)
+        
+        self.frame = 0
+    
+    def registrar(self, eventos):
+        """
+        Acumula os eventos de um tick (podem vir vários ticks por frame)
+        
+        Args:
+            eventos: Lista de eventos de GameSimulation.step()
+        """
+        categorias = self.categorias
+        for evento in eventos:
+            categoria = categorias.get(evento)
+            if categoria is not None:
+                categoria.pendentes += 1
+    
+    def tocar(self):
+        """Toca, uma voz por categoria, os eventos acumulados no frame"""
+        self.frame += 1
+        for categoria in self.categorias.values():
+            categoria.tocar(self.frame)
@@ -0,0 +1,86 @@
+"""
+Câmera da arena: a janela da tela sobre um mundo maior que ela
+"""
+import numpy as np
+
+
+class Camera:
+    def __init__(self, largura_tela, altura_tela, mundo):
+        """
+        Inicializa a câmera centrada no meio do mundo
+        
+        O mundo (toroidal) precisa ser maior que a tela mais o diâmetro do
+        maior objeto em cada eixo: assim cada objeto tem no máximo uma cópia
+        na tela, a mais próxima do centro da câmera.
+        
+        Args:
+            largura_tela: Largura da área desenhada
+            altura_tela: Altura da área desenhada
+            mundo: MundoToroidal
+        
+        Raises:
+            ValueError: Se o mundo não é maior que a tela
+        """
+        if mundo.largura <= largura_tela or mundo.altura <= altura_tela:
+            raise ValueError(f"Mundo {mundo.largura}x{mundo.altura} não é maior que a tela {largura_tela}x{altura_tela}")
+        
+        self.largura_tela = largura_tela
+        self.altura_tela = altura_tela
+        self.mundo = mundo
+        self.seguir(mundo.largura / 2, mundo.altura / 2)
+    
+    def seguir(self, x, y):
+        """
+        Centraliza a câmera em um ponto do mundo
+        
+        Args:
+            x, y: Ponto do mundo que fica no centro da tela
+        """
+        self.x = x
+        self.y = y
+    
+    def retangulo_mundo(self, margem=0.0):
+        """
+        Área do mundo vista pela câmera (pode passar das bordas do mundo)
+        
+        Args:
+            margem: Pixels acrescentados em cada lado
+        
+        Returns:
+            tuple: (x_min, y_min, x_max, y_max)
+        """
+        meia_largura = self.largura_tela / 2 + margem
+        meia_altura = self.altura_tela / 2 + margem
+        return self.x - meia_largura, self.y - meia_altura, self.x + meia_largura, self.y + meia_altura
+    
+    def deslocamento(self, x, y, raio):
+        """
+        Translação que leva um círculo do mundo para a tela
+        
+        Args:
+            x, y: Centro do círculo no mundo
+            raio: Raio que envolve todo o desenho
+        
+        Returns:
+            tuple ou None: (dx, dy) a somar ao desenho, ou None se o círculo
+                está fora da vista (não precisa ser transformado nem desenhado)
+        """
+        dx, dy = self.mundo.delta(self.x, self.y, x, y)
+        if abs(dx) > self.largura_tela / 2 + raio or abs(dy) > self.altura_tela / 2 + raio:
+            return None
+        return dx + self.largura_tela / 2 - x, dy + self.altura_tela / 2 - y
+    
+    def para_tela(self, posicoes):
+        """
+        Posições do mundo na tela, em lote
+        
+        Args:
+            posicoes: Array (N, 2) de posições no mundo
+        
+        Returns:
+            np.ndarray: Array (N, 2) com a cópia de cada posição mais próxima
+                do centro da câmera, em coordenadas da tela
+        """
+        tamanho = np.array((self.mundo.largura, self.mundo.altura))
+        relativas = (posicoes - (self.x, self.y) + tamanho / 2) % tamanho - tamanho / 2
+        return relativas + (self.largura_tela / 2, self.altura_tela / 2)
@@ -23,3 +23,45 @@ def interpolar_cor(profundidade):
     b = int(COR_DISTANTE[2] + (COR_PROXIMA[2] - COR_DISTANTE[2]) * profundidade)
     
     return (r, g, b)
+
+
+# Níveis de fade (alpha ou brilho) usados por efeitos que desaparecem
+NIVEIS_FADE = 16
+
+_tabelas_fade = {}
+
+
+def quantizar_fade(fator):
+    """
+    Converte um fator de fade contínuo em um nível da tabela de fade
+    
+    Args:
+        fator: float de 0.0 (invisível) a 1.0 (opaco)
+    
+    Returns:
+        int: Nível de 0 a NIVEIS_FADE - 1
+    """
+    nivel = int(fator * (NIVEIS_FADE - 1) + 0.5)
+    return max(0, min(NIVEIS_FADE - 1, nivel))
+
+
+def tabela_fade(cor):
+    """
+    Retorna as versões escurecidas de uma cor, uma por nível de fade
+    
+    A tabela é calculada uma única vez por cor e compartilhada.
+    
+    Args:
+        cor: tuple (R, G, B)
+    
+    Returns:
+        tuple: NIVEIS_FADE cores, do nível 0 (preto) ao último (cor original)
+    """
+    tabela = _tabelas_fade.get(cor)
+    if tabela is None:
+        tabela = tuple(
+            tuple(int(c * nivel / (NIVEIS_FADE - 1)) for c in cor)
+            for nivel in range(NIVEIS_FADE)
+        )
+        _tabelas_fade[cor] = tabela
+    return tabela
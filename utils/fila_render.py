@@ -0,0 +1,188 @@
+"""
+Fila de renderização em camadas, com entidades mantidas em ordem de profundidade
+"""
+from bisect import bisect_left, bisect_right
+from utils.perfil import PerfiladorNulo
+
+
+class CamadaOrdenada:
+    """
+    Entidades mantidas em ordem crescente de profundidade (distantes primeiro)
+    
+    A profundidade é fixa desde a criação da entidade (fragmentos herdam a
+    do pai), então a ordem é mantida inserindo cada entidade na posição
+    certa quando ela nasce (bisect) e tirando-a quando morre, em vez de
+    reordenar a lista inteira a cada frame.
+    
+    Pode ser registrada como observadora de uma ListaEntidades.
+    """
+    
+    def __init__(self, funcao_desenho, atributo='profundidade'):
+        """
+        Inicializa a camada
+        
+        Args:
+            funcao_desenho: Função (tela, entidades) que desenha a lista ordenada
+            atributo: Nome do atributo usado como chave de ordenação
+        """
+        self.funcao_desenho = funcao_desenho
+        self.atributo = atributo
+        self.entidades = []
+        self.chaves = []  # Chave de cada entidade, paralela a self.entidades
+    
+    def __len__(self):
+        return len(self.entidades)
+    
+    def inserir(self, entidade):
+        """
+        Insere uma entidade na posição da sua profundidade
+        
+        Entidades de mesma profundidade ficam na ordem de inserção.
+        
+        Args:
+            entidade: Entidade a inserir
+        """
+        chave = getattr(entidade, self.atributo)
+        indice = bisect_right(self.chaves, chave)
+        self.chaves.insert(indice, chave)
+        self.entidades.insert(indice, entidade)
+    
+    def remover(self, entidade):
+        """
+        Remove uma entidade (busca binária pela chave e depois por identidade)
+        
+        Args:
+            entidade: Entidade a remover
+        
+        Returns:
+            bool: True se a entidade estava na camada
+        """
+        chave = getattr(entidade, self.atributo)
+        chaves = self.chaves
+        entidades = self.entidades
+        
+        indice = bisect_left(chaves, chave)
+        fim = bisect_right(chaves, chave, indice)
+        for i in range(indice, fim):
+            if entidades[i] is entidade:
+                del chaves[i]
+                del entidades[i]
+                return True
+        return False
+    
+    def limpar(self):
+        """Remove todas as entidades"""
+        self.entidades.clear()
+        self.chaves.clear()
+    
+    def desenhar(self, tela):
+        """
+        Desenha as entidades, das mais distantes para as mais próximas
+        
+        Args:
+            tela: Surface do Pygame
+        
+        Returns:
+            O retorno de funcao_desenho (None se não há entidades)
+        """
+        if self.entidades:
+            return self.funcao_desenho(tela, self.entidades)
+        return None
+
+
+class FilaRender:
+    """
+    Sequência nomeada de camadas desenhadas em ordem (fundo primeiro)
+    
+    Cada camada é uma função que recebe a tela. Para acrescentar um novo
+    elemento visual basta adicionar uma camada na posição desejada.
+    O tempo de cada camada é marcado no perfilador como 'desenho_<nome>'.
+    
+    Opcionalmente, cada camada informa as áreas da tela que desenhou no
+    frame (funcao_areas), usadas pelo modo de retângulos sujos.
+    """
+    
+    def __init__(self):
+        """Inicializa a fila vazia"""
+        self.nomes = []
+        self.camadas = []
+        self.ativas = []
+        self.fases = []  # Nome da fase de cada camada no perfilador
+        self.funcoes_areas = []
+        self.perfilador = PerfiladorNulo()
+    
+    def adicionar(self, nome, funcao_desenho, antes=None, funcao_areas=None):
+        """
+        Adiciona uma camada
+        
+        Args:
+            nome: Nome único da camada
+            funcao_desenho: Função (tela) que desenha a camada
+            antes: Nome da camada antes da qual inserir (None = no topo)
+            funcao_areas: Função () que retorna a lista de retângulos
+                (Rect ou (x, y, largura, altura); None é ignorado)
+                desenhados no frame (opcional)
+        """
+        if nome in self.nomes:
+            raise ValueError(f"Camada já existe: {nome}")
+        
+        indice = len(self.nomes) if antes is None else self.nomes.index(antes)
+        self.nomes.insert(indice, nome)
+        self.camadas.insert(indice, funcao_desenho)
+        self.ativas.insert(indice, True)
+        self.fases.insert(indice, 'desenho_' + nome)
+        self.funcoes_areas.insert(indice, funcao_areas)
+    
+    def remover(self, nome):
+        """
+        Remove uma camada
+        
+        Args:
+            nome: Nome da camada
+        """
+        indice = self.nomes.index(nome)
+        del self.nomes[indice]
+        del self.camadas[indice]
+        del self.ativas[indice]
+        del self.fases[indice]
+        del self.funcoes_areas[indice]
+    
+    def ativar(self, nome, ativa=True):
+        """
+        Liga ou desliga o desenho de uma camada
+        
+        Args:
+            nome: Nome da camada
+            ativa: True para desenhar a camada
+        """
+        self.ativas[self.nomes.index(nome)] = ativa
+    
+    def desenhar(self, tela):
+        """
+        Desenha todas as camadas ativas, na ordem
+        
+        Args:
+            tela: Surface do Pygame
+        """
+        perfilador = self.perfilador
+        for funcao_desenho, ativa, fase in zip(self.camadas, self.ativas, self.fases):
+            if ativa:
+                funcao_desenho(tela)
+                perfilador.marcar(fase)
+    
+    def areas(self):
+        """
+        Retângulos desenhados no último frame por todas as camadas ativas
+        
+        Returns:
+            list ou None: Retângulos, ou None se alguma camada ativa não
+                sabe informar suas áreas (nesse caso a tela toda mudou)
+        """
+        areas = []
+        for funcao_areas, ativa in zip(self.funcoes_areas, self.ativas):
+            if not ativa:
+                continue
+            if funcao_areas is None:
+                return None
+            areas.extend(funcao_areas())
+        return areas
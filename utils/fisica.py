@@ -1,6 +1,7 @@
 """
 Utilitários para física e colisões
 """
+import math
 import pygame
 
 
@@ -19,3 +20,205 @@ def checar_colisao_circular(obj1_pos, obj1_raio, obj2_pos, obj2_raio):
     """
     distancia = obj1_pos.distance_to(obj2_pos)
     return distancia < (obj1_raio + obj2_raio)
+
+
+def checar_colisao_varrida(inicio_x, inicio_y, fim_x, fim_y, raio, centro_x, centro_y, raio_alvo):
+    """
+    Colisão contínua: círculo que se move em linha reta contra um círculo parado
+    
+    Testa o segmento inteiro percorrido no tick, não só a posição final, então
+    objetos rápidos não atravessam alvos pequenos quando o dt é grande. Para
+    um alvo que também se move, passe o movimento relativo a ele:
+    inicio = fim - (vel - vel_alvo) * dt.
+    
+    Args:
+        inicio_x, inicio_y: Posição no início do tick
+        fim_x, fim_y: Posição no fim do tick
+        raio: float - raio do objeto que se move
+        centro_x, centro_y: Posição do alvo
+        raio_alvo: float - raio do alvo
+    
+    Returns:
+        float ou None: Fração do trajeto (0 a 1) no primeiro contato, ou None sem colisão
+    """
+    fx = inicio_x - centro_x
+    fy = inicio_y - centro_y
+    soma_raios = raio + raio_alvo
+    c = fx * fx + fy * fy - soma_raios * soma_raios
+    if c < 0:
+        return 0.0  # Já se tocavam no início do tick
+    
+    dx = fim_x - inicio_x
+    dy = fim_y - inicio_y
+    b = fx * dx + fy * dy
+    if b >= 0:
+        return None  # Parado ou se afastando do alvo
+    
+    # Menor raiz de |f + t*d| = soma_raios (equação de segundo grau em t)
+    a = dx * dx + dy * dy
+    discriminante = b * b - a * c
+    if discriminante < 0:
+        return None
+    t = (-b - math.sqrt(discriminante)) / a
+    return t if t <= 1.0 else None
+
+
+def _envolver_indices(inicio, fim, num):
+    """Índices de células de inicio a fim (inclusive) módulo num, sem repetição"""
+    if fim - inicio + 1 >= num:
+        return range(num)  # O intervalo dá a volta inteira no mundo
+    return [indice % num for indice in range(inicio, fim + 1)]
+
+
+class GradeEspacial:
+    """
+    Grade uniforme (spatial hash) para broad-phase de colisões
+    
+    Cada objeto é registrado só na célula do seu centro, e uma consulta
+    cobre as células tocadas pelo círculo consultado ampliado pelo maior
+    raio registrado. Registrar custa um acesso ao dicionário por objeto
+    (são milhares por tick no modo horda); a consulta, feita bem menos
+    vezes, olha algumas células a mais. Os candidatos passam então pelo
+    teste exato (checar_colisao_circular, ou MundoToroidal.colidem num
+    mundo toroidal).
+    """
+    
+    def __init__(self, tamanho_celula=80, mundo=None):
+        """
+        Inicializa a grade
+        
+        Args:
+            tamanho_celula: Lado de cada célula em pixels (idealmente
+                próximo do diâmetro do maior objeto inserido)
+            mundo: MundoToroidal (None = plano sem bordas). Com um mundo, as
+                células das bordas continuam do outro lado; o tamanho das
+                células é ajustado para um número inteiro delas por eixo
+        """
+        self.tamanho_celula = tamanho_celula
+        self.mundo = mundo
+        self.celulas = {}
+        self.raio_maximo = 0.0  # Maior raio registrado desde o último limpar()
+        
+        if mundo is None:
+            self.num_x = self.num_y = None
+            self.tamanho_x = self.tamanho_y = tamanho_celula
+        else:
+            self.num_x = max(1, round(mundo.largura / tamanho_celula))
+            self.num_y = max(1, round(mundo.altura / tamanho_celula))
+            self.tamanho_x = mundo.largura / self.num_x
+            self.tamanho_y = mundo.altura / self.num_y
+    
+    def limpar(self):
+        """Remove todos os objetos da grade (chamado no início de cada tick)"""
+        self.celulas.clear()
+        self.raio_maximo = 0.0
+    
+    def _intervalo_celulas(self, pos, raio):
+        """
+        Calcula o intervalo de células coberto por um círculo
+        
+        Returns:
+            tuple: (cx_min, cx_max, cy_min, cy_max)
+        """
+        tamanho_x = self.tamanho_x
+        tamanho_y = self.tamanho_y
+        return (
+            int((pos.x - raio) // tamanho_x),
+            int((pos.x + raio) // tamanho_x),
+            int((pos.y - raio) // tamanho_y),
+            int((pos.y + raio) // tamanho_y)
+        )
+    
+    def _atravessa_borda(self, cx_min, cx_max, cy_min, cy_max):
+        """True se o intervalo sai da grade de um mundo toroidal (precisa dar a volta)"""
+        return self.mundo is not None and (cx_min < 0 or cy_min < 0 or cx_max >= self.num_x or cy_max >= self.num_y)
+    
+    def _celulas_envolvidas(self, cx_min, cx_max, cy_min, cy_max):
+        """Colunas e linhas de um intervalo que cruza a borda, trazidas para dentro da grade"""
+        return _envolver_indices(cx_min, cx_max, self.num_x), _envolver_indices(cy_min, cy_max, self.num_y)
+    
+    def inserir(self, obj, pos, raio):
+        """
+        Registra um objeto na célula do seu centro
+        
+        Args:
+            obj: Objeto a ser registrado (uma vez por limpar())
+            pos: pygame.math.Vector2 - posição do objeto
+            raio: float - raio de colisão do objeto
+        """
+        if raio > self.raio_maximo:
+            self.raio_maximo = raio
+        
+        chave = (int(pos.x // self.tamanho_x), int(pos.y // self.tamanho_y))
+        if self.num_x is not None:
+            # Fragmentos recém-criados podem estar um pouco fora do mundo
+            chave = (chave[0] % self.num_x, chave[1] % self.num_y)
+        
+        celula = self.celulas.get(chave)
+        if celula is None:
+            self.celulas[chave] = [obj]
+        else:
+            celula.append(obj)
+    
+    def consultar(self, pos, raio):
+        """
+        Retorna os candidatos a colisão com um círculo
+        
+        Args:
+            pos: pygame.math.Vector2 - centro do círculo consultado
+            raio: float - raio do círculo consultado
+        
+        Returns:
+            list: Objetos registrados nas células tocadas (cada um uma vez)
+        """
+        cx_min, cx_max, cy_min, cy_max = self._intervalo_celulas(pos, raio + self.raio_maximo)
+        celulas = self.celulas
+        
+        if self._atravessa_borda(cx_min, cx_max, cy_min, cy_max):
+            colunas, linhas = self._celulas_envolvidas(cx_min, cx_max, cy_min, cy_max)
+        else:
+            # O círculo ampliado cabe em uma única célula
+            if cx_min == cx_max and cy_min == cy_max:
+                return list(celulas.get((cx_min, cy_min), ()))
+            colunas = range(cx_min, cx_max + 1)
+            linhas = range(cy_min, cy_max + 1)
+        
+        return self._coletar(colunas, linhas)
+    
+    def consultar_retangulo(self, x_min, y_min, x_max, y_max):
+        """
+        Retorna os objetos cujos círculos podem tocar um retângulo
+        
+        Usada para achar o que está na vista da câmera sem percorrer todos
+        os objetos. Num mundo toroidal o retângulo pode passar das bordas.
+        
+        Args:
+            x_min, y_min, x_max, y_max: Cantos do retângulo
+        
+        Returns:
+            list: Objetos registrados nas células tocadas pelo retângulo
+                ampliado pelo maior raio (cada um uma vez)
+        """
+        margem = self.raio_maximo
+        cx_min = int((x_min - margem) // self.tamanho_x)
+        cx_max = int((x_max + margem) // self.tamanho_x)
+        cy_min = int((y_min - margem) // self.tamanho_y)
+        cy_max = int((y_max + margem) // self.tamanho_y)
+        
+        if self._atravessa_borda(cx_min, cx_max, cy_min, cy_max):
+            colunas, linhas = self._celulas_envolvidas(cx_min, cx_max, cy_min, cy_max)
+        else:
+            colunas = range(cx_min, cx_max + 1)
+            linhas = range(cy_min, cy_max + 1)
+        return self._coletar(colunas, linhas)
+    
+    def _coletar(self, colunas, linhas):
+        """Objetos das células indicadas (cada objeto está em uma só célula)"""
+        celulas = self.celulas
+        candidatos = []
+        for cx in colunas:
+            for cy in linhas:
+                celula = celulas.get((cx, cy))
+                if celula:
+                    candidatos.extend(celula)
+        return candidatos
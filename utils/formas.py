@@ -0,0 +1,209 @@
+"""
+Banco de formas de asteroides pré-calculadas (com cache em disco)
+"""
+import hashlib
+import math
+import os
+import random
+import tempfile
+import zipfile
+import numpy as np
+import pygame
+
+
+NUM_FORMAS = 32  # Formas distintas por tamanho
+MIN_VERTICES = 8
+MAX_VERTICES = 12
+VARIACAO_RAIO = (0.7, 1.3)  # Raio de cada vértice: 70% a 130% do tamanho
+
+SEMENTE_FORMAS = 1979  # Fixa: as formas são as mesmas em toda partida e em todo replay
+VERSAO_CACHE = 3  # Subir a cada mudança no código de BancoFormas.gerar
+# Na raiz do projeto, e não na pasta de onde o jogo foi chamado
+CAMINHO_CACHE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'cache', 'formas_asteroides.npz')
+
+
+class BancoFormas:
+    """
+    Polígonos irregulares gerados uma vez e compartilhados pelos asteroides
+    
+    As formas são guardadas em tamanho unitário (fatores de raio) e
+    escalonadas uma única vez para cada tamanho inteiro de asteroide. Um
+    asteroide só guarda o índice da forma e referencia os vértices do banco,
+    sem trigonometria nem alocação ao nascer.
+    """
+    
+    def __init__(self, raios, contagens):
+        """
+        Inicializa o banco
+        
+        Args:
+            raios: array (N, MAX_VERTICES) com o fator de raio de cada vértice
+            contagens: array (N,) com o número de vértices de cada forma
+        """
+        self.raios = raios
+        self.contagens = contagens
+        
+        # Vértices unitários de cada forma (ângulos igualmente espaçados)
+        self.unitarias = []
+        for raios_forma, contagem in zip(raios.tolist(), contagens.tolist()):
+            angulos = np.arange(contagem) * (2 * math.pi / contagem)
+            fatores = np.array(raios_forma[:contagem])
+            self.unitarias.append(np.column_stack((fatores * np.cos(angulos), fatores * np.sin(angulos))))
+        
+        self.por_tamanho = {}  # tamanho -> lista de (pontos, vertices)
+    
+    def __len__(self):
+        return len(self.unitarias)
+    
+    @classmethod
+    def gerar(cls, num_formas=NUM_FORMAS, semente=SEMENTE_FORMAS):
+        """
+        Gera formas novas
+        
+        Args:
+            num_formas: Número de formas
+            semente: Semente do gerador
+        
+        Returns:
+            BancoFormas: Banco com as formas geradas
+        """
+        rng = random.Random(semente)
+        raios = np.zeros((num_formas, MAX_VERTICES))
+        contagens = np.zeros(num_formas, dtype=np.int32)
+        for indice in range(num_formas):
+            contagem = rng.randint(MIN_VERTICES, MAX_VERTICES)
+            contagens[indice] = contagem
+            raios[indice, :contagem] = [rng.uniform(*VARIACAO_RAIO) for _ in range(contagem)]
+        return cls(raios, contagens)
+    
+    @classmethod
+    def carregar(cls, caminho, num_formas=NUM_FORMAS, semente=SEMENTE_FORMAS):
+        """
+        Lê um banco salvo por salvar()
+        
+        Args:
+            caminho: Arquivo .npz
+            num_formas: Número de formas esperado
+            semente: Semente esperada
+        
+        Returns:
+            BancoFormas ou None: None se o arquivo não existe ou foi gerado
+                com outros parâmetros (ver chave_cache)
+        """
+        try:
+            with np.load(caminho) as dados:
+                if str(dados['chave']) != chave_cache(num_formas, semente):
+                    return None
+                return cls(dados['raios'], dados['contagens'])
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+    
+    def salvar(self, caminho, semente=SEMENTE_FORMAS):
+        """
+        Grava as formas em disco
+        
+        O arquivo é escrito ao lado e trocado de uma vez (os.replace): um
+        processo lendo o cache ao mesmo tempo (ex.: workers da fazenda) vê
+        o arquivo antigo inteiro ou o novo inteiro.
+        
+        Args:
+            caminho: Arquivo .npz
+            semente: Semente com que as formas foram geradas
+        """
+        pasta = os.path.dirname(caminho) or '.'
+        os.makedirs(pasta, exist_ok=True)
+        chave = np.array(chave_cache(len(self), semente))
+        descritor, temporario = tempfile.mkstemp(suffix='.tmp', dir=pasta)
+        try:
+            with os.fdopen(descritor, 'wb') as arquivo:
+                np.savez(arquivo, chave=chave, raios=self.raios, contagens=self.contagens)
+            os.replace(temporario, caminho)
+        except BaseException:
+            os.unlink(temporario)
+            raise
+    
+    def preparar(self, tamanhos):
+        """
+        Escalona todas as formas para os tamanhos dados
+        
+        Args:
+            tamanhos: Iterável de tamanhos inteiros (raio em pixels)
+        """
+        for tamanho in tamanhos:
+            if tamanho in self.por_tamanho:
+                continue
+            
+            formas = []
+            for unitaria in self.unitarias:
+                vertices = unitaria * tamanho
+                vertices.flags.writeable = False  # Compartilhado por vários asteroides
+                pontos = [pygame.math.Vector2(x, y) for x, y in vertices.tolist()]
+                formas.append((pontos, vertices))
+            self.por_tamanho[tamanho] = formas
+    
+    def forma(self, tamanho, indice):
+        """
+        Retorna uma forma já escalonada
+        
+        Args:
+            tamanho: Tamanho inteiro do asteroide
+            indice: Índice da forma (0 a len(banco) - 1)
+        
+        Returns:
+            tuple: (pontos, vertices) - lista de Vector2 e array (n, 2), compartilhados
+        """
+        formas = self.por_tamanho.get(tamanho)
+        if formas is None:
+            self.preparar((tamanho,))
+            formas = self.por_tamanho[tamanho]
+        return formas[indice]
+
+
+def chave_cache(num_formas=NUM_FORMAS, semente=SEMENTE_FORMAS):
+    """
+    Identifica as formas que o gerador produz com os parâmetros atuais
+    
+    Junta VERSAO_CACHE e todos os parâmetros de geração: mudar qualquer
+    parâmetro invalida o cache, mesmo sem subir VERSAO_CACHE (um cache
+    antigo daria formas diferentes das geradas e quebraria os replays). Só
+    valores estáveis entre execuções entram na chave.
+    
+    Args:
+        num_formas: Número de formas
+        semente: Semente do gerador
+    
+    Returns:
+        str: Hash SHA-256 em hexadecimal
+    """
+    parametros = (VERSAO_CACHE, semente, num_formas, MIN_VERTICES, MAX_VERTICES, VARIACAO_RAIO)
+    return hashlib.sha256(repr(parametros).encode('utf-8')).hexdigest()
+
+
+_banco = None
+
+
+def banco_formas(tamanhos=(), caminho=CAMINHO_CACHE):
+    """
+    Retorna o banco compartilhado, lendo do cache em disco ou gerando
+    
+    Args:
+        tamanhos: Tamanhos a escalonar já na criação do banco
+        caminho: Arquivo de cache (None = não usar disco)
+    
+    Returns:
+        BancoFormas: Banco de formas
+    """
+    global _banco
+    if _banco is None:
+        banco = BancoFormas.carregar(caminho) if caminho else None
+        if banco is None:
+            banco = BancoFormas.gerar()
+            if caminho:
+                try:
+                    banco.salvar(caminho)
+                except OSError:
+                    pass  # Sem permissão de escrita (ex.: navegador): só não guarda o cache
+        banco.preparar(tamanhos)
+        _banco = banco
+    return _banco
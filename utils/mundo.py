@@ -0,0 +1,116 @@
+"""
+Mundo toroidal: quem sai por uma borda entra pela oposta
+
+Distâncias e colisões usam a imagem mínima (a cópia do outro objeto mais
+próxima, considerando que o mundo se repete nos dois eixos) e o desenho
+repete, do outro lado, quem está cruzando uma borda (cópias fantasma).
+"""
+
+
+class MundoToroidal:
+    def __init__(self, largura, altura):
+        """
+        Inicializa o mundo
+        
+        Args:
+            largura: Largura do mundo em pixels
+            altura: Altura do mundo em pixels
+        """
+        self.largura = largura
+        self.altura = altura
+        self.meia_largura = largura / 2
+        self.meia_altura = altura / 2
+    
+    def envolver(self, pos):
+        """
+        Traz uma posição para dentro do mundo, [0, largura) x [0, altura)
+        
+        Args:
+            pos: pygame.math.Vector2 (alterado no lugar)
+        """
+        # Comparação primeiro: quase sempre a posição já está dentro
+        if not 0 <= pos.x < self.largura:
+            pos.x %= self.largura
+        if not 0 <= pos.y < self.altura:
+            pos.y %= self.altura
+    
+    def delta(self, origem_x, origem_y, destino_x, destino_y):
+        """
+        Deslocamento mais curto de origem até destino (imagem mínima)
+        
+        Returns:
+            tuple: (dx, dy), cada um entre -metade e +metade do mundo
+        """
+        dx = destino_x - origem_x
+        if dx > self.meia_largura:
+            dx -= self.largura
+        elif dx < -self.meia_largura:
+            dx += self.largura
+        
+        dy = destino_y - origem_y
+        if dy > self.meia_altura:
+            dy -= self.altura
+        elif dy < -self.meia_altura:
+            dy += self.altura
+        return dx, dy
+    
+    def imagem_proxima(self, x, y, ref_x, ref_y):
+        """
+        Cópia de (x, y) mais próxima de (ref_x, ref_y)
+        
+        Usada nos testes exatos que recebem coordenadas absolutas
+        (checar_colisao_varrida): longe das bordas devolve o próprio ponto.
+        
+        Returns:
+            tuple: (x, y) possivelmente fora do mundo, do lado de ref
+        """
+        dx, dy = self.delta(ref_x, ref_y, x, y)
+        return ref_x + dx, ref_y + dy
+    
+    def distancia2(self, pos1, pos2):
+        """Quadrado da menor distância entre duas posições (pygame.math.Vector2)"""
+        dx, dy = self.delta(pos1.x, pos1.y, pos2.x, pos2.y)
+        return dx * dx + dy * dy
+    
+    def colidem(self, pos1, raio1, pos2, raio2):
+        """
+        Colisão entre dois círculos, inclusive através das bordas
+        
+        Equivalente a checar_colisao_circular com a imagem mínima.
+        
+        Returns:
+            bool: True se os círculos se sobrepõem
+        """
+        soma_raios = raio1 + raio2
+        return self.distancia2(pos1, pos2) < soma_raios * soma_raios
+    
+    def fantasmas(self, x, y, raio):
+        """
+        Deslocamentos das cópias de um círculo que aparecem do outro lado das bordas
+        
+        Args:
+            x, y: Centro do círculo desenhado
+            raio: Raio que envolve todo o desenho
+        
+        Returns:
+            tuple: Pares (dx, dy) a somar ao desenho; vazio quando o círculo
+                não toca nenhuma borda (o caso de quase todas as entidades)
+        """
+        largura = self.largura
+        altura = self.altura
+        if raio <= x <= largura - raio and raio <= y <= altura - raio:
+            return ()
+        
+        desloc_x = [0]
+        if x < raio:
+            desloc_x.append(largura)
+        if x > largura - raio:
+            desloc_x.append(-largura)
+        
+        desloc_y = [0]
+        if y < raio:
+            desloc_y.append(altura)
+        if y > altura - raio:
+            desloc_y.append(-altura)
+        
+        return tuple((dx, dy) for dx in desloc_x for dy in desloc_y if dx or dy)
@@ -0,0 +1,51 @@
+"""
+Passo fixo de simulação desacoplado da taxa de desenho
+"""
+
+
+class PassoFixo:
+    """
+    Acumulador de tempo: converte o tempo de cada frame em passos de
+    simulação de duração fixa
+    
+    O tempo que sobra (menos de um passo) fica guardado para o próximo
+    frame. O desenho fica entre o penúltimo e o último passo, a uma
+    fração `alfa` do caminho, então o movimento sai suave em qualquer
+    taxa de quadros (30, 60, 144 Hz...), com a mesma física em todas.
+    """
+    
+    def __init__(self, dt, max_passos=8):
+        """
+        Inicializa o acumulador
+        
+        Args:
+            dt: Duração de um passo em segundos (ex.: 1/120)
+            max_passos: Máximo de passos por frame; depois de uma travada
+                longa o jogo desacelera em vez de tentar recuperar tudo
+        """
+        self.dt = dt
+        self.max_passos = max_passos
+        self.acumulado = 0.0
+    
+    def avancar(self, dt_frame):
+        """
+        Soma o tempo de um frame
+        
+        Args:
+            dt_frame: Tempo do frame em segundos
+        
+        Returns:
+            int: Número de passos de simulação a executar neste frame
+        """
+        acumulado = min(self.acumulado + dt_frame, self.dt * (self.max_passos + 1))
+        passos = min(int(acumulado / self.dt), self.max_passos)
+        self.acumulado = acumulado - passos * self.dt
+        return passos
+    
+    def alfa(self):
+        """Fração (0 a 1) do caminho entre o penúltimo e o último passo"""
+        return self.acumulado / self.dt
+    
+    def atraso(self):
+        """Tempo (s) que o desenho está atrás do último passo: (1 - alfa) * dt"""
+        return max(0.0, self.dt - self.acumulado)
@@ -0,0 +1,198 @@
+"""
+Medição de tempo por fase do frame (simulação e desenho)
+"""
+import csv
+import time
+import numpy as np
+
+
+class PerfiladorNulo:
+    """
+    Perfilador que não mede nada
+    
+    É o padrão da simulação e da fila de renderização, para que as
+    marcações custem apenas uma chamada vazia quando ninguém está medindo.
+    """
+    
+    def iniciar_frame(self):
+        pass
+    
+    def marcar(self, fase):
+        pass
+    
+    def finalizar_frame(self):
+        pass
+
+
+class HistoricoFrames:
+    """
+    Buffer circular com o tempo de cada fase nos últimos frames
+    
+    Os tempos ficam em um array NumPy de tamanho fixo (frames x fases),
+    sobrescrito em círculo: guardar um frame não aloca memória, e os
+    frames mais antigos são descartados automaticamente.
+    """
+    
+    def __init__(self, capacidade=600, max_fases=32):
+        """
+        Inicializa o histórico
+        
+        Args:
+            capacidade: Número de frames guardados
+            max_fases: Número inicial de colunas (cresce se aparecerem mais fases)
+        """
+        self.capacidade = capacidade
+        self.tempos = np.zeros((capacidade, max_fases), dtype=np.float64)  # Segundos
+        self.fases = []  # Nome da fase de cada coluna, na ordem em que apareceram
+        self.colunas = {}
+        self.proximo = 0  # Linha onde o próximo frame será gravado
+        self.quantidade = 0  # Frames válidos no buffer
+        self.total_registrado = 0  # Frames registrados desde o início
+    
+    def _coluna(self, fase):
+        """Retorna a coluna da fase, criando-a se for nova"""
+        coluna = self.colunas.get(fase)
+        if coluna is None:
+            coluna = len(self.fases)
+            if coluna == self.tempos.shape[1]:
+                extra = np.zeros_like(self.tempos)
+                self.tempos = np.hstack((self.tempos, extra))
+            self.fases.append(fase)
+            self.colunas[fase] = coluna
+        return coluna
+    
+    def registrar(self, frame):
+        """
+        Grava um frame, sobrescrevendo o mais antigo se o buffer estiver cheio
+        
+        Args:
+            frame: dict fase -> segundos
+        """
+        linha = self.tempos[self.proximo]
+        linha[:] = 0.0
+        for fase, decorrido in frame.items():
+            linha[self._coluna(fase)] = decorrido
+        
+        self.proximo = (self.proximo + 1) % self.capacidade
+        self.quantidade = min(self.quantidade + 1, self.capacidade)
+        self.total_registrado += 1
+    
+    def ultimos(self, n=None):
+        """
+        Retorna os últimos frames em ordem cronológica
+        
+        Args:
+            n: Número de frames (None = todos os do buffer)
+        
+        Returns:
+            numpy.ndarray: (frames x fases) em milissegundos
+        """
+        n = self.quantidade if n is None else min(n, self.quantidade)
+        num_fases = len(self.fases)
+        indices = (self.proximo - n + np.arange(n)) % self.capacidade
+        return self.tempos[indices, :num_fases] * 1000.0
+    
+    def estatisticas(self):
+        """
+        Média e percentil 99 de cada fase no buffer
+        
+        Returns:
+            list: (fase, média ms, p99 ms), a última linha é o frame 'total'
+        """
+        if self.quantidade == 0:
+            return []
+        
+        tempos = self.ultimos()
+        medias = tempos.mean(axis=0)
+        p99 = np.percentile(tempos, 99, axis=0)
+        
+        linhas = list(zip(self.fases, medias.tolist(), p99.tolist()))
+        totais = tempos.sum(axis=1)
+        linhas.append(('total', float(totais.mean()), float(np.percentile(totais, 99))))
+        return linhas
+    
+    def exportar_csv(self, caminho):
+        """
+        Grava o buffer em CSV (um frame por linha, tempos em ms)
+        
+        Args:
+            caminho: Arquivo de saída
+        """
+        tempos = self.ultimos()
+        primeiro = self.total_registrado - len(tempos)
+        
+        with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(['frame'] + self.fases + ['total'])
+            for indice, linha in enumerate(tempos.tolist()):
+                escritor.writerow([primeiro + indice] + [f"{ms:.4f}" for ms in linha] + [f"{sum(linha):.4f}"])
+
+
+class Perfilador:
+    """
+    Acumula o tempo gasto em cada fase do frame
+    
+    Cada marcar(fase) atribui à fase o tempo decorrido desde a marcação
+    anterior (ou desde iniciar_frame), então as fases são medidas em
+    sequência, sem pares de início/fim.
+    """
+    
+    def __init__(self, relogio=time.perf_counter, historico=None):
+        """
+        Inicializa o perfilador
+        
+        Args:
+            relogio: Função que retorna o tempo atual em segundos
+            historico: HistoricoFrames que recebe cada frame finalizado (opcional)
+        """
+        self.relogio = relogio
+        self.historico = historico
+        self.totais = {}  # Segundos acumulados por fase
+        self.frame_atual = {}  # Segundos por fase no frame em andamento
+        self.frames = 0
+        self._ultima_marca = None
+    
+    def zerar(self):
+        """Descarta tudo o que foi medido (ex.: depois do aquecimento)"""
+        self.totais = {}
+        self.frames = 0
+    
+    def iniciar_frame(self):
+        """Começa a medir um novo frame"""
+        self.frame_atual = {}
+        self._ultima_marca = self.relogio()
+    
+    def marcar(self, fase):
+        """
+        Atribui à fase o tempo decorrido desde a última marcação
+        
+        Args:
+            fase: Nome da fase que acabou de terminar
+        """
+        agora = self.relogio()
+        decorrido = agora - self._ultima_marca
+        self._ultima_marca = agora
+        
+        frame_atual = self.frame_atual
+        frame_atual[fase] = frame_atual.get(fase, 0.0) + decorrido
+    
+    def finalizar_frame(self):
+        """Soma o frame em andamento aos totais (e o grava no histórico)"""
+        totais = self.totais
+        for fase, decorrido in self.frame_atual.items():
+            totais[fase] = totais.get(fase, 0.0) + decorrido
+        self.frames += 1
+        
+        if self.historico is not None:
+            self.historico.registrar(self.frame_atual)
+    
+    def resumo(self):
+        """
+        Retorna o tempo médio de cada fase por frame
+        
+        Returns:
+            dict: Fase -> milissegundos por frame
+        """
+        if self.frames == 0:
+            return {}
+        return {fase: 1000.0 * total / self.frames for fase, total in self.totais.items()}
@@ -0,0 +1,164 @@
+"""
+Utilitários para reaproveitamento de entidades (object pooling)
+"""
+from operator import attrgetter
+
+
+class Pool:
+    """
+    Reservatório de entidades mortas prontas para reuso
+    
+    A classe das entidades precisa ter um método resetar() com os mesmos
+    argumentos do construtor.
+    """
+    
+    def __init__(self, classe, capacidade_maxima=2048):
+        """
+        Inicializa o pool
+        
+        Args:
+            classe: Classe das entidades (ex.: Asteroid)
+            capacidade_maxima: Máximo de entidades livres guardadas
+        """
+        self.classe = classe
+        self.capacidade_maxima = capacidade_maxima
+        self.livres = []
+        
+        # Contadores para medir a taxa de alocação
+        self.criados = 0
+        self.reutilizados = 0
+    
+    def obter(self, *args, **kwargs):
+        """
+        Retorna uma entidade inicializada, reaproveitando uma livre se houver
+        
+        Returns:
+            Entidade pronta para uso
+        """
+        if self.livres:
+            entidade = self.livres.pop()
+            entidade.resetar(*args, **kwargs)
+            self.reutilizados += 1
+        else:
+            entidade = self.classe(*args, **kwargs)
+            self.criados += 1
+        return entidade
+    
+    def liberar(self, entidade):
+        """
+        Devolve uma entidade morta ao pool
+        
+        Args:
+            entidade: Entidade que não está mais em uso
+        """
+        if len(self.livres) < self.capacidade_maxima:
+            self.livres.append(entidade)
+    
+    def estatisticas(self):
+        """
+        Retorna os contadores do pool
+        
+        Returns:
+            dict: 'criados', 'reutilizados' e 'livres'
+        """
+        return {
+            'criados': self.criados,
+            'reutilizados': self.reutilizados,
+            'livres': len(self.livres)
+        }
+
+
+class ListaEntidades(list):
+    """
+    Lista de entidades vivas com remoção in-place
+    
+    compactar() remove as entidades mortas trocando cada uma pela última
+    da lista (swap-remove), sem criar uma nova lista e sem o custo O(n)
+    de list.remove. A ordem dos elementos não é preservada.
+    
+    Observadores (objetos com inserir, remover e limpar, como a
+    CamadaOrdenada da fila de renderização) são avisados de cada entidade
+    que entra ou sai da lista.
+    """
+    
+    def __init__(self, atributo_vivo='vivo', pool=None):
+        """
+        Inicializa a lista
+        
+        Args:
+            atributo_vivo: Nome do atributo bool que indica se a entidade vive
+            pool: Pool para onde as entidades removidas são devolvidas (opcional)
+        """
+        super().__init__()
+        self.atributo_vivo = atributo_vivo
+        self.esta_viva = attrgetter(atributo_vivo)
+        self.pool = pool
+        self.observadores = []
+    
+    def observar(self, observador):
+        """
+        Registra um observador e o avisa das entidades já presentes
+        
+        Args:
+            observador: Objeto com os métodos inserir, remover e limpar
+        """
+        self.observadores.append(observador)
+        for entidade in self:
+            observador.inserir(entidade)
+    
+    def append(self, entidade):
+        super().append(entidade)
+        for observador in self.observadores:
+            observador.inserir(entidade)
+    
+    def extend(self, entidades):
+        entidades = list(entidades)
+        super().extend(entidades)
+        for observador in self.observadores:
+            for entidade in entidades:
+                observador.inserir(entidade)
+    
+    def compactar(self):
+        """
+        Remove as entidades mortas (e as devolve ao pool)
+        
+        Returns:
+            list: Entidades removidas
+        """
+        # Caso mais comum: ninguém morreu no tick (varredura em C, sem o laço abaixo)
+        if all(map(self.esta_viva, self)):
+            return []
+        
+        atributo = self.atributo_vivo
+        removidas = []
+        i = 0
+        
+        while i < len(self):
+            entidade = self[i]
+            if getattr(entidade, atributo):
+                i += 1
+                continue
+            
+            removidas.append(entidade)
+            ultima = self.pop()
+            if i < len(self):
+                self[i] = ultima  # Não avança: a entidade trazida ainda será verificada
+        
+        for observador in self.observadores:
+            for entidade in removidas:
+                observador.remover(entidade)
+        
+        if self.pool is not None:
+            for entidade in removidas:
+                self.pool.liberar(entidade)
+        
+        return removidas
+    
+    def limpar(self):
+        """Remove todas as entidades (devolvendo-as ao pool)"""
+        for observador in self.observadores:
+            observador.limpar()
+        if self.pool is not None:
+            for entidade in self:
+                self.pool.liberar(entidade)
+        self.clear()
@@ -0,0 +1,175 @@
+"""
+Qualidade adaptativa: níveis de detalhe escolhidos pelo tempo de frame
+"""
+from collections import deque
+
+
+# Níveis do mais barato ao mais caro. 'alta' é o visual original do jogo
+NIVEIS_QUALIDADE = (
+    {
+        'nome': 'baixa',
+        'limite_particulas': 256,  # Partículas vivas ao mesmo tempo
+        'particulas_explosao': 5,  # Partículas por asteroide destruído
+        'camadas_estrelas': 2,  # Camadas de estrelas desenhadas (as mais próximas)
+        'espessura_linha': 1,  # Contorno de asteroides, nave e destroços
+        'antialias': False,
+        'intervalo_hud': 10,  # Frames entre atualizações dos textos do HUD
+    },
+    {
+        'nome': 'media',
+        'limite_particulas': 1024,
+        'particulas_explosao': 10,
+        'camadas_estrelas': 3,
+        'espessura_linha': 2,
+        'antialias': False,
+        'intervalo_hud': 4,
+    },
+    {
+        'nome': 'alta',
+        'limite_particulas': 4096,
+        'particulas_explosao': 15,
+        'camadas_estrelas': 4,
+        'espessura_linha': 2,
+        'antialias': False,
+        'intervalo_hud': 1,
+    },
+    {
+        'nome': 'ultra',
+        'limite_particulas': 4096,
+        'particulas_explosao': 15,
+        'camadas_estrelas': 4,
+        'espessura_linha': 1,
+        'antialias': True,  # Contornos com pygame.draw.aalines
+        'intervalo_hud': 1,
+    },
+)
+
+NIVEL_PADRAO = 2  # 'alta'
+
+
+def indice_nivel(nome):
+    """
+    Índice de um nível pelo nome
+    
+    Args:
+        nome: Nome do nível ('baixa', 'media', 'alta' ou 'ultra')
+    
+    Returns:
+        int: Índice em NIVEIS_QUALIDADE
+    
+    Raises:
+        ValueError: Se não existe nível com esse nome
+    """
+    for indice, nivel in enumerate(NIVEIS_QUALIDADE):
+        if nivel['nome'] == nome:
+            return indice
+    raise ValueError(f"Nível de qualidade desconhecido: {nome}")
+
+
+class GovernadorQualidade:
+    """
+    Sobe e desce o nível de qualidade pela média móvel do tempo de frame
+    
+    Desce um nível assim que a média passa de `fracao_descer` do orçamento
+    e só sobe depois de `frames_subir` frames seguidos abaixo de
+    `fracao_subir`. A faixa entre as duas frações (histerese) e a janela
+    descartada a cada troca evitam que o nível fique oscilando.
+    """
+    
+    def __init__(self, orcamento_ms, nivel=NIVEL_PADRAO, adaptativo=True, janela=30,
+                 fracao_descer=0.9, fracao_subir=0.5, frames_subir=120):
+        """
+        Inicializa o governador
+        
+        Args:
+            orcamento_ms: Tempo disponível por frame em ms (ex.: 1000 / 60)
+            nivel: Índice do nível inicial em NIVEIS_QUALIDADE
+            adaptativo: False = nível fixo (registrar() nunca troca de nível)
+            janela: Número de frames da média móvel
+            fracao_descer: Fração do orçamento acima da qual o nível desce
+            fracao_subir: Fração do orçamento abaixo da qual o nível pode subir
+            frames_subir: Frames seguidos com folga antes de subir um nível
+        """
+        self.nivel = nivel
+        self.adaptativo = adaptativo
+        self.limite_descer = orcamento_ms * fracao_descer
+        self.limite_subir = orcamento_ms * fracao_subir
+        self.frames_subir = frames_subir
+        
+        self.tempos = deque(maxlen=janela)
+        self.soma = 0.0
+        self.frames_folga = 0
+        self.trocas = 0  # Número de trocas de nível (para avaliar a histerese)
+    
+    def config(self):
+        """Configuração do nível atual (dict de NIVEIS_QUALIDADE)"""
+        return NIVEIS_QUALIDADE[self.nivel]
+    
+    def media(self):
+        """Média móvel do tempo de frame em ms (0 sem frames registrados)"""
+        return self.soma / len(self.tempos) if self.tempos else 0.0
+    
+    def _trocar(self, nivel):
+        """Muda de nível e recomeça a média (os frames antigos eram de outro nível)"""
+        self.nivel = nivel
+        self.tempos.clear()
+        self.soma = 0.0
+        self.frames_folga = 0
+        self.trocas += 1
+    
+    def registrar(self, ms):
+        """
+        Registra o tempo de um frame
+        
+        Args:
+            ms: Tempo de trabalho do frame em milissegundos
+        
+        Returns:
+            bool: True se o nível mudou (aplicar a nova config())
+        """
+        if not self.adaptativo:
+            return False
+        
+        tempos = self.tempos
+        if len(tempos) == tempos.maxlen:
+            self.soma -= tempos[0]
+        tempos.append(ms)
+        self.soma += ms
+        if len(tempos) < tempos.maxlen:
+            return False
+        
+        media = self.soma / len(tempos)
+        if media > self.limite_descer:
+            if self.nivel > 0:
+                self._trocar(self.nivel - 1)
+                return True
+            return False
+        
+        if media < self.limite_subir and self.nivel < len(NIVEIS_QUALIDADE) - 1:
+            self.frames_folga += 1
+            if self.frames_folga >= self.frames_subir:
+                self._trocar(self.nivel + 1)
+                return True
+        else:
+            self.frames_folga = 0
+        return False
+
+
+def aplicar_qualidade(config, sim, campo_estrelas, hud):
+    """
+    Ajusta simulação, fundo e HUD a um nível de qualidade
+    
+    Espessura das linhas e antialias são lidos a cada frame pela fila de
+    renderização (criar_fila_render(..., obter_qualidade)).
+    
+    Args:
+        config: dict de NIVEIS_QUALIDADE
+        sim: GameSimulation (só efeitos visuais mudam; o jogo continua determinístico)
+        campo_estrelas: CampoEstrelas do fundo
+        hud: HUD do jogo
+    """
+    sim.particulas.limite = min(config['limite_particulas'], sim.particulas.capacidade)
+    sim.particulas_por_explosao = config['particulas_explosao']
+    campo_estrelas.camadas_visiveis = config['camadas_estrelas']
+    hud.intervalo_atualizacao = config['intervalo_hud']
+    hud.qualidade = config['nome']
@@ -0,0 +1,205 @@
+"""
+Gravação e reprodução das entradas do jogador, tick a tick
+"""
+import hashlib
+import struct
+import sys
+import zlib
+from array import array
+
+
+# Ordem dos bits de cada tick no arquivo
+TECLAS = ('esquerda', 'direita', 'cima', 'espaco')
+BIT_REINICIAR = 1 << len(TECLAS)
+
+MAGICO = b'AST3REP'
+VERSAO = 10  # 2: formas do banco (utils/formas.py); 3: colisão contínua dos projéteis; 4: passo fixo; 5: mundo toroidal; 6: horda; 7: registro de entidades; 8: imunidade após o respawn; 9: spawn na emenda longe da nave; 10: sem a imunidade após o respawn
+
+# Cabeçalho: mágico, versão, semente, largura, altura, limite da horda, número de ticks, verificação do estado final
+FORMATO_CABECALHO = '<7sBQHHHI32s'
+MAX_LADO_CAMPO = 0xFFFF  # Largura e altura do campo (uint16 no cabeçalho)
+MAX_SEMENTE = 2 ** 64 - 1  # Semente (uint64 no cabeçalho)
+
+
+def resumo_estado(sim):
+    """
+    Resumo (hash) do estado da simulação, para conferir se o replay divergiu
+    
+    Args:
+        sim: GameSimulation
+    
+    Returns:
+        bytes: SHA-256 de pontuação, nave e asteroides
+    """
+    resumo = hashlib.sha256()
+    resumo.update(repr((sim.pontos, sim.vidas, sim.nivel, sim.estado_jogo)).encode('utf-8'))
+    resumo.update(repr((sim.nave.pos.x, sim.nave.pos.y, sim.nave.angulo)).encode('utf-8'))
+    for asteroide in sim.asteroides:
+        resumo.update(repr((asteroide.pos.x, asteroide.pos.y, asteroide.tamanho_tipo)).encode('utf-8'))
+    return resumo.digest()
+
+
+class GravadorEntradas:
+    def __init__(self, semente, largura, altura, horda=0):
+        """
+        Inicializa a gravação de uma sessão
+        
+        Cada tick ocupa 3 bytes (dt em ms e um byte com as teclas e o
+        reinício), e o arquivo é comprimido com zlib.
+        
+        Args:
+            semente: Semente da simulação gravada
+            largura: Largura do campo de jogo
+            altura: Altura do campo de jogo
+            horda: Limite de asteroides do modo horda (0 = partida normal)
+        
+        Raises:
+            ValueError: Se a semente ou o campo não cabem no cabeçalho
+                (semente fora de 0..MAX_SEMENTE, lado > MAX_LADO_CAMPO)
+        """
+        if not 0 <= semente <= MAX_SEMENTE:
+            raise ValueError(f"Semente {semente} não cabe no replay (0 a {MAX_SEMENTE})")
+        if not (0 < largura <= MAX_LADO_CAMPO and 0 < altura <= MAX_LADO_CAMPO):
+            raise ValueError(f"Campo {largura} x {altura} não cabe no replay (máximo {MAX_LADO_CAMPO} por lado)")
+        self.semente = semente
+        self.largura = largura
+        self.altura = altura
+        self.horda = horda
+        self.dts_ms = array('H')
+        self.bits = bytearray()
+    
+    def __len__(self):
+        return len(self.bits)
+    
+    def registrar(self, teclas_pressionadas, dt_ms, reiniciar=False):
+        """
+        Grava as entradas de um tick
+        
+        Args:
+            teclas_pressionadas: dict de controles aplicados no tick
+            dt_ms: Delta time do tick em milissegundos (de clock.tick)
+            reiniciar: True se o jogo foi reiniciado antes deste tick
+        """
+        bits = BIT_REINICIAR if reiniciar else 0
+        for indice, tecla in enumerate(TECLAS):
+            if teclas_pressionadas.get(tecla):
+                bits |= 1 << indice
+        
+        self.dts_ms.append(min(dt_ms, 0xFFFF))
+        self.bits.append(bits)
+    
+    def salvar(self, caminho, estado_final=b''):
+        """
+        Grava a sessão em disco
+        
+        Args:
+            caminho: Arquivo de saída
+            estado_final: resumo_estado() ao fim da sessão (para conferência)
+        """
+        dts_ms = array('H', self.dts_ms)
+        if sys.byteorder == 'big':
+            dts_ms.byteswap()
+        
+        cabecalho = struct.pack(FORMATO_CABECALHO, MAGICO, VERSAO, self.semente, self.largura,
+                                self.altura, self.horda, len(self.bits), estado_final)
+        with open(caminho, 'wb') as arquivo:
+            arquivo.write(cabecalho)
+            arquivo.write(zlib.compress(dts_ms.tobytes() + bytes(self.bits), 9))
+
+
+class ReprodutorEntradas:
+    def __init__(self, semente, largura, altura, dts_ms, bits, estado_final=b'', horda=0):
+        """
+        Inicializa a reprodução de uma sessão gravada
+        
+        Args:
+            semente: Semente da simulação gravada
+            largura: Largura do campo de jogo
+            altura: Altura do campo de jogo
+            dts_ms: array com o dt de cada tick (ms)
+            bits: bytes com as teclas de cada tick
+            estado_final: resumo_estado() gravado ao fim da sessão
+            horda: Limite de asteroides do modo horda (0 = partida normal)
+        """
+        self.semente = semente
+        self.largura = largura
+        self.altura = altura
+        self.horda = horda
+        self.dts_ms = dts_ms
+        self.bits = bits
+        self.estado_final = estado_final
+        self.tick = 0
+    
+    def __len__(self):
+        return len(self.bits)
+    
+    def terminou(self):
+        """Retorna True quando todos os ticks já foram reproduzidos"""
+        return self.tick >= len(self.bits)
+    
+    def proximo(self, teclas_pressionadas):
+        """
+        Aplica as entradas do próximo tick
+        
+        Args:
+            teclas_pressionadas: dict de controles, atualizado in-place
+        
+        Returns:
+            tuple: (dt_ms, reiniciar)
+        """
+        bits = self.bits[self.tick]
+        dt_ms = self.dts_ms[self.tick]
+        self.tick += 1
+        
+        for indice, tecla in enumerate(TECLAS):
+            teclas_pressionadas[tecla] = bool(bits & (1 << indice))
+        return dt_ms, bool(bits & BIT_REINICIAR)
+    
+    def proximo_dt_ms(self):
+        """dt (ms) gravado para o próximo tick (0 se a gravação terminou)"""
+        return 0 if self.terminou() else self.dts_ms[self.tick]
+    
+    def conferir(self, sim):
+        """
+        Confere se a simulação chegou ao mesmo estado da sessão gravada
+        
+        Args:
+            sim: GameSimulation ao fim do replay
+        
+        Returns:
+            bool: True se o estado bate (ou se a gravação não tem resumo)
+        """
+        if not self.estado_final.strip(b'\0'):
+            return True
+        return resumo_estado(sim) == self.estado_final
+
+
+def carregar_replay(caminho):
+    """
+    Lê uma sessão gravada por GravadorEntradas
+    
+    Args:
+        caminho: Arquivo gravado
+    
+    Returns:
+        ReprodutorEntradas: Pronto para reproduzir
+    """
+    with open(caminho, 'rb') as arquivo:
+        dados = arquivo.read()
+    
+    tamanho_cabecalho = struct.calcsize(FORMATO_CABECALHO)
+    magico, versao, semente, largura, altura, horda, num_ticks, estado_final = struct.unpack(
+        FORMATO_CABECALHO, dados[:tamanho_cabecalho])
+    if magico != MAGICO:
+        raise ValueError(f"{caminho} não é um replay do Asteroids 3D")
+    if versao != VERSAO:
+        raise ValueError(f"Versão de replay não suportada: {versao}")
+    
+    corpo = zlib.decompress(dados[tamanho_cabecalho:])
+    dts_ms = array('H')
+    dts_ms.frombytes(corpo[:2 * num_ticks])
+    if sys.byteorder == 'big':
+        dts_ms.byteswap()
+    bits = corpo[2 * num_ticks:]
+    
+    return ReprodutorEntradas(semente, largura, altura, dts_ms, bits, estado_final, horda)
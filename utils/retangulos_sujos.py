@@ -0,0 +1,107 @@
+"""
+Renderização por retângulos sujos (atualiza só as áreas que mudaram)
+"""
+import pygame
+from utils.perfil import PerfiladorNulo
+
+
+class RenderizadorSujo:
+    """
+    Desenha a fila de renderização sobre um fundo em cache e envia ao
+    display apenas as áreas que mudaram
+    
+    A cada frame: as áreas desenhadas no frame anterior são restauradas a
+    partir do fundo, as camadas são desenhadas, e só a união das áreas
+    antigas e novas vai para pygame.display.update(). Quando o fundo muda
+    (rolagem das estrelas) ou a área suja passa de `fracao_maxima` da
+    tela, o frame inteiro é redesenhado com display.flip().
+    """
+    
+    def __init__(self, tela, fila_render, desenhar_fundo, assinatura_fundo, fracao_maxima=0.35):
+        """
+        Inicializa o renderizador
+        
+        Args:
+            tela: Surface do display
+            fila_render: FilaRender com as camadas acima do fundo (a camada
+                do fundo deve estar desativada na fila)
+            desenhar_fundo: Função (surface) que desenha o fundo completo
+            assinatura_fundo: Função () que muda de valor quando o fundo muda
+            fracao_maxima: Fração da tela acima da qual um flip completo é mais barato
+        """
+        self.tela = tela
+        self.fila_render = fila_render
+        self.desenhar_fundo = desenhar_fundo
+        self.assinatura_fundo = assinatura_fundo
+        self.area_maxima = fracao_maxima * tela.get_width() * tela.get_height()
+        self.limites = tela.get_rect()
+        
+        self.fundo = pygame.Surface(tela.get_size())
+        if pygame.display.get_surface() is not None:
+            self.fundo = self.fundo.convert()
+        self.assinatura = None
+        
+        self.anteriores = None  # Áreas do frame anterior (None = tela inteira)
+        self.perfilador = PerfiladorNulo()
+        
+        # Contadores para avaliar o modo (frames parciais x completos)
+        self.frames_parciais = 0
+        self.frames_completos = 0
+    
+    def _recortar(self, areas):
+        """Converte as áreas em Rects dentro da tela, descartando as vazias"""
+        limites = self.limites
+        recortadas = []
+        for area in areas:
+            if area is None:
+                continue
+            retangulo = limites.clip(area)
+            if retangulo.width and retangulo.height:
+                recortadas.append(retangulo)
+        return recortadas
+    
+    def desenhar(self):
+        """Desenha um frame e atualiza o display"""
+        tela = self.tela
+        fundo = self.fundo
+        perfilador = self.perfilador
+        
+        assinatura = self.assinatura_fundo()
+        completo = self.anteriores is None or assinatura != self.assinatura
+        
+        if assinatura != self.assinatura:
+            self.desenhar_fundo(fundo)
+            self.assinatura = assinatura
+        
+        if completo:
+            tela.blit(fundo, (0, 0))
+        else:
+            tela.blits([(fundo, area, area) for area in self.anteriores], False)
+        perfilador.marcar('desenho_fundo')
+        
+        self.fila_render.desenhar(tela)
+        
+        atuais = self.fila_render.areas()
+        if atuais is None:
+            completo = True  # Alguma camada não informa as suas áreas: só o flip completo é seguro
+        else:
+            atuais = self._recortar(atuais)
+        
+        if not completo:
+            sujas = self.anteriores + atuais
+            if sum(area.width * area.height for area in sujas) > self.area_maxima:
+                completo = True
+        
+        if completo:
+            pygame.display.flip()
+            self.frames_completos += 1
+        else:
+            pygame.display.update(sujas)
+            self.frames_parciais += 1
+        perfilador.marcar('flip')
+        
+        self.anteriores = atuais
+    
+    def invalidar(self):
+        """Força um frame completo (ex.: depois de desenhar algo fora da fila)"""
+        self.anteriores = None
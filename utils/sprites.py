@@ -0,0 +1,132 @@
+"""
+Utilitários para sprites pré-renderizados (cache de partículas com alpha)
+"""
+import pygame
+import numpy as np
+from collections import OrderedDict
+from utils.cores import NIVEIS_FADE
+
+
+class CacheSprites:
+    """
+    Cache LRU de círculos com alpha, pré-renderizados
+    
+    Cada sprite é identificado por (tamanho, cor quantizada, alpha
+    quantizado) e é criado uma única vez, em vez de alocar uma Surface
+    SRCALPHA por partícula por frame.
+    """
+    
+    def __init__(self, niveis_cor=8, niveis_alpha=NIVEIS_FADE, capacidade=4096):
+        """
+        Inicializa o cache
+        
+        Args:
+            niveis_cor: Níveis por canal de cor (8 = passos de 32)
+            niveis_alpha: Níveis de alpha
+            capacidade: Número máximo de sprites guardados (LRU)
+        """
+        self.niveis_cor = niveis_cor
+        self.passo_cor = 256 // niveis_cor
+        self.niveis_alpha = niveis_alpha
+        self.capacidade = capacidade
+        self.sprites = OrderedDict()
+    
+    def chave(self, tamanho, cor, alpha):
+        """
+        Calcula a chave inteira de um sprite
+        
+        Args:
+            tamanho: Raio do círculo em pixels
+            cor: tuple (R, G, B) de 0 a 255
+            alpha: int de 0 a 255
+        
+        Returns:
+            int: Chave do sprite
+        """
+        passo = self.passo_cor
+        niveis = self.niveis_cor
+        nivel_alpha = alpha * self.niveis_alpha // 256
+        chave = tamanho
+        chave = chave * niveis + cor[0] // passo
+        chave = chave * niveis + cor[1] // passo
+        chave = chave * niveis + cor[2] // passo
+        return chave * self.niveis_alpha + nivel_alpha
+    
+    def chaves_lote(self, tamanhos, cores, alphas):
+        """
+        Versão vetorizada de chave() para arrays NumPy
+        
+        Args:
+            tamanhos: array (N,) de raios
+            cores: array (N, 3) de cores
+            alphas: array (N,) de alphas de 0 a 255
+        
+        Returns:
+            list: Chaves (int) dos N sprites
+        """
+        passo = self.passo_cor
+        niveis = self.niveis_cor
+        cores = cores.astype(np.int64) // passo
+        chaves = tamanhos.astype(np.int64)
+        chaves = chaves * niveis + cores[:, 0]
+        chaves = chaves * niveis + cores[:, 1]
+        chaves = chaves * niveis + cores[:, 2]
+        chaves = chaves * self.niveis_alpha + alphas.astype(np.int64) * self.niveis_alpha // 256
+        return chaves.tolist()
+    
+    def _criar(self, chave):
+        """Renderiza o sprite correspondente a uma chave"""
+        niveis = self.niveis_cor
+        passo = self.passo_cor
+        
+        chave, nivel_alpha = divmod(chave, self.niveis_alpha)
+        chave, b = divmod(chave, niveis)
+        chave, g = divmod(chave, niveis)
+        tamanho, r = divmod(chave, niveis)
+        
+        # Centro de cada faixa de quantização
+        cor = tuple(min(255, c * passo + passo // 2) for c in (r, g, b))
+        alpha = min(255, (nivel_alpha * 256 + 128) // self.niveis_alpha)
+        
+        sprite = pygame.Surface((tamanho * 2, tamanho * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, cor + (alpha,), (tamanho, tamanho), tamanho)
+        
+        # convert_alpha exige um display inicializado
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+    
+    def obter(self, chave):
+        """
+        Retorna o sprite de uma chave, criando-o se necessário
+        
+        Args:
+            chave: int retornado por chave()
+        
+        Returns:
+            pygame.Surface: Sprite com alpha
+        """
+        sprites = self.sprites
+        sprite = sprites.get(chave)
+        
+        if sprite is None:
+            sprite = self._criar(chave)
+            sprites[chave] = sprite
+            if len(sprites) > self.capacidade:
+                sprites.popitem(last=False)  # Remove o menos usado recentemente
+        else:
+            sprites.move_to_end(chave)
+        
+        return sprite
+    
+    def desenhar_lote(self, tela, chaves, posicoes):
+        """
+        Desenha vários sprites com uma única chamada a Surface.blits()
+        
+        Args:
+            tela: Surface do Pygame
+            chaves: Sequência de chaves (int)
+            posicoes: Sequência de posições (x, y) do canto superior esquerdo
+        """
+        obter = self.obter
+        tela.blits([(obter(chave), pos) for chave, pos in zip(chaves, posicoes)], False)
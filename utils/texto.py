@@ -0,0 +1,54 @@
+"""
+Utilitários para renderização de texto com cache
+"""
+from collections import OrderedDict
+
+
+class CacheTexto:
+    """
+    Cache LRU de textos renderizados
+    
+    Um texto só é rasterizado de novo quando (fonte, texto, cor) muda;
+    valores que não mudam entre frames (pontos, vidas, instruções)
+    reutilizam a mesma Surface.
+    """
+    
+    def __init__(self, capacidade=128):
+        """
+        Inicializa o cache
+        
+        Args:
+            capacidade: Número máximo de textos guardados
+        """
+        self.capacidade = capacidade
+        self.textos = OrderedDict()
+    
+    def render(self, fonte, texto, cor):
+        """
+        Retorna o texto renderizado (antialiasing ligado)
+        
+        Args:
+            fonte: pygame.font.Font
+            texto: str a renderizar
+            cor: tuple (R, G, B)
+        
+        Returns:
+            pygame.Surface: Texto renderizado
+        """
+        chave = (fonte, texto, cor)
+        textos = self.textos
+        surface = textos.get(chave)
+        
+        if surface is None:
+            surface = fonte.render(texto, True, cor)
+            textos[chave] = surface
+            if len(textos) > self.capacidade:
+                textos.popitem(last=False)  # Remove o menos usado recentemente
+        else:
+            textos.move_to_end(chave)
+        
+        return surface
+    
+    def limpar(self):
+        """Descarta todos os textos guardados"""
+        self.textos.clear()